@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-import difflib
 import inspect
 from itertools import chain
 import logging
 import operator
-import re
+import os
 import six
 import sys
 
@@ -18,35 +17,50 @@ except ImportError:
 from functools import wraps, partial
 from types import MethodType
 
-from flask import url_for, request, current_app
+from flask import url_for, request, current_app, send_file
 from flask import make_response as original_flask_make_response
 from flask.helpers import _endpoint_from_view_func
 from flask.signals import got_request_exception
 
-from jsonschema import RefResolver
-
-from werkzeug import cached_property
-from werkzeug.datastructures import Headers
+from werkzeug.datastructures import CallbackDict, Headers
 from werkzeug.exceptions import HTTPException, MethodNotAllowed, NotFound, NotAcceptable, InternalServerError
+from werkzeug.http import is_resource_modified
 from werkzeug.wrappers import BaseResponse
 
-from . import apidoc
+from . import apidoc, export, inputs, logqueue
+from .coalescing import SingleFlight
+from .lazyview import LazyView
+from .diskcache import cached_specs
+from .logqueue import LogQueue
+from .metrics import Metrics, phase, start as start_metrics, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from .tracing import server_timing as server_timing_header
 from .mask import ParseError, MaskError
 from .namespace import Namespace
 from .postman import PostmanCollectionV1
 from .resource import Resource
-from .swagger import Swagger
-from .utils import default_id, camel_to_dash, unpack
-from .representations import output_json
+from .throttling import LogThrottle
+from .suggestions import RuleIndex, DEFAULT_CANDIDATES, DEFAULT_CACHE_SIZE
+# Kept for backward compatibility
+from .suggestions import RE_RULES  # noqa
+from .swagger import Swagger, select_tags, minify
+from .utils import default_id, camel_to_dash, unpack, LRUCache
+from .warmup import warmup
+from .representations import output_json, best_match
 from ._http import HTTPStatus
 
-RE_RULES = re.compile('(<.*>)')
+#: The maximum number of cached allowed routes lookups on 405 errors
+ROUTES_CACHE_SIZE = 1024
+
+#: The maximum number of cached partial and minimal specifications
+SPECS_CACHE_SIZE = 64
 
 # List headers that should never be handled by Flask-RESTPlus
 HEADERS_BLACKLIST = ('Content-Length',)
 
 DEFAULT_REPRESENTATIONS = [('application/json', output_json)]
 
+_get_response = six.get_unbound_function(HTTPException.get_response)
+
 log = logging.getLogger(__name__)
 
 
@@ -91,6 +105,18 @@ class Api(object):
     :param FormatChecker format_checker: A jsonschema.FormatChecker object that is hooked into
         the Model validator. A default or a custom FormatChecker can be provided (e.g., with custom
         checkers), otherwise the default action is to not enforce any format validation.
+    :param MetricsSink|bool metrics: A :class:`~flask_restplus.metrics.MetricsSink` per-phase
+        request metrics are reported to, or ``True`` to use an in-memory
+        :class:`~flask_restplus.metrics.Metrics` sink. Metrics are disabled by default.
+    :param str metrics_url: The path of the Prometheus metrics exposition endpoint.
+        The endpoint is only registered if set and ``metrics`` supports rendering.
+    :param Tracer tracer: A :class:`~flask_restplus.tracing.Tracer` request phases are reported to as spans
+    :param bool server_timing: Whether or not to emit the request phases durations
+        in a ``Server-Timing`` response header (default 'False')
+    :param Profiler profiler: A :class:`~flask_restplus.profiling.Profiler` deciding which requests
+        are run under :mod:`cProfile`. Profiling is disabled by default.
+    :param bool lazy_views: Whether or not to build the resources views (dispatch plans, ``as_view``...)
+        on their first request instead of on registration (default 'False')
     '''
 
     def __init__(self, app=None, version='1.0', title=None, description=None,
@@ -101,7 +127,8 @@ class Api(object):
             tags=None, prefix='', ordered=False,
             default_mediatype='application/json', decorators=None,
             catch_all_404s=False, serve_challenge_on_401=False, format_checker=None,
-            **kwargs):
+            metrics=None, metrics_url=None, tracer=None, server_timing=False, profiler=None,
+            lazy_views=False, **kwargs):
         self.version = version
         self.title = title or 'API'
         self.description = description
@@ -117,15 +144,30 @@ class Api(object):
         self.ordered = ordered
         self._validate = validate
         self._doc = doc
+        self.metrics = Metrics() if metrics is True else (metrics or None)
+        self.metrics_url = metrics_url
+        self.tracer = tracer
+        self.server_timing = server_timing
+        self.profiler = profiler
+        self.lazy_views = lazy_views
+        self._lazy_views = []
         self._doc_view = None
         self._default_error_handler = None
         self.tags = tags or []
 
+        self._error_handlers_table = None
+        self._error_handlers_by_type = {}
         self.error_handlers = {
             ParseError: mask_parse_error_handler,
             MaskError: mask_error_handler,
         }
+        self._rule_index = None
+        self._log_throttle = None
         self._schema = None
+        self._schema_key = None
+        self._spec_version = 0
+        self._spec_fragments = {}
+        self._partial_schemas = LRUCache(SPECS_CACHE_SIZE)
         self.models = {}
         self._refresolver = None
         self.format_checker = format_checker
@@ -142,7 +184,13 @@ class Api(object):
         self.serve_challenge_on_401 = serve_challenge_on_401
         self.blueprint_setup = None
         self.endpoints = set()
+        self._endpoint_suffixes = {}
+        self._owned_endpoints = {}
+        self._owned_endpoints_key = None
+        self._allowed_routes = LRUCache(ROUTES_CACHE_SIZE)
+        self._allowed_routes_key = None
         self.resources = []
+        self.coalescing = SingleFlight()
         self.app = None
         self.blueprint = None
         # must come after self.app initialisation to prevent __getattr__ recursion
@@ -203,6 +251,7 @@ class Api(object):
         '''
         self._register_specs(self.blueprint or app)
         self._register_doc(self.blueprint or app)
+        self._register_metrics(self.blueprint or app)
 
         app.handle_exception = partial(self.error_router, app.handle_exception)
         app.handle_user_exception = partial(self.error_router, app.handle_user_exception)
@@ -215,6 +264,7 @@ class Api(object):
             self._configure_namespace_logger(app, ns)
 
         self._register_apidoc(app)
+        self._register_cli(app)
         self._validate = self._validate if self._validate is not None else app.config.get('RESTPLUS_VALIDATE', False)
         app.config.setdefault('RESTPLUS_MASK_HEADER', 'X-Fields')
         app.config.setdefault('RESTPLUS_MASK_SWAGGER', True)
@@ -262,6 +312,10 @@ class Api(object):
             app_or_blueprint.add_url_rule(self._doc, 'doc', self.render_doc)
         app_or_blueprint.add_url_rule(self.prefix or '/', 'root', self.render_root)
 
+    def _register_metrics(self, app_or_blueprint):
+        if self.metrics_url and hasattr(self.metrics, 'render'):
+            app_or_blueprint.add_url_rule(self.metrics_url, 'metrics', self.render_metrics)
+
     def register_resource(self, namespace, resource, *urls, **kwargs):
         endpoint = kwargs.pop('endpoint', None)
         endpoint = str(endpoint or self.default_endpoint(resource, namespace))
@@ -275,15 +329,83 @@ class Api(object):
             self.resources.append((resource, namespace, urls, kwargs))
         return endpoint
 
+    def register_resources(self, namespace, routes):
+        '''
+        Register many resources of a namespace at once.
+
+        All the endpoints are validated in a single pass before registering any resource.
+
+        :param Namespace namespace: the namespace holding the resources
+        :param list routes: ``(resource, urls, kwargs)`` tuples
+        :returns list: the endpoints
+        :raises ValueError: if some endpoints are already set to other resources
+        '''
+        view_functions = getattr(self.app, 'view_functions', {}) if self.app is not None else {}
+        entries = []
+        owners = {}
+        conflicts = []
+        added = set()
+        for resource, urls, kwargs in routes:
+            kwargs = dict(kwargs)
+            endpoint = str(kwargs.pop('endpoint', None) or self.default_endpoint(resource, namespace))
+            kwargs['endpoint'] = endpoint
+            if endpoint not in self.endpoints:
+                added.add(endpoint)
+                self.endpoints.add(endpoint)
+            owner = owners.setdefault(endpoint, resource)
+            if endpoint in view_functions:
+                owner = view_functions[endpoint].__dict__['view_class']
+            if owner != resource:
+                conflicts.append('{0} ({1} and {2})'.format(endpoint, owner.__name__, resource.__name__))
+            entries.append((resource, urls, kwargs))
+
+        if conflicts:
+            self.endpoints -= added
+            raise ValueError('These endpoints are already set to other classes: {0}'.format(
+                ', '.join(conflicts)))
+
+        for resource, urls, kwargs in entries:
+            if self.app is not None:
+                self._register_view(self.app, resource, namespace, *urls, **kwargs)
+            else:
+                self.resources.append((resource, namespace, urls, kwargs))
+        return [kwargs['endpoint'] for _, _, kwargs in entries]
+
     def _configure_namespace_logger(self, app, namespace):
-        for handler in app.logger.handlers:
+        if app.config.get('RESTPLUS_LOG_QUEUE', False):
+            handlers = [self._get_log_queue(app).handler]
+        else:
+            handlers = app.logger.handlers
+        for handler in handlers:
             namespace.logger.addHandler(handler)
         namespace.logger.setLevel(app.logger.level)
 
+    def _register_cli(self, app):
+        conf = app.extensions.setdefault('restplus', {})
+        apis = conf.setdefault('apis', [])
+        if self not in apis:
+            apis.append(self)
+        if hasattr(app, 'cli') and 'restplus' not in app.cli.commands:
+            # Imported lazily as click is only available with Flask >= 0.11
+            from .cli import restplus
+            app.cli.add_command(restplus)
+
+    def _get_log_queue(self, app):
+        '''Get the log queue shared by all namespaces loggers of an application'''
+        conf = app.extensions.setdefault('restplus', {})
+        if 'log_queue' not in conf:
+            conf['log_queue'] = LogQueue(
+                app.logger.handlers,
+                size=app.config.get('RESTPLUS_LOG_QUEUE_SIZE', logqueue.DEFAULT_SIZE),
+                policy=app.config.get('RESTPLUS_LOG_QUEUE_POLICY', logqueue.DROP_NEW),
+            )
+        return conf['log_queue']
+
     def _register_view(self, app, resource, namespace, *urls, **kwargs):
         endpoint = kwargs.pop('endpoint', None) or camel_to_dash(resource.__name__)
         resource_class_args = kwargs.pop('resource_class_args', ())
         resource_class_kwargs = kwargs.pop('resource_class_kwargs', {})
+        shared_instance = kwargs.pop('shared_instance', None)
 
         # NOTE: 'view_functions' is cleaned up from Blueprint class in Flask 1.0
         if endpoint in getattr(app, 'view_functions', {}):
@@ -298,10 +420,16 @@ class Api(object):
         resource.mediatypes = self.mediatypes_method()  # Hacky
         resource.endpoint = endpoint
 
-        resource_func = self.output(resource.as_view(endpoint, self, *resource_class_args,
-            **resource_class_kwargs))
+        build = partial(self._build_view, resource, namespace, endpoint,
+                        resource_class_args, resource_class_kwargs, shared_instance)
+        if self.lazy_views:
+            resource_func = LazyView(build, resource, endpoint)
+            self._lazy_views.append(resource_func)
+        else:
+            resource_func = build()
 
         # Apply Namespace and Api decorators to a resource
+        # (eagerly, as they may set the attributes Flask reads on registration)
         for decorator in chain(namespace.decorators, self.decorators):
             resource_func = decorator(resource_func)
 
@@ -327,6 +455,31 @@ class Api(object):
             # Add the url to the application or blueprint
             app.add_url_rule(rule, view_func=resource_func, **kwargs)
 
+    def _build_view(self, resource, namespace, endpoint, resource_class_args, resource_class_kwargs,
+                    shared_instance):
+        if not (inspect.isclass(resource) and issubclass(resource, Resource)):
+            # Foreign view classes don't support Resource options
+            resource_func = self.output(resource.as_view(endpoint, self, *resource_class_args,
+                **resource_class_kwargs))
+        else:
+            # Resolve dispatch plans once at registration time
+            for method in resource.methods or []:
+                resource.dispatch_plan(method.lower())
+
+            if shared_instance is None:
+                shared_instance = resource.shared_instance
+            as_view = resource.as_shared_view if shared_instance else resource.as_view
+            resource_func = self.output(as_view(endpoint, self, *resource_class_args, **resource_class_kwargs))
+
+            if resource.coalesce:
+                resource_func = self.coalesce(resource_func, resource.coalesce)
+
+            etag = resource.etag if resource.etag is not None else namespace.etag
+            if etag or resource.last_modified:
+                resource_func = self.conditional(resource_func, etag, resource.last_modified)
+
+        return resource_func
+
     def output(self, resource):
         '''
         Wraps a resource (as a flask view function),
@@ -336,6 +489,10 @@ class Api(object):
         '''
         @wraps(resource)
         def wrapper(*args, **kwargs):
+            if self.profiler is not None and self.profiler.should_profile():
+                return self._output_profiled(resource, *args, **kwargs)
+            if self.instrumented:
+                return self._output_instrumented(resource, *args, **kwargs)
             resp = resource(*args, **kwargs)
             if isinstance(resp, BaseResponse):
                 return resp
@@ -343,6 +500,135 @@ class Api(object):
             return self.make_response(data, code, headers=headers)
         return wrapper
 
+    @property
+    def instrumented(self):
+        '''Whether request phases are instrumented (metrics, tracing or ``Server-Timing``)'''
+        return self.metrics is not None or self.tracer is not None or self.server_timing
+
+    def _start_instrumentation(self):
+        return start_metrics(request.endpoint, request.method, self.metrics, self.tracer, self.server_timing)
+
+    def _output_profiled(self, resource, *args, **kwargs):
+        resp, report = self.profiler.run(self._output_instrumented, resource, *args, **kwargs)
+        if report is None:
+            return resp
+        resp.headers['X-Profile-Id'] = report.id
+        resp.headers['X-Profile-Summary'] = self.profiler.summary(report)
+        return resp
+
+    def _output_instrumented(self, resource, *args, **kwargs):
+        recorder = self._start_instrumentation()
+        resp = resource(*args, **kwargs)
+        if not isinstance(resp, BaseResponse):
+            data, code, headers = unpack(resp)
+            resp = self.make_response(data, code, headers=headers)
+        self._finish_instrumentation(recorder, resp)
+        return resp
+
+    @staticmethod
+    def _finish_instrumentation(recorder, response):
+        if recorder is None:
+            return
+        size = response.calculate_content_length()
+        if size is not None:
+            recorder.observe_size(size)
+        if recorder.timings:
+            response.headers['Server-Timing'] = server_timing_header(recorder.timings)
+
+    def coalesce(self, view, key=None):
+        '''
+        Wraps a flask view function so identical concurrent ``GET`` requests
+        share a single execution (handler, marshalling and serialization included).
+
+        Requests are considered identical when they share the same endpoint,
+        view arguments, query string, fields mask header and negotiated mediatype.
+        Streamed responses and responses setting cookies are not shared:
+        the waiting requests run the view themselves.
+
+        :param view: The flask view function to wrap
+        :param callable key: An optional callable returning extra hashable
+            request discriminants (ie. credentials)
+        '''
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(*args, **kwargs)
+            mediatype = best_match(self.representations, default=self.default_mediatype)
+            coalescing_key = (
+                request.method,
+                request.endpoint,
+                tuple(sorted(six.iteritems(request.view_args or {}))),
+                request.query_string,
+                request.headers.get(current_app.config['RESTPLUS_MASK_HEADER']),
+                mediatype,
+                key() if callable(key) else None,
+            )
+            (resp, frozen), coalesced = self.coalescing.do(coalescing_key, self._frozen_response,
+                                                           view, *args, **kwargs)
+            if not coalesced:
+                return resp
+            if frozen is None:
+                return view(*args, **kwargs)
+            data, status, headers = frozen
+            return current_app.response_class(data, status=status, headers=headers)
+        return wrapper
+
+    def conditional(self, view, etag=True, last_modified=None):
+        '''
+        Wraps a flask view function to support conditional ``GET`` requests.
+
+        Successful responses are given an ``ETag`` (and optionally a ``Last-Modified``) header
+        and ``If-None-Match``/``If-Modified-Since`` requests are answered with
+        a ``304 Not Modified`` response when the resource did not change.
+
+        :param view: The flask view function to wrap
+        :param bool|callable etag: Either ``True`` to hash the serialized response body
+            or a callable taking the view arguments and returning the resource version
+            (any value, converted to a string, ie. a revision number).
+            A callable is evaluated before the handler, allowing to skip it entirely.
+        :param callable last_modified: An optional callable taking the view arguments
+            and returning the resource last modification :class:`~datetime.datetime`
+        '''
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(*args, **kwargs)
+            version = etag(*args, **kwargs) if callable(etag) else None
+            if version is not None:
+                version = six.text_type(version)
+            modified = last_modified(*args, **kwargs) if last_modified else None
+            if version is not None or modified is not None:
+                if not is_resource_modified(request.environ, etag=version, last_modified=modified):
+                    resp = current_app.response_class(status=HTTPStatus.NOT_MODIFIED)
+                    if version is not None:
+                        resp.set_etag(version)
+                    resp.last_modified = modified
+                    return resp
+            resp = view(*args, **kwargs)
+            if resp.status_code != HTTPStatus.OK:
+                return resp
+            if version is not None:
+                resp.set_etag(version)
+            elif etag:
+                resp.add_etag()
+            if modified is not None:
+                resp.last_modified = modified
+            return resp.make_conditional(request)
+        return wrapper
+
+    @staticmethod
+    def _frozen_response(view, *args, **kwargs):
+        '''
+        Call a view and keep a thread-safe copy of its response for coalesced requests
+
+        :returns: a 2-tuple ``(response, frozen)``, ``frozen`` being ``None``
+            if the response can't be shared (streamed or setting cookies)
+        '''
+        resp = view(*args, **kwargs)
+        if resp.is_streamed or resp.direct_passthrough or 'Set-Cookie' in resp.headers:
+            return resp, None
+        return resp, (resp.get_data(), resp.status, list(resp.headers))
+
     def make_response(self, data, *args, **kwargs):
         '''
         Looks up the representation transformer for the requested media
@@ -354,14 +640,12 @@ class Api(object):
         :param data: Python object containing response data to be transformed
         '''
         default_mediatype = kwargs.pop('fallback_mediatype', None) or self.default_mediatype
-        mediatype = request.accept_mimetypes.best_match(
-            self.representations,
-            default=default_mediatype,
-        )
+        mediatype = best_match(self.representations, default=default_mediatype)
         if mediatype is None:
             raise NotAcceptable()
         if mediatype in self.representations:
-            resp = self.representations[mediatype](data, *args, **kwargs)
+            with phase('serialize'):
+                resp = self.representations[mediatype](data, *args, **kwargs)
             resp.headers['Content-Type'] = mediatype
             return resp
         elif mediatype == 'text/plain':
@@ -379,6 +663,10 @@ class Api(object):
     def render_root(self):
         self.abort(HTTPStatus.NOT_FOUND)
 
+    def render_metrics(self):
+        '''Render the metrics in the Prometheus text exposition format'''
+        return current_app.response_class(self.metrics.render(), content_type=METRICS_CONTENT_TYPE)
+
     def render_doc(self):
         '''Override this method to customize the documentation page'''
         if self._doc_view:
@@ -403,13 +691,12 @@ class Api(object):
         if namespace is not self.default_namespace:
             endpoint = '{ns.name}_{endpoint}'.format(ns=namespace, endpoint=endpoint)
         if endpoint in self.endpoints:
-            suffix = 2
-            while True:
-                new_endpoint = '{base}_{suffix}'.format(base=endpoint, suffix=suffix)
-                if new_endpoint not in self.endpoints:
-                    endpoint = new_endpoint
-                    break
+            # Resume from the last suffix given for this endpoint instead of counting from 2
+            suffix = self._endpoint_suffixes.get(endpoint, 2)
+            while '{base}_{suffix}'.format(base=endpoint, suffix=suffix) in self.endpoints:
                 suffix += 1
+            self._endpoint_suffixes[endpoint] = suffix
+            endpoint = '{base}_{suffix}'.format(base=endpoint, suffix=suffix)
         return endpoint
 
     def get_ns_path(self, ns):
@@ -438,6 +725,7 @@ class Api(object):
         for r in ns.resources:
             urls = self.ns_urls(ns, r.urls)
             self.register_resource(ns, r.resource, *urls, **r.kwargs)
+        self._invalidate_error_handlers()
         # Register models
         for name, definition in six.iteritems(ns.models):
             self.models[name] = definition
@@ -488,24 +776,67 @@ class Api(object):
         '''
         return url_for(self.endpoint('root'), _external=False)
 
-    @cached_property
+    @property
     def __schema__(self):
         '''
         The Swagger specifications/schema for this API
 
+        The specifications are assembled from cached per-namespace fragments
+        and rebuilt when a namespace is added or changed.
+
         :returns dict: the schema as a serializable dict
         '''
-        if not self._schema:
+        key = self._spec_key()
+        if self._schema is None or self._schema_key != key:
             try:
-                self._schema = Swagger(self).as_dict()
+                schema = self._build_schema()
             except Exception:
                 # Log the source exception for debugging purpose
                 # and return an error message
                 msg = 'Unable to render schema'
                 log.exception(msg)  # This will provide a full traceback
-                return {'error': msg}
+                # Cached too, so a broken schema is not rebuilt (and logged) on every request
+                schema = {'error': msg}
+            self._schema, self._schema_key = schema, key
+            self._refresolver = None
         return self._schema
 
+    def get_schema(self, tags=None, minimal=False):
+        '''
+        The Swagger specifications restricted to some tags and/or minified.
+
+        Each variant is cached until the specifications change.
+
+        :param list tags: only keep the operations having one of these tags (namespaces names)
+            and the definitions they reference
+        :param bool minimal: strip descriptions and examples
+        :returns dict: the schema as a serializable dict
+        '''
+        schema = self.__schema__
+        if 'error' in schema or not (tags or minimal):
+            return schema
+        key = (frozenset(tags or ()), bool(minimal))
+        cached = self._partial_schemas.get(key)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+        partial = select_tags(schema, tags) if tags else schema
+        if minimal:
+            partial = minify(partial)
+        self._partial_schemas.set(key, (schema, partial))
+        return partial
+
+    def _build_schema(self):
+        directory = current_app.config.get('RESTPLUS_CACHE_DIR')
+        if directory:
+            return cached_specs(self, directory, Swagger(self).as_dict)
+        return Swagger(self).as_dict()
+
+    def _spec_key(self):
+        '''The state the specifications depend on: namespaces, their paths and versions'''
+        return (self._spec_version, tuple(
+            (ns, ns._version, self.ns_paths.get(ns)) for ns in self.namespaces
+        ))
+
     @property
     def _own_and_child_error_handlers(self):
         rv = {}
@@ -528,6 +859,65 @@ class Api(object):
             self._default_error_handler = exception
             return exception
 
+    @property
+    def error_handlers(self):
+        '''
+        The error handlers registered by exception class.
+
+        Modifying them directly is supported: lookups are invalidated on change.
+        '''
+        return self._error_handlers
+
+    @error_handlers.setter
+    def error_handlers(self, handlers):
+        self._error_handlers = CallbackDict(handlers, self._error_handlers_changed)
+        self._invalidate_error_handlers()
+
+    def _error_handlers_changed(self, handlers):
+        self._invalidate_error_handlers()
+        # Error handlers are documented as responses
+        self._spec_version += 1
+
+    def _invalidate_error_handlers(self):
+        '''Reset the error handlers lookup table after a registration'''
+        self._error_handlers_table = None
+        self._error_handlers_by_type = {}
+
+    def _error_handler_for(self, e):
+        '''
+        Find the error handler registered for an exception
+        on this API or any of its namespaces.
+
+        The most specific handler given the exception class MRO is used.
+        Lookups are cached by exception type.
+
+        :param Exception e: the raised exception
+        :returns: the matching handler or ``None``
+        '''
+        cls = type(e)
+        by_type = self._error_handlers_by_type
+        try:
+            return by_type[cls]
+        except KeyError:
+            pass
+        table = self._error_handlers_table
+        if table is None:
+            table = self._error_handlers_table = self._own_and_child_error_handlers
+        handler = next((table[typecheck] for typecheck in cls.__mro__ if typecheck in table), None)
+        by_type[cls] = handler
+        return handler
+
+    @staticmethod
+    def _http_exception_headers(e):
+        '''
+        Get an :class:`~werkzeug.exceptions.HTTPException` headers
+        without rendering its default HTML response when possible.
+        '''
+        custom_response = six.get_unbound_function(type(e).get_response) is not _get_response
+        if custom_response or getattr(e, 'response', None) is not None:
+            return e.get_response().headers
+        return Headers(e.get_headers())
+
     def owns_endpoint(self, endpoint):
         '''
         Tests if an endpoint name (not path) belongs to this Api.
@@ -536,7 +926,17 @@ class Api(object):
         :param str endpoint: The name of the endpoint being checked
         :return: bool
         '''
+        key = (len(self.endpoints), self.blueprint)
+        if key != self._owned_endpoints_key:
+            self._owned_endpoints = {}
+            self._owned_endpoints_key = key
+        try:
+            return self._owned_endpoints[endpoint]
+        except KeyError:
+            owned = self._owned_endpoints[endpoint] = self._owns_endpoint(endpoint)
+            return owned
 
+    def _owns_endpoint(self, endpoint):
         if self.blueprint:
             if endpoint.startswith(self.blueprint.name):
                 endpoint = endpoint.split(self.blueprint.name + '.', 1)[-1]
@@ -552,22 +952,41 @@ class Api(object):
         and FR errors (with the correct media type) for FR endpoints. This
         method currently handles 404 and 405 errors.
 
+        The routing result computed by Flask for the current request is reused
+        when available instead of matching the request again.
+
         :return: bool
         '''
-        adapter = current_app.create_url_adapter(request)
+        error = request.routing_exception
+        if error is None and request.url_rule is None:
+            # The request has not been matched by Flask
+            try:
+                current_app.create_url_adapter(request).match()
+            except Exception as e:
+                error = e
 
-        try:
-            adapter.match()
-        except MethodNotAllowed as e:
+        if isinstance(error, MethodNotAllowed):
             # Check if the other HTTP methods at this url would hit the Api
-            valid_route_method = e.valid_methods[0]
-            rule, _ = adapter.match(method=valid_route_method, return_rule=True)
-            return self.owns_endpoint(rule.endpoint)
-        except NotFound:
+            return self.owns_endpoint(self._allowed_route_endpoint(error.valid_methods[0]))
+        elif isinstance(error, NotFound):
             return self.catch_all_404s
-        except Exception:
-            # Werkzeug throws other kinds of exceptions, such as Redirect
-            pass
+        # Werkzeug throws other kinds of exceptions, such as Redirect
+
+    def _allowed_route_endpoint(self, method):
+        '''Find the endpoint the current request path is routed to for another method'''
+        url_map = current_app.url_map
+        version = (url_map, len(url_map._rules))
+        if version != self._allowed_routes_key:
+            self._allowed_routes.clear()
+            self._allowed_routes_key = version
+        key = (request.host, request.script_root, request.path, method)
+        endpoint = self._allowed_routes.get(key)
+        if endpoint is None:
+            adapter = current_app.create_url_adapter(request)
+            rule, _ = adapter.match(method=method, return_rule=True)
+            endpoint = rule.endpoint
+            self._allowed_routes.set(key, endpoint)
+        return endpoint
 
     def _has_fr_route(self):
         '''Encapsulating the rules for whether the request was to a Flask endpoint'''
@@ -607,6 +1026,15 @@ class Api(object):
         :param Exception e: the raised Exception object
 
         '''
+        if not self.instrumented:
+            return self._handle_error(e)
+        recorder = self._start_instrumentation()
+        with phase('error'):
+            response = self._handle_error(e)
+        self._finish_instrumentation(recorder, response)
+        return response
+
+    def _handle_error(self, e):
         got_request_exception.send(current_app._get_current_object(), exception=e)
 
         # When propagate_exceptions is set, do not return the exception to the
@@ -626,11 +1054,10 @@ class Api(object):
 
         headers = Headers()
 
-        for typecheck, handler in six.iteritems(self._own_and_child_error_handlers):
-            if isinstance(e, typecheck):
-                result = handler(e)
-                default_data, code, headers = unpack(result, HTTPStatus.INTERNAL_SERVER_ERROR)
-                break
+        handler = self._error_handler_for(e)
+        if handler is not None:
+            result = handler(e)
+            default_data, code, headers = unpack(result, HTTPStatus.INTERNAL_SERVER_ERROR)
         else:
             if isinstance(e, HTTPException):
                 code = HTTPStatus(e.code)
@@ -638,7 +1065,7 @@ class Api(object):
                     default_data = {
                         'message': getattr(e, 'description', code.phrase)
                     }
-                headers = e.get_response().headers
+                headers = self._http_exception_headers(e)
             elif self._default_error_handler:
                 result = self._default_error_handler(e)
                 default_data, code, headers = unpack(result, HTTPStatus.INTERNAL_SERVER_ERROR)
@@ -659,7 +1086,7 @@ class Api(object):
             exc_info = sys.exc_info()
             if exc_info[1] is None:
                 exc_info = None
-            current_app.log_exception(exc_info)
+            self._log_exception(exc_info)
 
         elif code == HTTPStatus.NOT_FOUND and current_app.config.get("ERROR_404_HELP", True) \
                 and include_message_in_response:
@@ -684,9 +1111,7 @@ class Api(object):
         return resp
 
     def _help_on_404(self, message=None):
-        rules = dict([(RE_RULES.sub('', rule.rule), rule.rule)
-                      for rule in current_app.url_map.iter_rules()])
-        close_matches = difflib.get_close_matches(request.path, rules.keys())
+        close_matches = self._get_rule_index().suggest(request.path)
         if close_matches:
             # If we already have a message, add punctuation and continue it.
             message = ''.join((
@@ -694,11 +1119,77 @@ class Api(object):
                 'You have requested this URI [',
                 request.path,
                 '] but did you mean ',
-                ' or '.join((rules[match] for match in close_matches)),
+                ' or '.join(close_matches),
                 ' ?',
             ))
         return message
 
+    def _log_exception(self, exc_info):
+        '''
+        Log an exception unless throttled by the ``ERROR_LOG_RATE``,
+        ``ERROR_LOG_BURST`` and ``ERROR_LOG_SAMPLE_RATE`` settings.
+
+        A summary of the suppressed exceptions of the same type
+        is logged along with the next logged one.
+        '''
+        throttle = self._get_log_throttle()
+        if throttle is None:
+            current_app.log_exception(exc_info)
+            return
+        exc_type = exc_info[0] if exc_info else None
+        allowed, suppressed = throttle.allow(exc_type)
+        if not allowed:
+            return
+        if suppressed:
+            current_app.logger.warning('%d similar %s exception(s) have not been logged', suppressed,
+                                       getattr(exc_type, '__name__', exc_type))
+        current_app.log_exception(exc_info)
+
+    def _get_log_throttle(self):
+        config = current_app.config
+        settings = (
+            config.get('ERROR_LOG_RATE'),
+            config.get('ERROR_LOG_BURST'),
+            config.get('ERROR_LOG_SAMPLE_RATE', 1.0),
+        )
+        if settings[0] is None and settings[2] >= 1:
+            return None
+        throttle = self._log_throttle
+        if throttle is None or (throttle.rate, throttle.burst, throttle.sample_rate) != settings:
+            throttle = self._log_throttle = LogThrottle(*settings)
+        return throttle
+
+    def _get_rule_index(self):
+        url_map = current_app.url_map
+        index = self._rule_index
+        if index is None or index.url_map is not url_map:
+            index = self._rule_index = RuleIndex(
+                url_map,
+                candidates=current_app.config.get('ERROR_404_HELP_CANDIDATES', DEFAULT_CANDIDATES),
+                cache_size=current_app.config.get('ERROR_404_HELP_CACHE_SIZE', DEFAULT_CACHE_SIZE),
+            )
+        return index
+
+    def warmup(self, app=None, freeze=False):
+        '''
+        Eagerly build the state otherwise lazily built on first use:
+        resources dispatch plans and lazy views, resolved models and their schemas, 404 suggestions index,
+        Swagger specifications, their references resolver, models validators and the OpenAPI schema.
+
+        Call it once everything is registered and before workers are forked
+        (ie. at the end of the application factory with gunicorn ``--preload``)
+        so this state is shared by all the workers instead of being built by each one.
+
+        :param flask.Flask app: the application (defaults to the one the API is registered on)
+        :param bool freeze: freeze the garbage collector after the warmup (see :func:`~flask_restplus.warmup.warmup`)
+        :returns list: a :class:`~flask_restplus.warmup.WarmupStep` report for each step
+        '''
+        if app is None:
+            app = self.blueprint_setup.app if self.blueprint_setup else self.app
+        if app is None or hasattr(app, 'record'):
+            raise ValueError('The API needs to be registered on an application to be warmed up')
+        return warmup(self, app, freeze=freeze)
+
     def as_postman(self, urlvars=False, swagger=False):
         '''
         Serialize the API as Postman collection (v1)
@@ -717,6 +1208,8 @@ class Api(object):
     @property
     def refresolver(self):
         if not self._refresolver:
+            # Imported on first use to keep the package import fast
+            from jsonschema import RefResolver
             self._refresolver = RefResolver.from_schema(self.__schema__)
         return self._refresolver
 
@@ -832,11 +1325,46 @@ class Api(object):
 
 
 class SwaggerView(Resource):
-    '''Render the Swagger specifications as JSON'''
+    '''
+    Render the Swagger specifications as JSON
+
+    The ``tag`` query parameter (repeatable) restricts the specifications
+    to some namespaces and ``minimal`` strips descriptions and examples.
+    '''
     def get(self):
-        schema = self.api.__schema__
+        if not request.args:
+            prebuilt = self.prebuilt()
+            if prebuilt is not None:
+                return prebuilt
+        try:
+            minimal = inputs.boolean(request.args.get('minimal', False))
+        except ValueError as e:
+            self.api.abort(HTTPStatus.BAD_REQUEST, str(e))
+        schema = self.api.get_schema(request.args.getlist('tag'), minimal)
         return schema, HTTPStatus.INTERNAL_SERVER_ERROR if 'error' in schema else HTTPStatus.OK
 
+    def prebuilt(self):
+        '''
+        Serve the specifications exported in ``RESTPLUS_SPECS_DIR`` if any,
+        gzipped if supported by the client.
+
+        :returns: the response or ``None`` if there is no exported specifications
+        '''
+        directory = current_app.config.get('RESTPLUS_SPECS_DIR')
+        if not directory:
+            return
+        path = os.path.join(export.export_directory(self.api, directory), export.SPECS_FILENAME)
+        gzipped = path + export.GZIP_SUFFIX
+        if 'gzip' in request.accept_encodings and os.path.isfile(gzipped):
+            response = send_file(gzipped, mimetype='application/json', conditional=True)
+            response.headers['Content-Encoding'] = 'gzip'
+        elif os.path.isfile(path):
+            response = send_file(path, mimetype='application/json', conditional=True)
+        else:
+            return
+        response.vary.add('Accept-Encoding')
+        return response
+
     def mediatypes(self):
         return ['application/json']
 
@@ -1,13 +1,34 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-from flask import url_for, Blueprint, render_template
+import hashlib
+import mimetypes
+import os
+
+from flask import url_for, Blueprint, render_template, request, current_app, send_from_directory
+from werkzeug.security import safe_join
+
+from .utils import LRUCache
+
+#: The precompressed static files variants, by preference order
+PRECOMPRESSED = (('br', '.br'), ('gzip', '.gz'))
+
+#: The ``Cache-Control`` header of static files requested with their content hash
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+#: The maximum number of cached documentation pages per application
+PAGES_CACHE_SIZE = 32
+
+_hashes = {}
 
 
 class Apidoc(Blueprint):
     '''
     Allow to know if the blueprint has already been registered
     until https://github.com/mitsuhiko/flask/pull/1301 is merged
+
+    Static files are served precompressed (``.br`` or ``.gz`` variants) when available
+    and accepted by the client, and cached forever when requested with their content hash.
     '''
     def __init__(self, *args, **kwargs):
         self.registered = False
@@ -17,6 +38,26 @@ class Apidoc(Blueprint):
         super(Apidoc, self).register(*args, **kwargs)
         self.registered = True
 
+    def send_static_file(self, filename):
+        path = safe_join(self.static_folder, filename)
+        served = filename
+        encoding = None
+        if path is not None:
+            for name, suffix in PRECOMPRESSED:
+                if name in request.accept_encodings and os.path.isfile(path + suffix):
+                    served, encoding = filename + suffix, name
+                    break
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        response = send_from_directory(self.static_folder, served, mimetype=mimetype,
+                                       cache_timeout=self.get_send_file_max_age(filename))
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        version = request.args.get('v')
+        if version and path is not None and version == static_hash(path):
+            response.headers['Cache-Control'] = IMMUTABLE
+        return response
+
 
 apidoc = Apidoc('restplus_doc', __name__,
     template_folder='templates',
@@ -25,12 +66,62 @@ apidoc = Apidoc('restplus_doc', __name__,
 )
 
 
-@apidoc.add_app_template_global
+def static_hash(path):
+    '''
+    The content hash of a static file, cached until the file is modified
+
+    :param str path: the static file path
+    :returns str: the hash or ``None`` if the file does not exist
+    '''
+    try:
+        mtime = os.path.getmtime(path)
+    except (OSError, TypeError):
+        return None
+    key = (path, mtime)
+    if key not in _hashes:
+        digest = hashlib.md5()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+        _hashes[key] = digest.hexdigest()[:12]
+    return _hashes[key]
+
+
 def swagger_static(filename):
+    '''The URL of a static file, with its content hash to allow caching it forever'''
+    version = static_hash(safe_join(apidoc.static_folder, filename))
+    if version:
+        return url_for('restplus_doc.static', filename=filename, v=version)
     return url_for('restplus_doc.static', filename=filename)
 
 
+apidoc.add_app_template_global(swagger_static)
+
+
 def ui_for(api):
-    '''Render a SwaggerUI for a given API'''
+    '''
+    Render a SwaggerUI for a given API
+
+    Rendered pages are cached per application until the ``SWAGGER_*`` configuration changes
+    (except in debug mode).
+    '''
+    if current_app.debug:
+        return _render(api)
+    conf = current_app.extensions.setdefault('restplus', {})
+    pages = conf.get('doc_pages')
+    if pages is None:
+        pages = conf['doc_pages'] = LRUCache(PAGES_CACHE_SIZE)
+    settings = tuple(sorted(
+        (key, repr(value)) for key, value in current_app.config.items() if key.startswith('SWAGGER_')
+    ))
+    key = (api.title, api.specs_url, settings)
+    page = pages.get(key)
+    if page is None:
+        page = _render(api)
+        pages.set(key, page)
+    return page
+
+
+def _render(api):
     return render_template('swagger-ui.html', title=api.title,
                            specs_url=api.specs_url)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+'''
+The ``flask restplus`` command line interface.
+
+Registered on applications when an :class:`~flask_restplus.Api` is initialized (requires Flask >= 0.11).
+
+.. versionadded:: 0.13.1
+'''
+from __future__ import unicode_literals
+
+import click
+
+from flask import current_app
+from flask.cli import AppGroup
+
+from .errors import SpecsError
+from .export import export as export_api
+from .schemas import SchemaValidationError
+
+__all__ = ('restplus',)
+
+
+restplus = AppGroup('restplus', help='Flask-RESTPlus commands.')
+
+
+@restplus.command('export')
+@click.option('-o', '--output', default='specs', show_default=True, type=click.Path(file_okay=False),
+              help='The export directory.')
+@click.option('--postman/--no-postman', default=True, show_default=True,
+              help='Export the Postman collections.')
+@click.option('--validate/--no-validate', default=True, show_default=True,
+              help='Validate the specifications.')
+@click.option('--gzip/--no-gzip', 'compress', default=True, show_default=True,
+              help='Write gzipped variants.')
+def export(output, postman, validate, compress):
+    '''
+    Export the APIs Swagger specifications and Postman collections.
+
+    Serve the exported specifications by setting RESTPLUS_SPECS_DIR to the export directory.
+    '''
+    apis = current_app.extensions.get('restplus', {}).get('apis', [])
+    if not apis:
+        raise click.ClickException('No API registered on this application')
+    for api in apis:
+        try:
+            paths = export_api(api, output, postman=postman, validate=validate, compress=compress)
+        except (SpecsError, SchemaValidationError) as e:
+            raise click.ClickException(str(e))
+        for path in paths:
+            click.echo(path)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+'''
+Single-flight coalescing of identical concurrent requests.
+
+.. versionadded:: 0.13.1
+'''
+from __future__ import unicode_literals
+
+import threading
+
+__all__ = ('SingleFlight',)
+
+
+class _Call(object):
+    '''An in-flight call other threads can wait on'''
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    '''
+    Ensure only one execution of a given call is in flight for a given key.
+
+    Threads asking for a key already being computed wait for the first call
+    to complete and receive its result (or its exception) instead of running it again.
+    '''
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key, func, *args, **kwargs):
+        '''
+        Execute ``func`` unless a call for ``key`` is already in flight.
+
+        :param key: a hashable key identifying identical calls
+        :param callable func: the function to execute
+        :returns: a 2-tuple ``(result, coalesced)``, ``coalesced`` being ``True``
+            if the result has been shared from another call
+        '''
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func(*args, **kwargs)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result, False
+
+    @property
+    def stats(self):
+        '''
+        Coalescing statistics
+
+        :returns dict: the ``executed`` and ``coalesced`` calls counts
+            and the number of calls currently ``in_flight``
+        '''
+        with self._lock:
+            return {
+                'executed': self._executed,
+                'coalesced': self._coalesced,
+                'in_flight': len(self._calls),
+            }
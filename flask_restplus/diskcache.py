@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+'''
+Persistent on-disk cache of the Swagger specifications, for fast cold starts.
+
+Specifications are stored in a file named after a fingerprint of the API:
+every API, namespace and resource attribute the specifications are built from
+(including their documentation, docstrings and conditional requests support),
+models, error handlers, the relevant settings, the resources modules files
+and the Flask-RESTPlus version.
+
+.. versionadded:: 0.13.1
+'''
+from __future__ import unicode_literals
+
+import hashlib
+import io
+import json
+import logging
+import os
+import sys
+import tempfile
+
+from collections import OrderedDict
+from inspect import isclass, getdoc
+
+import six
+
+from flask import current_app, json as flask_json
+
+from . import fields
+from .__about__ import __version__
+from .export import export_directory
+from .model import ModelBase
+
+__all__ = ('fingerprint', 'cached_specs')
+
+log = logging.getLogger(__name__)
+
+#: The settings the specifications depend on
+SETTINGS = ('SERVER_NAME', 'RESTPLUS_MASK_SWAGGER', 'RESTPLUS_MASK_HEADER')
+
+SUFFIX = '.json'
+
+
+def _name(obj):
+    return '{0}.{1}'.format(getattr(obj, '__module__', ''), getattr(obj, '__qualname__', obj.__name__))
+
+
+def _describe(value):
+    '''A stable text description of a documentation value (without memory addresses)'''
+    if value is None or isinstance(value, (bool, float) + six.integer_types + six.string_types):
+        return repr(value)
+    elif isinstance(value, ModelBase):
+        return 'model:' + value.name
+    elif isinstance(value, dict):
+        return '{' + ','.join(sorted(
+            '{0}:{1}'.format(_describe(k), _describe(v)) for k, v in six.iteritems(value)
+        )) + '}'
+    elif isinstance(value, (set, frozenset)):
+        return '{' + ','.join(sorted(_describe(v) for v in value)) + '}'
+    elif isinstance(value, (list, tuple)):
+        return '[' + ','.join(_describe(v) for v in value) + ']'
+    elif isinstance(value, fields.Raw):
+        attributes = dict((k, v) for k, v in six.iteritems(vars(value)) if not k.startswith('_'))
+        return '{0}({1})'.format(_name(type(value)), _describe(attributes))
+    elif not isclass(value) and hasattr(value, '__schema__'):
+        # Request parsers and other documented objects are described by their serialization
+        return '{0}({1})'.format(_name(type(value)), _describe(value.__schema__))
+    elif isclass(value) or callable(value) and hasattr(value, '__name__'):
+        return _name(value)
+    return _name(type(value))
+
+
+def _module_file(obj):
+    module = sys.modules.get(getattr(obj, '__module__', None))
+    filename = getattr(module, '__file__', None)
+    if filename:
+        try:
+            stat = os.stat(filename)
+            return '{0}:{1}:{2}'.format(filename, stat.st_mtime, stat.st_size)
+        except OSError:
+            pass
+    return ''
+
+
+def fingerprint(api):
+    '''
+    Compute the fingerprint of an API specifications.
+
+    Must be called within a request context.
+
+    :param Api api: the API to fingerprint
+    :rtype: str
+    '''
+    parts = [
+        __version__,
+        _describe([api.title, api.version, api.description, api.terms_url, api.license, api.license_url,
+                   api.contact, api.contact_email, api.contact_url, api.authorizations, api.security,
+                   api.base_path, list(api.representations), api.tags, api.default_id,
+                   getattr(api.blueprint, 'subdomain', None)]),
+        _describe([current_app.config.get(key) for key in SETTINGS]),
+    ]
+    for exception, handler in six.iteritems(api.error_handlers):
+        parts.append(_describe([exception, getdoc(handler), getattr(handler, '__apidoc__', None)]))
+    for ns in api.namespaces:
+        parts.append(_describe([ns.name, ns.description, ns.path, api.ns_paths.get(ns), ns.authorizations,
+                                ns.etag, ns.ordered]))
+        for resource, urls, route_doc, kwargs in ns.resources:
+            parts.append(_describe([resource, urls, route_doc, kwargs, getdoc(resource),
+                                    getattr(resource, '__apidoc__', None), _module_file(resource),
+                                    getattr(resource, 'etag', None), getattr(resource, 'last_modified', None)]))
+            for method in sorted(resource.methods or ()):
+                func = getattr(resource, method.lower(), None)
+                parts.append(_describe([method, getdoc(func), getattr(func, '__apidoc__', None)]))
+    for name in sorted(api.models):
+        model = api.models[name]
+        if isinstance(model, ModelBase):
+            content = list(model.items()) if isinstance(model, dict) else getattr(model, '_schema', None)
+            parts.append(_describe([name, type(model), model.__parents__, model.__apidoc__,
+                                    getattr(model, '__mask__', None), content]))
+        else:
+            parts.append(_describe([name, model]))
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part.encode('utf8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def cached_specs(api, directory, build):
+    '''
+    Load an API specifications from the cache directory if its fingerprint matches,
+    otherwise build and store them (replacing the outdated ones).
+
+    :param Api api: the API
+    :param str directory: the cache directory
+    :param callable build: builds the specifications on cache miss
+    :rtype: dict
+    '''
+    target = export_directory(api, directory)
+    key = fingerprint(api)
+    path = os.path.join(target, key + SUFFIX)
+    if os.path.isfile(path):
+        try:
+            with io.open(path, encoding='utf8') as f:
+                return json.load(f, object_pairs_hook=OrderedDict)
+        except (IOError, ValueError):
+            log.warning('Ignoring unreadable cached specifications %s', path)
+
+    specs = build()
+    try:
+        _store(target, path, specs)
+    except (IOError, OSError):
+        log.warning('Unable to store the specifications in %s', target, exc_info=True)
+    return specs
+
+
+def _store(target, path, specs):
+    if not os.path.isdir(target):
+        os.makedirs(target)
+    fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=target)
+    with io.open(fd, 'w', encoding='utf8') as out:
+        out.write(six.text_type(flask_json.dumps(specs)))
+    try:
+        # Atomic on POSIX so concurrent workers never read a partial file
+        os.rename(tmp, path)
+    except OSError:
+        os.remove(tmp)
+        raise
+    for filename in os.listdir(target):
+        if filename.endswith(SUFFIX) and os.path.join(target, filename) != path:
+            os.remove(os.path.join(target, filename))
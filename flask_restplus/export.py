@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+'''
+Ahead-of-time export of the Swagger specifications and Postman collections.
+
+Exported specifications can be served instead of being built at runtime
+by setting ``RESTPLUS_SPECS_DIR`` to the export directory.
+
+.. versionadded:: 0.13.1
+'''
+from __future__ import unicode_literals
+
+import gzip
+import io
+import os
+
+import six
+
+from flask import current_app, json
+
+from . import schemas
+from .errors import SpecsError
+
+__all__ = ('export', 'export_directory', 'SPECS_FILENAME', 'POSTMAN_FILENAME')
+
+
+#: The exported Swagger specifications file name
+SPECS_FILENAME = 'swagger.json'
+
+#: The exported Postman collection file name
+POSTMAN_FILENAME = 'postman.json'
+
+#: The precompressed variants suffix
+GZIP_SUFFIX = '.gz'
+
+
+def export_directory(api, directory):
+    '''
+    The directory an API is exported to: a subdirectory named after its blueprint
+    (or ``api`` for APIs registered directly on the application).
+
+    :param Api api: the exported API
+    :param str directory: the export root directory
+    :rtype: str
+    '''
+    return os.path.join(directory, api.blueprint.name if api.blueprint else 'api')
+
+
+def export(api, directory, postman=True, validate=True, compress=True):
+    '''
+    Write the Swagger specifications and the Postman collection of an API.
+
+    Must be called within an application context.
+
+    :param Api api: the API to export
+    :param str directory: the export root directory
+    :param bool postman: whether to export the Postman collection
+    :param bool validate: whether to validate the specifications before writing them
+    :param bool compress: whether to write gzipped variants along the JSON files
+    :returns list: the written files paths
+    :raises SpecsError: if the specifications can't be rendered
+    :raises SchemaValidationError: if the specifications are invalid
+    '''
+    target = export_directory(api, directory)
+    documents = []
+    with current_app.test_request_context():
+        specs = api.__schema__
+        if 'error' in specs:
+            raise SpecsError('Unable to render the specifications')
+        if validate:
+            schemas.validate(specs)
+        documents.append((SPECS_FILENAME, specs))
+        if postman:
+            documents.append((POSTMAN_FILENAME, api.as_postman(urlvars=True)))
+
+    if not os.path.isdir(target):
+        os.makedirs(target)
+    paths = []
+    for filename, data in documents:
+        content = six.text_type(json.dumps(data)).encode('utf8')
+        path = os.path.join(target, filename)
+        with io.open(path, 'wb') as out:
+            out.write(content)
+        paths.append(path)
+        if compress:
+            # A fixed mtime keeps the output reproducible
+            with gzip.GzipFile(path + GZIP_SUFFIX, 'wb', mtime=0) as out:
+                out.write(content)
+            paths.append(path + GZIP_SUFFIX)
+    return paths
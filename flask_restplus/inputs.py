@@ -21,16 +21,36 @@ from __future__ import unicode_literals
 import re
 import socket
 
-from datetime import datetime, time, timedelta
+from datetime import datetime, time, timedelta, tzinfo
 from email.utils import parsedate_tz, mktime_tz
 from six.moves.urllib.parse import urlparse
 
-import aniso8601
-import pytz
+# aniso8601 and pytz are imported on first use to keep the package import fast
+
+try:
+    from datetime import timezone
+    _utc = timezone.utc
+except ImportError:
+    # TODO Remove this to drop Python2 support
+    class _UTC(tzinfo):
+        '''The UTC timezone, without importing pytz'''
+        def utcoffset(self, dt):
+            return timedelta(0)
+
+        def tzname(self, dt):
+            return 'UTC'
+
+        def dst(self, dt):
+            return timedelta(0)
+
+        def __repr__(self):
+            return '<UTC>'
+
+    _utc = _UTC()
 
 # Constants for upgrading date-based intervals to full datetimes.
-START_OF_DAY = time(0, 0, 0, tzinfo=pytz.UTC)
-END_OF_DAY = time(23, 59, 59, 999999, tzinfo=pytz.UTC)
+START_OF_DAY = time(0, 0, 0, tzinfo=_utc)
+END_OF_DAY = time(23, 59, 59, 999999, tzinfo=_utc)
 
 
 netloc_regex = re.compile(
@@ -318,6 +338,8 @@ def _normalize_interval(start, end, value):
         - start: A date or datetime
         - end: A date or datetime
     '''
+    import pytz
+
     if not isinstance(start, datetime):
         start = datetime.combine(start, START_OF_DAY)
         end = datetime.combine(end, START_OF_DAY)
@@ -361,6 +383,8 @@ def _parse_interval(value):
     Do some nasty try/except voodoo to get some sort of datetime
     object(s) out of the string.
     '''
+    import aniso8601
+
     try:
         return sorted(aniso8601.parse_interval(value))
     except ValueError:
@@ -525,6 +549,8 @@ def datetime_from_rfc822(value):
     :raises ValueError: if value is an invalid date literal
 
     '''
+    import pytz
+
     raw = value
     if not time_regex.search(value):
         value = ' '.join((value, '00:00:00'))
@@ -553,6 +579,8 @@ def datetime_from_iso8601(value):
     :raises ValueError: if value is an invalid date literal
 
     '''
+    import aniso8601
+
     try:
         try:
             return aniso8601.parse_datetime(value)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+'''
+View functions built on first dispatch.
+
+.. versionadded:: 0.13.1
+'''
+from __future__ import unicode_literals
+
+import threading
+
+__all__ = ('LazyView',)
+
+
+class LazyView(object):
+    '''
+    A view function proxy building the real view on its first call.
+
+    The attributes Flask reads on registration (``methods``, ``provide_automatic_options``)
+    and the ``view_class`` are exposed eagerly from the view class.
+
+    :param callable build: builds the real view function
+    :param type view_class: the view class
+    :param str name: the view name
+    '''
+    def __init__(self, build, view_class, name):
+        self._build = build
+        self._view = None
+        self._lock = threading.Lock()
+        self.view_class = view_class
+        self.__name__ = str(name)
+        self.__doc__ = view_class.__doc__
+        self.__module__ = view_class.__module__
+        self.methods = getattr(view_class, 'methods', None)
+        if hasattr(view_class, 'provide_automatic_options'):
+            self.provide_automatic_options = view_class.provide_automatic_options
+
+    @property
+    def built(self):
+        '''Whether or not the real view has been built'''
+        return self._view is not None
+
+    def build(self):
+        '''
+        Build the real view function (only once, even from concurrent threads)
+
+        :returns: the real view function
+        '''
+        if self._view is None:
+            with self._lock:
+                if self._view is None:
+                    self._view = self._build()
+        return self._view
+
+    def __call__(self, *args, **kwargs):
+        return (self._view or self.build())(*args, **kwargs)
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+'''
+Non-blocking logging through a bounded queue drained by a background thread.
+
+.. versionadded:: 0.13.1
+'''
+from __future__ import unicode_literals
+
+import atexit
+import copy
+import logging
+import os
+import threading
+import weakref
+
+from six.moves import queue
+
+__all__ = ('QueueHandler', 'QueueListener', 'LogQueue', 'DROP_NEW', 'DROP_OLDEST', 'BLOCK')
+
+
+#: Discard the records emitted while the queue is full
+DROP_NEW = 'drop_new'
+
+#: Discard the oldest queued record to make room for the new one
+DROP_OLDEST = 'drop_oldest'
+
+#: Wait for the queue to have room (never drop records)
+BLOCK = 'block'
+
+POLICIES = (DROP_NEW, DROP_OLDEST, BLOCK)
+
+DEFAULT_SIZE = 10000
+
+# Whether the listener can be restarted by a fork hook rather than by checking the pid on emit
+_AT_FORK = hasattr(os, 'register_at_fork')
+
+
+class QueueHandler(logging.Handler):
+    '''
+    A logging handler sending records to a bounded queue.
+
+    :param queue: the queue records are sent to
+    :param str policy: what to do when the queue is full,
+        one of :data:`DROP_NEW`, :data:`DROP_OLDEST` or :data:`BLOCK`
+    '''
+    def __init__(self, queue, policy=DROP_NEW):
+        if policy not in POLICIES:
+            raise ValueError('Unknown queue policy: {0}'.format(policy))
+        super(QueueHandler, self).__init__()
+        self.queue = queue
+        self.policy = policy
+        self.dropped = 0
+
+    def prepare(self, record):
+        '''
+        Render the record message and exception so it can be handled later by another thread.
+
+        :param LogRecord record: the record to prepare
+        :returns LogRecord: a copy of the record safe to enqueue
+        '''
+        message = self.format(record)
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+
+    def emit(self, record):
+        try:
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def enqueue(self, record):
+        '''
+        Put a record in the queue according to the full queue policy
+
+        :param LogRecord record: the record to enqueue
+        '''
+        if self.policy == BLOCK:
+            self.queue.put(record)
+            return
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                if self.policy == DROP_NEW:
+                    self.dropped += 1
+                    return
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+
+
+class QueueListener(object):
+    '''
+    A background thread dispatching queued records to the given handlers.
+
+    Each handler level is respected.
+
+    :param queue: the queue records are read from
+    :param handlers: the handlers records are dispatched to
+    '''
+    _sentinel = None
+
+    def __init__(self, queue, *handlers):
+        self.queue = queue
+        self.handlers = handlers
+        self._thread = None
+
+    def start(self):
+        '''Start the listener thread'''
+        self._thread = thread = threading.Thread(target=self._monitor, name='flask-restplus-logging')
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        '''Process the remaining records and stop the listener thread'''
+        if self._thread is not None:
+            self.queue.put(self._sentinel)
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def handle(self, record):
+        '''
+        Dispatch a record to the handlers
+
+        :param LogRecord record: the record to handle
+        '''
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _monitor(self):
+        while True:
+            record = self.queue.get()
+            if record is self._sentinel:
+                break
+            try:
+                self.handle(record)
+            except Exception:
+                pass
+
+
+class _StartingQueueHandler(QueueHandler):
+    '''A :class:`QueueHandler` starting its :class:`LogQueue` listener on first emit'''
+    def __init__(self, log_queue, policy):
+        super(_StartingQueueHandler, self).__init__(log_queue.queue, policy)
+        self.log_queue = log_queue
+
+    def emit(self, record):
+        self.log_queue.start()
+        super(_StartingQueueHandler, self).emit(record)
+
+
+class LogQueue(object):
+    '''
+    A shared :class:`QueueHandler` and its :class:`QueueListener`
+    draining records to the given handlers.
+
+    The listener thread is started on the first record of each process,
+    so forked workers (ie. gunicorn ``--preload``) get their own.
+
+    :param handlers: the handlers the records are finally sent to
+    :param int size: the maximum number of queued records
+    :param str policy: the :class:`QueueHandler` policy when the queue is full
+    '''
+    def __init__(self, handlers, size=DEFAULT_SIZE, policy=DROP_NEW):
+        self.size = size
+        self._pid = None
+        self._lock = threading.Lock()
+        self.queue = queue.Queue(size)
+        self.handler = _StartingQueueHandler(self, policy)
+        self.listener = QueueListener(self.queue, *handlers)
+        ref = weakref.ref(self)
+        if hasattr(weakref, 'finalize'):
+            # Stops the listener once the queue is no longer used, and at exit
+            weakref.finalize(self, self.listener.stop)
+        else:
+            # TODO Remove this to drop Python2 support
+            atexit.register(lambda: ref() is not None and ref().stop())
+        if _AT_FORK:
+            os.register_at_fork(after_in_child=lambda: ref() is not None and ref()._after_fork())
+
+    def start(self):
+        '''Start the listener thread if it is not running in the current process'''
+        pid = self._pid
+        if pid is not None and (_AT_FORK or pid == os.getpid()):
+            return
+        if pid is not None:
+            # Forked without fork hooks (Python < 3.7)
+            self._after_fork()
+        with self._lock:
+            if self._pid is None:
+                self.listener.start()
+                self._pid = os.getpid()
+
+    def _after_fork(self):
+        # Threads don't survive a fork and the locks may have been held by one of them:
+        # start over with a fresh queue in the child, the parent one is drained by the parent
+        self._pid = None
+        self._lock = threading.Lock()
+        self.queue = self.handler.queue = self.listener.queue = queue.Queue(self.size)
+        self.listener._thread = None
+
+    @property
+    def dropped(self):
+        '''The number of records dropped because the queue was full'''
+        return self.handler.dropped
+
+    def stop(self):
+        '''Flush the queued records and stop the listener'''
+        self.listener.stop()
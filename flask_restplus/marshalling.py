@@ -12,6 +12,7 @@ from six import iteritems
 from flask import request, current_app, has_app_context
 
 from .mask import Mask, apply as apply_mask
+from .metrics import phase
 from .utils import unpack
 
 
@@ -249,15 +250,16 @@ class marshal_with(object):
             if has_app_context():
                 mask_header = current_app.config['RESTPLUS_MASK_HEADER']
                 mask = request.headers.get(mask_header) or mask
-            if isinstance(resp, tuple):
-                data, code, headers = unpack(resp)
-                return (
-                    marshal(data, self.fields, self.envelope, self.skip_none, mask, self.ordered),
-                    code,
-                    headers
-                )
-            else:
-                return marshal(resp, self.fields, self.envelope, self.skip_none, mask, self.ordered)
+            with phase('marshal'):
+                if isinstance(resp, tuple):
+                    data, code, headers = unpack(resp)
+                    return (
+                        marshal(data, self.fields, self.envelope, self.skip_none, mask, self.ordered),
+                        code,
+                        headers
+                    )
+                else:
+                    return marshal(resp, self.fields, self.envelope, self.skip_none, mask, self.ordered)
         return wrapper
 
 
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+'''
+Per-phase request metrics.
+
+Request phases are timed with :class:`phase`
+and reported, along with the response size, to a :class:`MetricsSink`:
+
+- ``parse``: arguments parsing with :meth:`~flask_restplus.reqparse.RequestParser.parse_args`
+- ``validate``: payload validation
+- ``handler``: resource handler execution (including marshalling)
+- ``marshal``: marshalling with :class:`~flask_restplus.marshal_with`
+- ``serialize``: response serialization by the representation
+- ``error``: error handling (including the error serialization)
+
+.. versionadded:: 0.13.1
+'''
+from __future__ import unicode_literals
+
+import bisect
+import threading
+import time
+
+import six
+
+from flask import _request_ctx_stack
+
+__all__ = ('MetricsSink', 'Metrics', 'Histogram', 'phase', 'start', 'recorder')
+
+
+clock = getattr(time, 'perf_counter', time.time)
+
+#: Request phases durations buckets, in seconds
+DURATION_BUCKETS = (.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10)
+
+#: Response sizes buckets, in bytes
+SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000)
+
+#: The Prometheus text exposition format content type
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class MetricsSink(object):
+    '''
+    The interface metrics are reported to.
+
+    Subclass it to forward metrics to your own monitoring system.
+    '''
+    def observe_duration(self, endpoint, phase, seconds):
+        '''
+        Report the duration of a request phase
+
+        :param str endpoint: the request endpoint
+        :param str phase: the phase name
+        :param float seconds: the phase duration
+        '''
+        raise NotImplementedError()
+
+    def observe_size(self, endpoint, size):
+        '''
+        Report a response size
+
+        :param str endpoint: the request endpoint
+        :param int size: the response body size in bytes
+        '''
+        raise NotImplementedError()
+
+
+class Histogram(object):
+    '''
+    A thread-safe cumulative histogram with fixed buckets.
+
+    :param tuple buckets: the sorted buckets upper bounds
+    '''
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        '''Record a value'''
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def cumulative(self):
+        '''
+        :returns list: the ``(upper bound, cumulative count)`` pairs, ending with ``+Inf``
+        '''
+        with self._lock:
+            counts = list(self.counts)
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class Metrics(MetricsSink):
+    '''
+    An in-memory :class:`MetricsSink` storing histograms
+    and rendering them in the Prometheus text exposition format.
+
+    :param str prefix: the metrics names prefix
+    '''
+    def __init__(self, prefix='restplus'):
+        self.prefix = prefix
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name, labels, buckets):
+        '''
+        Get or create a histogram
+
+        :param str name: the metric name (without prefix)
+        :param tuple labels: the ``(name, value)`` label pairs
+        :param tuple buckets: the buckets to use on creation
+        :rtype: Histogram
+        '''
+        key = (name, labels)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram(buckets)
+        return histogram
+
+    def observe_duration(self, endpoint, phase, seconds):
+        labels = (('endpoint', endpoint), ('phase', phase))
+        self.histogram('phase_seconds', labels, DURATION_BUCKETS).observe(seconds)
+
+    def observe_size(self, endpoint, size):
+        labels = (('endpoint', endpoint),)
+        self.histogram('response_size_bytes', labels, SIZE_BUCKETS).observe(size)
+
+    def render(self):
+        '''
+        Render all the metrics in the Prometheus text exposition format
+
+        :rtype: str
+        '''
+        helps = {
+            'phase_seconds': 'Time spent in each request phase',
+            'response_size_bytes': 'Response body size',
+        }
+        lines = []
+        with self._lock:
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+        current = None
+        for (name, labels), histogram in histograms:
+            fullname = '_'.join((self.prefix, name)) if self.prefix else name
+            if name != current:
+                current = name
+                lines.append('# HELP {0} {1}'.format(fullname, helps.get(name, name)))
+                lines.append('# TYPE {0} histogram'.format(fullname))
+            for bound, count in histogram.cumulative():
+                le = (('le', '+Inf' if bound == float('inf') else _number(bound)),)
+                lines.append('{0}_bucket{1} {2}'.format(fullname, _labels(labels + le), count))
+            lines.append('{0}_sum{1} {2}'.format(fullname, _labels(labels), _number(histogram.sum)))
+            lines.append('{0}_count{1} {2}'.format(fullname, _labels(labels), histogram.count))
+        return '\n'.join(lines) + '\n'
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else six.text_type(value)
+
+
+def _labels(labels):
+    return '{' + ','.join('{0}="{1}"'.format(name, _escape(value)) for name, value in labels) + '}'
+
+
+def _escape(value):
+    return six.text_type(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class RequestMetrics(object):
+    '''
+    The instrumentation attached to a request.
+
+    Phases are reported to the metrics ``sink``, to the ``tracer`` as spans
+    and collected in ``timings`` for the ``Server-Timing`` header, each being optional.
+    '''
+    __slots__ = ('sink', 'tracer', 'endpoint', 'method', 'timings')
+
+    def __init__(self, endpoint, method=None, sink=None, tracer=None, server_timing=False):
+        self.sink = sink
+        self.tracer = tracer
+        self.endpoint = endpoint
+        self.method = method
+        self.timings = [] if server_timing else None
+
+    def begin(self, phase):
+        '''Notify the tracer a phase starts, returning its span'''
+        if self.tracer is not None:
+            return self.tracer.start(self.endpoint, self.method, phase)
+
+    def observe(self, phase, seconds, span=None, error=None):
+        '''Report a phase duration'''
+        if self.sink is not None:
+            self.sink.observe_duration(self.endpoint, phase, seconds)
+        if self.timings is not None:
+            self.timings.append((phase, seconds))
+        if self.tracer is not None:
+            self.tracer.end(span, error)
+
+    def observe_size(self, size):
+        '''Report the response size'''
+        if self.sink is not None:
+            self.sink.observe_size(self.endpoint, size)
+
+
+def recorder():
+    '''
+    :returns: the current request :class:`RequestMetrics` if instrumentation is enabled, ``None`` otherwise
+    '''
+    ctx = _request_ctx_stack.top
+    return getattr(ctx, 'restplus_metrics', None)
+
+
+def start(endpoint, method=None, sink=None, tracer=None, server_timing=False):
+    '''
+    Start instrumenting the current request if not already started.
+
+    :param str endpoint: the request endpoint
+    :param str method: the request HTTP method
+    :param MetricsSink sink: the sink metrics are reported to
+    :param Tracer tracer: the tracer phases spans are reported to
+    :param bool server_timing: whether to collect phases timings for the ``Server-Timing`` header
+    :returns RequestMetrics: the current request recorder
+    '''
+    ctx = _request_ctx_stack.top
+    current = getattr(ctx, 'restplus_metrics', None)
+    if current is None and ctx is not None:
+        current = ctx.restplus_metrics = RequestMetrics(endpoint or '', method, sink, tracer, server_timing)
+    return current
+
+
+class phase(object):
+    '''
+    A context manager timing a request phase when instrumentation is enabled for the current request.
+
+    >>> with phase('parse'):
+    ...     args = parser.parse_args()
+
+    :param str name: the phase name
+    '''
+    __slots__ = ('name', 'recorder', 'start', 'span')
+
+    def __init__(self, name):
+        self.name = name
+        self.recorder = recorder()
+
+    def __enter__(self):
+        if self.recorder is not None:
+            self.span = self.recorder.begin(self.name)
+            self.start = clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if self.recorder is not None:
+            self.recorder.observe(self.name, clock() - self.start, self.span, exc_value)
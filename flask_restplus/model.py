@@ -10,21 +10,22 @@ try:
 except ImportError:
     # TODO Remove this to drop Python2 support
     from collections import OrderedDict, MutableMapping
-from six import iteritems, itervalues
+from six import iteritems, itervalues, string_types
+from six.moves.urllib.parse import unquote
 from werkzeug.utils import cached_property
 
 from .mask import Mask
 from .errors import abort
 
-from jsonschema import Draft4Validator
-from jsonschema.exceptions import ValidationError
-
 from .utils import not_none
 from ._http import HTTPStatus
 
 
 RE_REQUIRED = re.compile(r'u?\'(?P<name>.*)\' is a required property', re.I | re.U)
 
+#: The prefix of references to models definitions
+DEFINITIONS_PREFIX = '#/definitions/'
+
 
 def instance(cls):
     if isinstance(cls, type):
@@ -37,9 +38,15 @@ class ModelBase(object):
     Handles validation and swagger style inheritance for both subclasses.
     Subclass must define `schema` attribute.
 
+    Serialized schemas and validators are cached on the model until it changes,
+    so they are shared by all the APIs the model is registered on.
+
     :param str name: The model public name
     '''
 
+    #: Bumped on each change of the model fields
+    _version = 0
+
     def __init__(self, name, *args, **kwargs):
         super(ModelBase, self).__init__(*args, **kwargs)
         self.__apidoc__ = {
@@ -73,6 +80,11 @@ class ModelBase(object):
 
     @property
     def __schema__(self):
+        key = self._schema_key()
+        cached = self.__dict__.get('_cached_schema')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         schema = self._schema
 
         if self.__parents__:
@@ -81,11 +93,19 @@ class ModelBase(object):
                 for parent in self.__parents__
             ]
 
-            return {
+            schema = {
                 'allOf': refs + [schema]
             }
-        else:
-            return schema
+        self._cached_schema = (key, schema)
+        return schema
+
+    def _schema_key(self):
+        '''The key the cached schema is valid for'''
+        return (self._version, id(self.__parents__), id(getattr(self, '__mask__', None)),
+                id(self.__dict__.get('_schema')))
+
+    def _changed(self):
+        self._version += 1
 
     @classmethod
     def inherit(cls, name, *parents):
@@ -99,13 +119,81 @@ class ModelBase(object):
         return model
 
     def validate(self, data, resolver=None, format_checker=None):
-        validator = Draft4Validator(self.__schema__, resolver=resolver, format_checker=format_checker)
+        # Imported on first validation to keep the package import fast
+        from jsonschema.exceptions import ValidationError
+
+        validator = self.get_validator(resolver, format_checker)
         try:
             validator.validate(data)
         except ValidationError:
             abort(HTTPStatus.BAD_REQUEST, message='Input payload validation failed',
                   errors=dict(self.format_error(e) for e in validator.iter_errors(data)))
 
+    def get_validator(self, resolver=None, format_checker=None):
+        '''
+        Get a validator for this model, cached until this model or a model it references changes.
+
+        When all the references can be resolved from the models themselves (nested models, parents...),
+        they are inlined in the validated schema (recursive models are kept as local definitions):
+        the resolver is not used and the validator is shared by all the APIs.
+
+        :param RefResolver resolver: the resolver used for the other references
+        :param FormatChecker format_checker: an optional format checker
+        :rtype: jsonschema.Draft4Validator
+        '''
+        _, schema, standalone, validators = self._validation()
+        if standalone:
+            resolver = None
+        entry = validators.get(id(format_checker))
+        if entry is None or entry[0] is not format_checker or entry[1] is not resolver:
+            # Imported on first validation to keep the package import fast
+            from jsonschema import Draft4Validator
+            validator = Draft4Validator(schema, resolver=resolver, format_checker=format_checker)
+            entry = validators[id(format_checker)] = (format_checker, resolver, validator)
+        return entry[2]
+
+    @property
+    def requires_resolver(self):
+        '''Whether or not validating this model needs a resolver for references unknown to the models'''
+        return not self._validation()[2]
+
+    def _validation(self):
+        cached = self.__dict__.get('_validators')
+        if cached is None or not all(model._schema_key() == key for model, key in cached[0]):
+            models = {}
+            self._collect_models(models, set())
+            schema, dependencies, standalone = self._validation_schema(models)
+            cached = self._validators = (
+                [(model, model._schema_key()) for model in dependencies], schema, standalone, {}
+            )
+        return cached
+
+    def _collect_models(self, models, seen):
+        '''Collect the models reachable from this one by name'''
+        seen.add(id(self))
+        models.setdefault(self.name, self)
+        for parent in self.__parents__:
+            if id(parent) not in seen:
+                parent._collect_models(models, seen)
+
+    def _validation_schema(self, models):
+        '''
+        Build the schema to validate against: this model schema with the references to models inlined.
+
+        :param dict models: the known models by name
+        :returns tuple: the schema, the models it depends on and whether or not all the references
+            are resolved from the schema itself (the schema is unchanged if some references are unknown)
+        '''
+        inliner = _Inliner(models, self.name)
+        try:
+            schema = inliner.inline(self.__schema__)[0]
+        except _UnknownReference:
+            return self.__schema__, [self], False
+        if inliner.definitions:
+            schema = dict(schema, definitions=inliner.definitions)
+        dependencies = [self] + [models[name] for name in inliner.used if models[name] is not self]
+        return schema, dependencies, True
+
     def format_error(self, error):
         path = list(error.path)
         if error.validator == 'required':
@@ -136,6 +224,7 @@ class RawModel(ModelBase):
         if self.__mask__ and not isinstance(self.__mask__, Mask):
             self.__mask__ = Mask(self.__mask__)
         super(RawModel, self).__init__(name, *args, **kwargs)
+        self._version = 0
 
         def instance_clone(name, *parents):
             return self.__class__.clone(name, self, *parents)
@@ -166,25 +255,71 @@ class RawModel(ModelBase):
     def resolved(self):
         '''
         Resolve real fields before submitting them to marshal
+
+        Fields are shared with this model and its parents,
+        only the discriminator is copied to output this model name.
         '''
-        # Duplicate fields
-        resolved = copy.deepcopy(self)
+        resolved = self._copy()
 
-        # Recursively copy parent fields if necessary
+        # Recursively add parent fields if necessary
         for parent in self.__parents__:
             resolved.update(parent.resolved)
 
         # Handle discriminator
-        candidates = [f for f in itervalues(resolved) if getattr(f, 'discriminator', None)]
+        candidates = [k for k, f in iteritems(resolved) if getattr(f, 'discriminator', None)]
         # Ensure the is only one discriminator
         if len(candidates) > 1:
             raise ValueError('There can only be one discriminator by schema')
         # Ensure discriminator always output the model name
         elif len(candidates) == 1:
-            candidates[0].default = self.name
+            discriminator = _copy_field(resolved[candidates[0]])
+            discriminator.default = self.name
+            resolved[candidates[0]] = discriminator
 
         return resolved
 
+    def _collect_models(self, models, seen):
+        super(RawModel, self)._collect_models(models, seen)
+        for field in itervalues(self):
+            _collect_field_models(instance(field), models, seen)
+
+    def __setitem__(self, key, value):
+        super(RawModel, self).__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super(RawModel, self).__delitem__(key)
+        self._changed()
+
+    def update(self, *args, **kwargs):
+        super(RawModel, self).update(*args, **kwargs)
+        self._changed()
+
+    def pop(self, *args):
+        value = super(RawModel, self).pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self, *args):
+        item = super(RawModel, self).popitem(*args)
+        self._changed()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super(RawModel, self).setdefault(key, default)
+        self._changed()
+        return value
+
+    def clear(self):
+        super(RawModel, self).clear()
+        self._changed()
+
+    def _copy(self):
+        '''A copy of this model sharing its fields'''
+        obj = self.__class__(self.name, list(iteritems(self)), mask=self.__mask__)
+        obj.__parents__ = self.__parents__
+        return obj
+
     def extend(self, name, fields):
         '''
         Extend this model (Duplicate all fields)
@@ -203,7 +338,7 @@ class RawModel(ModelBase):
     @classmethod
     def clone(cls, name, *parents):
         '''
-        Clone these models (Duplicate all fields)
+        Clone these models (Shallow copy all fields)
 
         It can be used from the class
 
@@ -218,7 +353,7 @@ class RawModel(ModelBase):
         '''
         fields = cls.wrapper()
         for parent in parents:
-            fields.update(copy.deepcopy(parent))
+            fields.update((key, _copy_field(field)) for key, field in iteritems(parent))
         return cls(name, fields)
 
     def __deepcopy__(self, memo):
@@ -229,6 +364,87 @@ class RawModel(ModelBase):
         return obj
 
 
+def _copy_field(field):
+    '''A shallow copy of a field (or a new instance of a field class), without its cached schema'''
+    if isinstance(field, type):
+        return field()
+    field = copy.copy(field)
+    field.__dict__.pop('__schema__', None)
+    return field
+
+
+def _collect_field_models(field, models, seen):
+    '''Collect the models reachable from a field by name'''
+    targets = list(itervalues(getattr(field, 'mapping', None) or {}))
+    targets.append(getattr(field, 'model', None))
+    for model in targets:
+        if isinstance(model, ModelBase) and id(model) not in seen:
+            model._collect_models(models, seen)
+    container = getattr(field, 'container', None)
+    if container is not None:
+        _collect_field_models(instance(container), models, seen)
+
+
+class _UnknownReference(Exception):
+    '''A reference which can't be resolved from the known models'''
+
+
+class _Inliner(object):
+    '''
+    Inline the references to models in a schema.
+
+    References to a model while it is being inlined (recursive models) are kept
+    and the model is added to the local definitions instead.
+
+    :param dict models: the known models by name
+    :param str root: the name of the model the schema belongs to
+    '''
+    def __init__(self, models, root):
+        self.models = models
+        self.definitions = {}
+        self.used = set()
+        self._inlined = {}
+        self._stack = [root]
+
+    def inline(self, value):
+        '''
+        :returns tuple: the inlined value and whether or not it keeps references
+            to the models being inlined (and so can't be reused elsewhere)
+        '''
+        if isinstance(value, dict):
+            target = value.get('$ref')
+            if isinstance(target, string_types):
+                # Draft 4 ignores the other properties of a reference
+                return self.inline_reference(target)
+            items = [(key, self.inline(item)) for key, item in iteritems(value)]
+            return type(value)((key, item) for key, (item, _) in items), any(r for _, (_, r) in items)
+        elif isinstance(value, (list, tuple)):
+            items = [self.inline(item) for item in value]
+            return [item for item, _ in items], any(r for _, r in items)
+        return value, False
+
+    def inline_reference(self, target):
+        if not target.startswith(DEFINITIONS_PREFIX):
+            raise _UnknownReference(target)
+        name = unquote(target[len(DEFINITIONS_PREFIX):])
+        if name not in self.models:
+            raise _UnknownReference(target)
+        self.used.add(name)
+        if name in self._stack:
+            if name not in self.definitions:
+                self.definitions[name] = None  # Being built
+                self.definitions[name] = self.inline(self.models[name].__schema__)[0]
+            return {'$ref': target}, True
+        if name in self._inlined:
+            return self._inlined[name], False
+        self._stack.append(name)
+        schema, recursive = self.inline(self.models[name].__schema__)
+        self._stack.pop()
+        if not recursive:
+            self._inlined[name] = schema
+        return schema, recursive
+
+
 class Model(RawModel, dict, MutableMapping):
     '''
     A thin wrapper on fields dict to store API doc metadata.
@@ -4,22 +4,56 @@ from __future__ import unicode_literals
 import inspect
 import warnings
 import logging
+import weakref
 from collections import namedtuple
 
 import six
 from flask import request
 from flask.views import http_method_funcs
+from werkzeug.datastructures import CallbackDict
 
 from ._http import HTTPStatus
 from .errors import abort
 from .marshalling import marshal, marshal_with
 from .model import Model, OrderedModel, SchemaModel
 from .reqparse import RequestParser
-from .utils import merge
+from .swagger import merge_doc
 
 # Container for each route applied to a Resource using @ns.route decorator
 ResourceRoute = namedtuple("ResourceRoute", "resource urls route_doc kwargs")
 
+# The namespaces each registered resource and handler is documented by
+_documenting = weakref.WeakKeyDictionary()
+
+
+def _track(ns, resource):
+    '''Track a resource and its handlers as documented by a namespace'''
+    documented = [resource]
+    if inspect.isclass(resource):
+        documented.extend(getattr(resource, m.lower(), None) for m in resource.methods or ())
+    for obj in documented:
+        obj = getattr(obj, '__func__', obj)
+        try:
+            _documenting.setdefault(obj, weakref.WeakSet()).add(ns)
+        except TypeError:
+            # Not weakly referenceable (ie. None or builtins)
+            pass
+
+
+def _invalidate(documented):
+    '''Invalidate the specifications of the namespaces documenting an object (or its subclasses)'''
+    pending = [getattr(documented, '__func__', documented)]
+    while pending:
+        obj = pending.pop()
+        try:
+            namespaces = list(_documenting.get(obj, ()))
+        except TypeError:
+            namespaces = []
+        for ns in namespaces:
+            ns._version += 1
+        if inspect.isclass(obj):
+            pending.extend(type.__subclasses__(obj))
+
 
 class Namespace(object):
     '''
@@ -33,10 +67,12 @@ class Namespace(object):
     :param list decorators: A list of decorators to apply to each resources
     :param bool validate: Whether or not to perform validation on this namespace
     :param bool ordered: Whether or not to preserve order on models and marshalling
+    :param bool|callable etag: Whether or not to support conditional requests with ETags
+        on this namespace resources (See :meth:`Api.conditional`)
     :param Api api: an optional API to attache to the namespace
     '''
     def __init__(self, name, description=None, path=None, decorators=None, validate=None,
-            authorizations=None, ordered=False, **kwargs):
+            authorizations=None, ordered=False, etag=None, **kwargs):
         self.name = name
         self.description = description
         self._path = path
@@ -47,19 +83,40 @@ class Namespace(object):
         self.urls = {}
         self.decorators = decorators if decorators else []
         self.resources = []  # List[ResourceRoute]
+        self.apis = []
         self.error_handlers = {}
         self.default_error_handler = None
         self.authorizations = authorizations
         self.ordered = ordered
-        self.apis = []
+        self.etag = etag
         if 'api' in kwargs:
             self.apis.append(kwargs['api'])
         self.logger = logging.getLogger(__name__ + "." + self.name)
+        # Bumped on each documented change to invalidate the cached specifications fragment
+        self._version = 0
 
     @property
     def path(self):
         return (self._path or ('/' + self.name)).rstrip('/')
 
+    @property
+    def error_handlers(self):
+        '''
+        The error handlers registered by exception class.
+
+        Modifying them directly is supported: the APIs lookups are invalidated on change.
+        '''
+        return self._error_handlers
+
+    @error_handlers.setter
+    def error_handlers(self, handlers):
+        self._error_handlers = CallbackDict(handlers, self._error_handlers_changed)
+        self._error_handlers_changed(self._error_handlers)
+
+    def _error_handlers_changed(self, handlers):
+        for api in self.apis:
+            api._invalidate_error_handlers()
+
     def add_resource(self, resource, *urls, **kwargs):
         '''
         Register a Resource for a given API Namespace
@@ -72,6 +129,8 @@ class Namespace(object):
             Can be used to reference this route in :class:`fields.Url` fields
         :param list|tuple resource_class_args: args to be forwarded to the constructor of the resource.
         :param dict resource_class_kwargs: kwargs to be forwarded to the constructor of the resource.
+        :param bool shared_instance: serve all requests with a single resource instance
+            (defaults to :attr:`Resource.shared_instance`, see :meth:`Resource.as_shared_view`)
 
         Additional keyword arguments not specified above will be passed as-is
         to :meth:`flask.Flask.add_url_rule`.
@@ -84,10 +143,45 @@ class Namespace(object):
         '''
         route_doc = kwargs.pop('route_doc', {})
         self.resources.append(ResourceRoute(resource, urls, route_doc, kwargs))
+        _track(self, resource)
+        self._version += 1
         for api in self.apis:
             ns_urls = api.ns_urls(self, urls)
             api.register_resource(self, resource, *ns_urls, **kwargs)
 
+    def add_resources(self, routes):
+        '''
+        Register many Resources at once for a given API Namespace
+
+        Endpoints are validated in a single pass before registering any resource,
+        which is faster than successive :meth:`add_resource` calls on large APIs.
+
+        :param list routes: ``(resource, urls)`` or ``(resource, urls, kwargs)`` tuples,
+            ``urls`` being an url or a list of urls and ``kwargs`` the :meth:`add_resource` keyword arguments
+        :raises ValueError: if some endpoints are already set to other resources
+
+        Example::
+
+            namespace.add_resources([
+                (HelloWorld, ['/', '/hello']),
+                (Foo, '/foo', {'endpoint': 'foo'}),
+            ])
+        '''
+        added = []
+        for route in routes:
+            resource, urls = route[0], route[1]
+            kwargs = dict(route[2]) if len(route) > 2 else {}
+            if isinstance(urls, six.string_types):
+                urls = (urls,)
+            route_doc = kwargs.pop('route_doc', {})
+            added.append(ResourceRoute(resource, tuple(urls), route_doc, kwargs))
+        for api in self.apis:
+            api.register_resources(self, [(r.resource, api.ns_urls(self, r.urls), r.kwargs) for r in added])
+        self.resources.extend(added)
+        for route in added:
+            _track(self, route.resource)
+        self._version += 1
+
     def route(self, *urls, **kwargs):
         '''
         A decorator to route resources.
@@ -114,7 +208,7 @@ class Namespace(object):
                 handle_deprecations(doc[http_method])
                 if 'expect' in doc[http_method] and not isinstance(doc[http_method]['expect'], (list, tuple)):
                     doc[http_method]['expect'] = [doc[http_method]['expect']]
-        return merge(getattr(cls, '__apidoc__', {}), doc)
+        return merge_doc(getattr(cls, '__apidoc__', {}), doc)
 
     def doc(self, shortcut=None, **kwargs):
         '''A decorator to add some api documentation to the decorated object'''
@@ -127,6 +221,8 @@ class Namespace(object):
                 documented,
                 kwargs if show else False
             )
+            _invalidate(documented)
+            self._version += 1
             return documented
         return wrapper
 
@@ -144,6 +240,7 @@ class Namespace(object):
 
     def add_model(self, name, definition):
         self.models[name] = definition
+        self._version += 1
         for api in self.apis:
             api.models[name] = definition
         return definition
@@ -226,7 +323,7 @@ class Namespace(object):
 
     def as_list(self, field):
         '''Allow to specify nested lists for documentation'''
-        field.__apidoc__ = merge(getattr(field, '__apidoc__', {}), {'as_list': True})
+        field.__apidoc__ = merge_doc(getattr(field, '__apidoc__', {}), {'as_list': True})
         return field
 
     def marshal_with(self, fields, as_list=False, code=HTTPStatus.OK, description=None, **kwargs):
@@ -244,7 +341,8 @@ class Namespace(object):
                 },
                 '__mask__': kwargs.get('mask', True),  # Mask values can't be determined outside app context
             }
-            func.__apidoc__ = merge(getattr(func, '__apidoc__', {}), doc)
+            func.__apidoc__ = merge_doc(getattr(func, '__apidoc__', {}), doc)
+            _invalidate(func)
             return marshal_with(fields, ordered=self.ordered, **kwargs)(func)
         return wrapper
 
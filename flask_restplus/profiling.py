@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+'''
+On-demand per-request profiling.
+
+.. versionadded:: 0.13.1
+'''
+from __future__ import unicode_literals
+
+import cProfile
+import hmac
+import io
+import json
+import os
+import pstats
+import random
+import sysconfig
+import tempfile
+import threading
+import time
+import uuid
+
+from collections import namedtuple
+
+import six
+
+from flask import request
+
+__all__ = ('Profiler', 'ProfileReport', 'RESTPLUS', 'USER', 'LIBRARY')
+
+
+#: Code from Flask-RESTPlus itself
+RESTPLUS = 'restplus'
+
+#: Code from the application
+USER = 'user'
+
+#: Code from the standard library, installed packages and builtins
+LIBRARY = 'library'
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+LIBRARY_DIRS = tuple(set(
+    os.path.abspath(path) for name, path in sysconfig.get_paths().items()
+    if name in ('stdlib', 'platstdlib', 'purelib', 'platlib')
+))
+
+#: A profiled request report: the profile ``id``, the stats file ``path``,
+#: the self time ``totals`` in seconds per category
+#: and the ``top`` functions as ``(category, function, self time, cumulative time, calls)``
+ProfileReport = namedtuple('ProfileReport', 'id path totals top')
+
+# Held by the profiled request: a single profiler can be active at a time (Python 3.12+)
+_running = threading.Lock()
+
+
+def categorize(filename):
+    '''
+    Attribute a code file to :data:`RESTPLUS`, :data:`USER` or :data:`LIBRARY` code
+
+    :param str filename: the code file name as reported by the profiler
+    :rtype: str
+    '''
+    if not filename or filename == '~' or filename.startswith('<'):
+        return LIBRARY
+    path = os.path.abspath(filename)
+    if path.startswith(PACKAGE_DIR + os.sep):
+        return RESTPLUS
+    if path.startswith(LIBRARY_DIRS) or 'site-packages' in path:
+        return LIBRARY
+    return USER
+
+
+class Profiler(object):
+    '''
+    Run some requests under :mod:`cProfile` and store their stats.
+
+    A request is profiled if it carries the ``header`` with the secret ``token`` as value
+    or if it is randomly sampled according to ``sample_rate``.
+
+    Profiled responses have an ``X-Profile-Id`` header giving the stored stats file name
+    and an ``X-Profile-Summary`` header giving the time spent in each code category.
+    A single request is profiled at a time: concurrent requests are served without profiling.
+
+    :param str directory: The directory where stats are stored
+        (defaults to a private temporary directory created on the first profiled request)
+    :param str token: The secret value of the ``header`` triggering profiling.
+        Header triggering is disabled if not set.
+    :param str header: The request header triggering profiling
+    :param float sample_rate: The probability, between 0 and 1, of a request to be profiled
+    :param int top: The number of hottest functions reported
+    '''
+    def __init__(self, directory=None, token=None, header='X-Profile', sample_rate=0, top=20):
+        self.directory = directory
+        self.token = token
+        self.header = header
+        self.sample_rate = sample_rate
+        self.top = top
+
+    def should_profile(self):
+        '''Whether the current request should be profiled'''
+        if self.token:
+            value = request.headers.get(self.header)
+            if value and hmac.compare_digest(value.encode('utf8'), self.token.encode('utf8')):
+                return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def run(self, func, *args, **kwargs):
+        '''
+        Run a function under the profiler and store the resulting stats.
+
+        Stats are also stored if the function raises an exception.
+        The function is run without profiling if another profile is running.
+
+        :returns: a 2-tuple ``(result, report)``, ``report`` being ``None`` if not profiled
+        '''
+        if not _running.acquire(False):
+            return func(*args, **kwargs), None
+        try:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiling tool is active
+                return func(*args, **kwargs), None
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                profile.disable()
+                self.report(profile)
+                raise
+            profile.disable()
+            return result, self.report(profile)
+        finally:
+            _running.release()
+
+    def report(self, profile):
+        '''
+        Store the stats of a profile and summarize them
+
+        :param cProfile.Profile profile: the profile to report
+        :rtype: ProfileReport
+        '''
+        stats = pstats.Stats(profile, stream=io.StringIO())
+        profile_id = '{0}-{1}-{2}'.format(
+            time.strftime('%Y%m%d%H%M%S'),
+            (request.endpoint or 'unknown').replace(os.sep, '_'),
+            uuid.uuid4().hex[:8],
+        )
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix='flask-restplus-profiles-')
+        elif not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        path = os.path.join(self.directory, profile_id + '.prof')
+        stats.dump_stats(path)
+
+        totals = dict((category, 0) for category in (RESTPLUS, USER, LIBRARY))
+        functions = []
+        for (filename, lineno, name), (cc, nc, tt, ct, callers) in stats.stats.items():
+            category = categorize(filename)
+            totals[category] += tt
+            functions.append((category, '{0}:{1}({2})'.format(filename, lineno, name), tt, ct, nc))
+        functions.sort(key=lambda f: f[2], reverse=True)
+        report = ProfileReport(profile_id, path, totals, functions[:self.top])
+
+        with io.open(os.path.join(self.directory, profile_id + '.json'), 'w', encoding='utf8') as out:
+            out.write(six.text_type(json.dumps(report._asdict(), indent=2)))
+        return report
+
+    @staticmethod
+    def summary(report):
+        '''
+        Format a report totals as a ``X-Profile-Summary`` header value
+
+        :param ProfileReport report: the report to summarize
+        :rtype: str
+        '''
+        return ', '.join('{0};dur={1:.3f}'.format(category, report.totals[category] * 1000)
+                         for category in (RESTPLUS, USER, LIBRARY))
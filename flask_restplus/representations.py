@@ -6,7 +6,15 @@ try:
 except ImportError:
     from json import dumps
 
-from flask import make_response, current_app
+from flask import make_response, current_app, request
+
+from .utils import LRUCache
+
+#: The maximum number of distinct negotiations kept in cache
+NEGOTIATION_CACHE_SIZE = 256
+
+_negotiations = LRUCache(NEGOTIATION_CACHE_SIZE)
+_MISSING = object()
 
 
 def output_json(data, code, headers=None):
@@ -27,3 +35,22 @@ def output_json(data, code, headers=None):
     resp = make_response(dumped, code)
     resp.headers.extend(headers or {})
     return resp
+
+
+def best_match(representations, default=None):
+    '''
+    Negotiate the response mediatype for the current request.
+
+    Results are cached by raw ``Accept`` header and representations
+    as most clients only send a handful of distinct ``Accept`` headers.
+
+    :param representations: the available mediatypes (any iterable, dict keys are used)
+    :param str default: the mediatype to return if there is no match
+    :returns str: the best matching mediatype or ``default``
+    '''
+    key = (request.headers.get('Accept'), tuple(representations), default)
+    mediatype = _negotiations.get(key, _MISSING)
+    if mediatype is _MISSING:
+        mediatype = request.accept_mimetypes.best_match(key[1], default=default)
+        _negotiations.set(key, mediatype)
+    return mediatype
@@ -16,6 +16,7 @@ from werkzeug import exceptions
 
 from .errors import abort, SpecsError
 from .marshalling import marshal
+from .metrics import phase
 from .model import Model
 from ._http import HTTPStatus
 
@@ -347,29 +348,30 @@ class RequestParser(object):
         :return: the parsed results as :class:`ParseResult` (or any class defined as :attr:`result_class`)
         :rtype: ParseResult
         '''
-        if req is None:
-            req = request
-
-        result = self.result_class()
-
-        # A record of arguments not yet parsed; as each is found
-        # among self.args, it will be popped out
-        req.unparsed_arguments = dict(self.argument_class('').source(req)) if strict else {}
-        errors = {}
-        for arg in self.args:
-            value, found = arg.parse(req, self.bundle_errors)
-            if isinstance(value, ValueError):
-                errors.update(found)
-                found = None
-            if found or arg.store_missing:
-                result[arg.dest or arg.name] = value
-        if errors:
-            abort(HTTPStatus.BAD_REQUEST, 'Input payload validation failed', errors=errors)
-
-        if strict and req.unparsed_arguments:
-            arguments = ', '.join(req.unparsed_arguments.keys())
-            msg = 'Unknown arguments: {0}'.format(arguments)
-            raise exceptions.BadRequest(msg)
+        with phase('parse'):
+            if req is None:
+                req = request
+
+            result = self.result_class()
+
+            # A record of arguments not yet parsed; as each is found
+            # among self.args, it will be popped out
+            req.unparsed_arguments = dict(self.argument_class('').source(req)) if strict else {}
+            errors = {}
+            for arg in self.args:
+                value, found = arg.parse(req, self.bundle_errors)
+                if isinstance(value, ValueError):
+                    errors.update(found)
+                    found = None
+                if found or arg.store_missing:
+                    result[arg.dest or arg.name] = value
+            if errors:
+                abort(HTTPStatus.BAD_REQUEST, 'Input payload validation failed', errors=errors)
+
+            if strict and req.unparsed_arguments:
+                arguments = ', '.join(req.unparsed_arguments.keys())
+                msg = 'Unknown arguments: {0}'.format(arguments)
+                raise exceptions.BadRequest(msg)
 
         return result
 
@@ -1,14 +1,38 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+import threading
+
+from collections import namedtuple
+
+import six
+
 from flask import request
 from flask.views import MethodView
 from werkzeug.wrappers import BaseResponse
 
+from .metrics import phase
 from .model import ModelBase
-
+from .representations import best_match
 from .utils import unpack
 
+#: A per-method dispatch plan resolved once: the decorated handler,
+#: the validation flag and the expected ``(model, collection)`` payloads
+DispatchPlan = namedtuple('DispatchPlan', 'func validate expects')
+
+
+def _expected_models(doc):
+    '''The ``(model, collection)`` payloads expected by a handler documentation'''
+    expects = []
+    for expect in doc.get('expect', []):
+        # TODO: handle third party handlers
+        if isinstance(expect, list) and len(expect) == 1:
+            if isinstance(expect[0], ModelBase):
+                expects.append((expect[0], True))
+        if isinstance(expect, ModelBase):
+            expects.append((expect, False))
+    return expects
+
 
 class Resource(MethodView):
     '''
@@ -21,42 +45,168 @@ class Resource(MethodView):
     Otherwise the appropriate method is called and passed all arguments
     from the url rule used when adding the resource to an Api instance.
     See :meth:`~flask_restplus.Api.add_resource` for details.
+
+    Dispatch is planned once per HTTP method (See :meth:`dispatch_plan`).
+    ``method_decorators`` are applied to the bound handler once per instance:
+    as a new instance serves each request by default, resources with ``method_decorators``
+    only save their decoration and planning on every request when ``shared_instance`` is set.
+
+    Set ``coalesce`` to ``True`` (or to a callable returning extra key parts)
+    to share the response of identical concurrent ``GET`` requests.
+    See :meth:`~flask_restplus.Api.coalesce` for details.
+
+    Set ``etag`` to ``True`` (or to a callable returning the resource version)
+    and/or ``last_modified`` to a callable returning the last modification date
+    to support conditional ``GET`` requests.
+    ``etag`` defaults to the :class:`~flask_restplus.Namespace` one.
+    See :meth:`~flask_restplus.Api.conditional` for details.
+
+    Set ``shared_instance`` to ``True`` to serve all requests with a single instance
+    (See :meth:`as_shared_view`).
     '''
 
     representations = None
     method_decorators = []
+    coalesce = False
+    etag = None
+    last_modified = None
+    shared_instance = False
 
     def __init__(self, api=None, *args, **kwargs):
         self.api = api
 
-    def dispatch_request(self, *args, **kwargs):
-        # Taken from flask
-        meth = getattr(self, request.method.lower(), None)
-        if meth is None and request.method == 'HEAD':
-            meth = getattr(self, 'get', None)
-        assert meth is not None, 'Unimplemented method %r' % request.method
+    @classmethod
+    def as_shared_view(cls, name, *class_args, **class_kwargs):
+        '''
+        Converts the class into a view function like :meth:`~flask.views.View.as_view`
+        but a single instance, created on first dispatch, serves all the requests.
+
+        This saves the instance allocation and initialization on every request
+        but the resource must not store any per-request state on ``self``
+        as it may be used concurrently by many threads.
 
-        for decorator in self.method_decorators:
-            meth = decorator(meth)
+        The arguments passed to :meth:`as_shared_view` are forwarded to the
+        constructor of the class.
+        '''
+        lock = threading.Lock()
+        instances = []
+
+        def view(*args, **kwargs):
+            if not instances:
+                with lock:
+                    if not instances:
+                        instances.append(view.view_class(*class_args, **class_kwargs))
+            return instances[0].dispatch_request(*args, **kwargs)
+
+        if cls.decorators:
+            view.__name__ = name
+            view.__module__ = cls.__module__
+            for decorator in cls.decorators:
+                view = decorator(view)
+
+        view.view_class = cls
+        view.__name__ = name
+        view.__doc__ = cls.__doc__
+        view.__module__ = cls.__module__
+        view.methods = cls.methods
+        view.provide_automatic_options = cls.provide_automatic_options
+        return view
 
-        self.validate_payload(meth)
+    def dispatch_request(self, *args, **kwargs):
+        name = request.method.lower()
+        if name == 'head' and getattr(self, 'head', None) is None:
+            name = 'get'
+
+        if name in self.__dict__:
+            # Handlers set on the instance can't be planned ahead
+            plan = self._build_dispatch_plan(self.__dict__[name], self.method_decorators, type(self))
+        elif self.method_decorators:
+            plan = self._instance_plan(name)
+        else:
+            plan = self.dispatch_plan(name)
+            args = (self,) + args
+
+        if plan.expects is None:
+            with phase('validate'):
+                self.validate_payload(plan.func)
+        elif plan.expects:
+            validate = plan.validate if plan.validate is not None else self.api._validate
+            if validate:
+                with phase('validate'):
+                    for expect, collection in plan.expects:
+                        self.__validate_payload(expect, collection=collection)
 
-        resp = meth(*args, **kwargs)
+        with phase('handler'):
+            resp = plan.func(*args, **kwargs)
 
         if isinstance(resp, BaseResponse):
             return resp
 
-        representations = self.representations or {}
+        representations = self.representations
+        if not representations:
+            return resp
 
-        mediatype = request.accept_mimetypes.best_match(representations, default=None)
+        mediatype = best_match(representations)
         if mediatype in representations:
             data, code, headers = unpack(resp)
-            resp = representations[mediatype](data, code, headers)
+            with phase('serialize'):
+                resp = representations[mediatype](data, code, headers)
             resp.headers['Content-Type'] = mediatype
             return resp
 
         return resp
 
+    @classmethod
+    def dispatch_plan(cls, method):
+        '''
+        Get the dispatch plan for a given HTTP method.
+
+        The plan is resolved once per resource class and method:
+        expected payloads are extracted from the handler documentation.
+        It is used by resources without ``method_decorators``,
+        which are applied to the bound handler of each instance instead.
+
+        :param str method: the lowercased HTTP method name
+        :rtype: DispatchPlan
+        '''
+        plans = cls.__dict__.get('_dispatch_plans')
+        if plans is None:
+            plans = {}
+            cls._dispatch_plans = plans
+        plan = plans.get(method)
+        if plan is None:
+            func = getattr(cls, method, None)
+            assert func is not None, 'Unimplemented method %r' % method.upper()
+            plan = plans[method] = cls._build_dispatch_plan(func, (), cls)
+        return plan
+
+    def _instance_plan(self, method):
+        '''The dispatch plan of this instance decorated bound handler for a given HTTP method'''
+        plans = self.__dict__.get('_instance_plans')
+        if plans is None:
+            plans = self._instance_plans = {}
+        plan = plans.get(method)
+        if plan is None:
+            func = getattr(self, method, None)
+            assert func is not None, 'Unimplemented method %r' % method.upper()
+            plan = plans[method] = self._build_dispatch_plan(func, self.method_decorators, type(self))
+        return plan
+
+    @staticmethod
+    def _build_dispatch_plan(func, decorators, cls):
+        for decorator in decorators:
+            func = decorator(func)
+
+        validate_payload = six.get_unbound_function(cls.validate_payload)
+        if validate_payload is not six.get_unbound_function(Resource.validate_payload):
+            # Custom validation can't be planned ahead
+            return DispatchPlan(func, None, None)
+
+        doc = getattr(func, '__apidoc__', False)
+        if doc is False:
+            return DispatchPlan(func, None, [])
+        return DispatchPlan(func, doc.get('validate', None), _expected_models(doc))
+
     def __validate_payload(self, expect, collection=False):
         '''
         :param ModelBase expect: the expected model for the input payload
@@ -65,12 +215,14 @@ class Resource(MethodView):
         '''
         # TODO: proper content negotiation
         data = request.get_json()
+        # The API specifications are only built if some references can't be inlined
+        resolver = self.api.refresolver if expect.requires_resolver else None
         if collection:
             data = data if isinstance(data, list) else [data]
             for obj in data:
-                expect.validate(obj, self.api.refresolver, self.api.format_checker)
+                expect.validate(obj, resolver, self.api.format_checker)
         else:
-            expect.validate(data, self.api.refresolver, self.api.format_checker)
+            expect.validate(data, resolver, self.api.format_checker)
 
     def validate_payload(self, func):
         '''Perform a payload validation on expected model if necessary'''
@@ -79,10 +231,5 @@ class Resource(MethodView):
             validate = doc.get('validate', None)
             validate = validate if validate is not None else self.api._validate
             if validate:
-                for expect in doc.get('expect', []):
-                    # TODO: handle third party handlers
-                    if isinstance(expect, list) and len(expect) == 1:
-                        if isinstance(expect[0], ModelBase):
-                            self.__validate_payload(expect[0], collection=True)
-                    if isinstance(expect, ModelBase):
-                        self.__validate_payload(expect, collection=False)
+                for expect, collection in _expected_models(doc):
+                    self.__validate_payload(expect, collection=collection)
@@ -9,14 +9,12 @@ from __future__ import unicode_literals
 
 import io
 import json
-import pkg_resources
 
 try:
     from collections.abc import Mapping
 except ImportError:
     # TODO Remove this to drop Python2 support
     from collections import Mapping
-from jsonschema import Draft4Validator
 
 from flask_restplus import errors
 
@@ -49,11 +47,11 @@ class LazySchema(Mapping):
     A thin wrapper around schema file lazy loading the data on first access
 
     :param filename str: The package relative json schema filename
-    :param validator: The jsonschema validator class version
+    :param validator: The jsonschema validator class version (defaults to ``Draft4Validator``)
 
     .. versionadded:: 0.12.1
     '''
-    def __init__(self, filename, validator=Draft4Validator):
+    def __init__(self, filename, validator=None):
         super(LazySchema, self).__init__()
         self.filename = filename
         self._schema = None
@@ -61,6 +59,8 @@ class LazySchema(Mapping):
 
     def _load(self):
         if not self._schema:
+            # Imported on first use as it is slow to import
+            import pkg_resources
             filename = pkg_resources.resource_filename(__name__, self.filename)
             with io.open(filename) as infile:
                 self._schema = json.load(infile)
@@ -80,6 +80,10 @@ class LazySchema(Mapping):
     @property
     def validator(self):
         '''The jsonschema validator to validate against'''
+        if self._validator is None:
+            # Imported on first use to keep the package import fast
+            from jsonschema import Draft4Validator
+            self._validator = Draft4Validator
         return self._validator(self)
 
 
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+'''
+Indexed "did you mean" suggestions for unmatched URLs.
+
+.. versionadded:: 0.13.1
+'''
+from __future__ import unicode_literals
+
+import difflib
+import heapq
+import re
+import threading
+
+from collections import defaultdict
+
+from .utils import LRUCache
+
+__all__ = ('RuleIndex',)
+
+
+RE_RULES = re.compile('(<.*>)')
+
+#: The default maximum number of rules compared to a path
+DEFAULT_CANDIDATES = 100
+
+#: The default maximum number of cached suggestions
+DEFAULT_CACHE_SIZE = 1024
+
+#: The default maximum number of rules sharing an indexed trigram
+DEFAULT_MAX_POSTINGS = 1000
+
+#: The default maximum number of indexed rules visited to score a path
+DEFAULT_BUDGET = 10000
+
+#: The :func:`difflib.get_close_matches` default cutoff
+CUTOFF = 0.6
+
+
+def trigrams(value):
+    '''Extract the set of 3-characters sequences of a string'''
+    return set(value[i:i + 3] for i in range(max(len(value) - 2, 1)))
+
+
+class RuleIndex(object):
+    '''
+    A precomputed index of an URL map rules used to suggest close matches for unknown paths.
+
+    Rules are stored with their variables stripped and indexed by trigrams
+    so only the ``candidates`` rules sharing the most trigrams with a path
+    are compared with :mod:`difflib`.
+    Maps with no more rules than ``candidates`` give the exact same suggestions
+    as a comparison against every rule.
+
+    Trigrams shared by more than ``max_postings`` rules are too common to tell rules apart
+    and are not indexed, and scoring a path visits at most ``budget`` indexed rules
+    (starting with its rarest trigrams) so the lookup cost does not grow with the number of rules.
+
+    :param url_map: the :class:`~werkzeug.routing.Map` to index
+    :param int candidates: the maximum number of rules compared to a given path
+    :param int cache_size: the maximum number of paths for which suggestions are cached
+    :param int max_postings: the maximum number of rules sharing an indexed trigram
+    :param int budget: the maximum number of indexed rules visited to score a path
+    '''
+    def __init__(self, url_map, candidates=DEFAULT_CANDIDATES, cache_size=DEFAULT_CACHE_SIZE,
+                 max_postings=DEFAULT_MAX_POSTINGS, budget=DEFAULT_BUDGET):
+        self.url_map = url_map
+        self.candidates = candidates
+        self.max_postings = max_postings
+        self.budget = budget
+        self.cache = LRUCache(cache_size)
+        self._lock = threading.Lock()
+        self._size = None
+        self.rules = {}
+        self.index = {}
+        self.max_length = 0
+
+    @property
+    def stale(self):
+        '''Whether rules have been added to the map since the index has been built'''
+        return self._size != len(self.url_map._rules)
+
+    def build(self):
+        '''(Re)build the index from the current URL map rules'''
+        with self._lock:
+            rules = {}
+            for rule in self.url_map.iter_rules():
+                rules[RE_RULES.sub('', rule.rule)] = rule.rule
+            index = defaultdict(list)
+            for stripped in rules:
+                for gram in trigrams(stripped):
+                    index[gram].append(stripped)
+            self.rules = rules
+            self.index = dict(
+                (gram, tuple(stripped)) for gram, stripped in index.items()
+                if len(stripped) <= self.max_postings
+            )
+            self.max_length = max([len(s) for s in rules] or [0])
+            self._size = len(self.url_map._rules)
+            self.cache.clear()
+
+    def suggest(self, path):
+        '''
+        Find the rules close to a given path
+
+        :param str path: the requested path
+        :returns list: the matching rules, best match first
+        '''
+        if self.stale:
+            self.build()
+        matches = self.cache.get(path)
+        if matches is None:
+            matches = [self.rules[m] for m in self._close_matches(path)]
+            self.cache.set(path, matches)
+        return matches
+
+    def _close_matches(self, path):
+        # A path more than (2 / cutoff - 1) times longer than any rule can't reach the cutoff ratio
+        if len(path) * CUTOFF > (2 - CUTOFF) * self.max_length:
+            return []
+        if len(self.rules) <= self.candidates:
+            candidates = self.rules.keys()
+        else:
+            scores = defaultdict(int)
+            budget = self.budget
+            # Rarest trigrams first: they are the most discriminating and the cheapest to visit
+            postings = sorted((self.index[g] for g in trigrams(path) if g in self.index), key=len)
+            for posting in postings:
+                for stripped in posting[:budget]:
+                    scores[stripped] += 1
+                budget -= len(posting)
+                if budget <= 0:
+                    break
+            candidates = heapq.nsmallest(self.candidates, scores, key=lambda s: (-scores[s], s))
+        return difflib.get_close_matches(path, candidates, cutoff=CUTOFF)
@@ -4,6 +4,8 @@ from __future__ import unicode_literals, absolute_import
 import itertools
 import re
 
+from collections import namedtuple
+from copy import deepcopy
 from inspect import isclass, getdoc
 try:
     from collections.abc import OrderedDict, Hashable
@@ -18,13 +20,13 @@ from werkzeug.routing import parse_rule
 from . import fields
 from .model import Model, ModelBase
 from .reqparse import RequestParser
-from .utils import merge, not_none, not_none_sorted
+from .utils import merge, not_none, not_none_sorted, LRUCache
 from ._http import HTTPStatus
 
 try:
-    from urllib.parse import quote
+    from urllib.parse import quote, unquote
 except ImportError:
-    from urllib import quote
+    from urllib import quote, unquote
 
 #: Maps Flask/Werkzeug rooting types to Swagger ones
 PATH_TYPES = {
@@ -51,6 +53,25 @@ DEFAULT_RESPONSE = {'description': DEFAULT_RESPONSE_DESCRIPTION}
 
 RE_RAISES = re.compile(r'^:raises\s+(?P<name>[\w\d_]+)\s*:\s*(?P<description>.*)$', re.MULTILINE)
 
+#: The maximum number of cached parsed docstrings and URL patterns path parameters
+DOC_CACHE_SIZE = 4096
+
+_docstrings = LRUCache(DOC_CACHE_SIZE)
+_path_params = LRUCache(DOC_CACHE_SIZE)
+
+#: Specifications keys whose values are mappings keyed by user-defined names
+NAMED_MAPPINGS = ('paths', 'definitions', 'properties', 'responses', 'headers', 'securityDefinitions', 'scopes')
+
+#: Specifications keys removed from minimal specifications
+MINIFIED_KEYS = ('description', 'example', 'examples')
+
+#: Specifications keys whose values are user data, kept as is in minimal specifications
+LITERAL_KEYS = ('default', 'enum')
+
+#: A namespace specifications fragment: its serialized ``paths``
+#: and the names of the ``models`` they reference
+SpecFragment = namedtuple('SpecFragment', 'paths models')
+
 
 def ref(model):
     '''Return a reference to model in definitions'''
@@ -74,7 +95,18 @@ def extract_path_params(path):
     '''
     Extract Flask-style parameters from an URL pattern as Swagger ones.
     '''
+    params = _path_params.get(path)
+    if params is None:
+        params, static = _extract_path_params(path)
+        if static:
+            # Only cache patterns which don't depend on the application converters
+            _path_params.set(path, params)
+    return OrderedDict((name, dict(param)) for name, param in iteritems(params))
+
+
+def _extract_path_params(path):
     params = OrderedDict()
+    static = True
     for converter, arguments, variable in parse_rule(path):
         if not converter:
             continue
@@ -88,10 +120,44 @@ def extract_path_params(path):
             param['type'] = PATH_TYPES[converter]
         elif converter in current_app.url_map.converters:
             param['type'] = 'string'
+            static = False
         else:
             raise ValueError('Unsupported type converter: %s' % converter)
         params[variable] = param
-    return params
+    return params, static
+
+
+def _copy_doc(value):
+    '''
+    Copy a documentation structure.
+
+    Dictionaries, lists and tuples are copied recursively
+    while other values (models, parsers, fields...) are shared.
+    '''
+    if type(value) in (dict, OrderedDict):
+        return type(value)((k, _copy_doc(v)) for k, v in iteritems(value))
+    elif type(value) in (list, tuple):
+        return type(value)(_copy_doc(v) for v in value)
+    return value
+
+
+def merge_doc(first, second):
+    '''
+    Recursively merges two documentation dictionaries like :func:`~flask_restplus.utils.merge`
+    but without deep-copying the documented models, parsers and fields.
+    '''
+    if not isinstance(second, dict):
+        return second
+    result = _copy_doc(first)
+    if result is first:
+        # Merging into a dict subclass (ie. a model): keep the historical behavior
+        result = deepcopy(first)
+    for key, value in iteritems(second):
+        if key in result and isinstance(result[key], dict):
+            result[key] = merge_doc(result[key], value)
+        else:
+            result[key] = _copy_doc(value)
+    return result
 
 
 def _param_to_header(param):
@@ -117,6 +183,24 @@ def _clean_header(header):
 
 
 def parse_docstring(obj):
+    '''
+    Parse an object docstring.
+
+    Results are cached per object (and docstring).
+    '''
+    try:
+        key = (obj, getattr(obj, '__doc__', None))
+        parsed = _docstrings.get(key)
+    except TypeError:
+        # Unhashable object
+        return _parse_docstring(obj)
+    if parsed is None:
+        parsed = _parse_docstring(obj)
+        _docstrings.set(key, parsed)
+    return dict(parsed, params=[], raises=dict(parsed['raises']))
+
+
+def _parse_docstring(obj):
     raw = getdoc(obj)
     summary = raw.strip(' \n').split('\n')[0].split('.')[0] if raw else None
     raises = {}
@@ -147,6 +231,98 @@ def is_hidden(resource, route_doc=None):
         return hasattr(resource, "__apidoc__") and resource.__apidoc__ is False
 
 
+def _references(value, found=None):
+    '''Collect the ``$ref`` targets found in a specifications structure'''
+    found = [] if found is None else found
+    if isinstance(value, dict):
+        for key, item in iteritems(value):
+            if key == '$ref' and isinstance(item, string_types):
+                found.append(item)
+            else:
+                _references(item, found)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _references(item, found)
+    return found
+
+
+def select_tags(specs, tags):
+    '''
+    Restrict specifications to the operations having at least one of the given tags.
+
+    Only the definitions and responses referenced by the selected operations are kept.
+
+    :param dict specs: the full specifications
+    :param list tags: the tags (namespaces names) to keep
+    :rtype: dict
+    '''
+    tags = set(tags)
+    paths = OrderedDict()
+    for path, item in iteritems(specs.get('paths') or {}):
+        operations = OrderedDict(
+            (key, operation) for key, operation in iteritems(item)
+            if key != 'parameters' and tags.intersection(operation.get('tags', ()))
+        )
+        if operations:
+            if 'parameters' in item:
+                operations['parameters'] = item['parameters']
+            paths[path] = operations
+
+    sources = {
+        'definitions': specs.get('definitions') or {},
+        'responses': specs.get('responses') or {},
+    }
+    selected = {'definitions': {}, 'responses': {}}
+    pending = _references(paths)
+    while pending:
+        kind, _, name = pending.pop()[len('#/'):].partition('/')
+        name = unquote(name)
+        if kind not in sources or name in selected[kind] or name not in sources[kind]:
+            continue
+        selected[kind][name] = sources[kind][name]
+        _references(sources[kind][name], pending)
+
+    result = dict(specs)
+    result['paths'] = paths
+    result['tags'] = [tag for tag in specs.get('tags', []) if tag['name'] in tags]
+    result['definitions'] = selected['definitions'] or None
+    result['responses'] = selected['responses'] or None
+    return not_none(result)
+
+
+def minify(specs):
+    '''
+    Strip descriptions and examples from specifications.
+
+    Responses descriptions are required by the Swagger specification and are emptied instead.
+
+    :param dict specs: the specifications to minify
+    :rtype: dict
+    '''
+    return _minify(specs)
+
+
+_RESPONSE = object()
+
+
+def _minify(value, key=None):
+    if isinstance(value, dict):
+        if key in NAMED_MAPPINGS:
+            # Keys are names (properties, definitions, response codes...), never stripped
+            child = _RESPONSE if key == 'responses' else None
+            return type(value)((name, _minify(item, child)) for name, item in iteritems(value))
+        result = type(value)(
+            (name, item if name in LITERAL_KEYS else _minify(item, name))
+            for name, item in iteritems(value) if name not in MINIFIED_KEYS
+        )
+        if key is _RESPONSE and '$ref' not in result:
+            result['description'] = ''
+        return result
+    elif isinstance(value, (list, tuple)):
+        return [_minify(item) for item in value]
+    return value
+
+
 class Swagger(object):
     '''
     A Swagger documentation wrapper for an API instance.
@@ -154,6 +330,7 @@ class Swagger(object):
     def __init__(self, api):
         self.api = api
         self._registered_models = {}
+        self._references = None
 
     def as_dict(self):
         '''
@@ -191,17 +368,10 @@ class Swagger(object):
         responses = self.register_errors()
 
         for ns in self.api.namespaces:
-            for resource, urls, route_doc, kwargs in ns.resources:
-                for url in self.api.ns_urls(ns, urls):
-                    path = extract_path(url)
-                    serialized = self.serialize_resource(
-                        ns,
-                        resource,
-                        url,
-                        route_doc=route_doc,
-                        **kwargs
-                    )
-                    paths[path] = serialized
+            fragment = self.namespace_fragment(ns)
+            paths.update(fragment.paths)
+            for name in fragment.models:
+                self.register_model(name)
 
         # merge in the top-level authorizations
         for ns in self.api.namespaces:
@@ -226,6 +396,49 @@ class Swagger(object):
         }
         return not_none(specs)
 
+    def namespace_fragment(self, ns):
+        '''
+        Output the specification fragment of a namespace.
+
+        Fragments are cached on the API and only rebuilt when the namespace
+        or the documentation of its resources change.
+
+        :param Namespace ns: the namespace to serialize
+        :rtype: SpecFragment
+        '''
+        key = (
+            ns._version,
+            self.api.ns_paths.get(ns),
+            self.api._spec_version,
+            current_app.config.get('RESTPLUS_MASK_SWAGGER'),
+            current_app.config.get('RESTPLUS_MASK_HEADER'),
+        )
+        cached = self.api._spec_fragments.get(ns)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Serialize in isolation to know which models this namespace references
+        registered, self._registered_models = self._registered_models, {}
+        self._references = []
+        try:
+            paths = {}
+            for resource, urls, route_doc, kwargs in ns.resources:
+                for url in self.api.ns_urls(ns, urls):
+                    path = extract_path(url)
+                    paths[path] = self.serialize_resource(
+                        ns,
+                        resource,
+                        url,
+                        route_doc=route_doc,
+                        **kwargs
+                    )
+            fragment = SpecFragment(paths, tuple(self._references))
+        finally:
+            self._registered_models = registered
+            self._references = None
+        self.api._spec_fragments[ns] = (key, fragment)
+        return fragment
+
     def get_host(self):
         hostname = current_app.config.get('SERVER_NAME', None) or None
         if hostname and self.api.blueprint and self.api.blueprint.subdomain:
@@ -269,7 +482,7 @@ class Swagger(object):
         route_doc = {} if route_doc is None else route_doc
         if route_doc is False:
             return False
-        doc = merge(getattr(resource, '__apidoc__', {}), route_doc)
+        doc = merge_doc(getattr(resource, '__apidoc__', {}), route_doc)
         if doc is False:
             return False
 
@@ -281,8 +494,8 @@ class Swagger(object):
             else resource.__name__
         )
 
-        params = merge(self.expected_params(doc), doc.get('params', OrderedDict()))
-        params = merge(params, extract_path_params(url))
+        params = merge_doc(self.expected_params(doc), doc.get('params', OrderedDict()))
+        params = merge_doc(params, extract_path_params(url))
         # Track parameters for late deduplication
         up_params = {(n, p.get('in', 'query')): p for n, p in params.items()}
         need_to_go_down = set()
@@ -294,13 +507,13 @@ class Swagger(object):
                 method_impl = method_impl.im_func
             elif hasattr(method_impl, '__func__'):
                 method_impl = method_impl.__func__
-            method_doc = merge(method_doc, getattr(method_impl, '__apidoc__', OrderedDict()))
+            method_doc = merge_doc(method_doc, getattr(method_impl, '__apidoc__', OrderedDict()))
             if method_doc is not False:
                 method_doc['docstring'] = parse_docstring(method_impl)
                 method_params = self.expected_params(method_doc)
-                method_params = merge(method_params, method_doc.get('params', {}))
+                method_params = merge_doc(method_params, method_doc.get('params', {}))
                 inherited_params = OrderedDict((k, v) for k, v in iteritems(params) if k in method_params)
-                method_doc['params'] = merge(inherited_params, method_params)
+                method_doc['params'] = merge_doc(inherited_params, method_params)
                 for name, param in method_doc['params'].items():
                     key = (name, param.get('in', 'query'))
                     if key in up_params:
@@ -390,8 +603,24 @@ class Swagger(object):
                 continue
             path[method] = self.serialize_operation(doc, method)
             path[method]['tags'] = [ns.name]
+            if method == 'get':
+                self.document_conditional(ns, resource, path[method]['responses'])
         return not_none(path)
 
+    def document_conditional(self, ns, resource, responses):
+        '''Document the conditional requests headers on the successful ``GET`` response'''
+        etag = getattr(resource, 'etag', None)
+        etag = etag if etag is not None else ns.etag
+        last_modified = getattr(resource, 'last_modified', None)
+        if not (etag or last_modified):
+            return
+        response = responses.setdefault(str(HTTPStatus.OK.value), DEFAULT_RESPONSE.copy())
+        headers = response.setdefault('headers', {})
+        if etag:
+            headers.setdefault('ETag', _clean_header('The resource entity tag'))
+        if last_modified:
+            headers.setdefault('Last-Modified', _clean_header('The resource last modification date'))
+
     def serialize_operation(self, doc, method):
         operation = {
             'responses': self.responses_for(doc, method) or None,
@@ -580,6 +809,11 @@ class Swagger(object):
 
     def register_model(self, model):
         name = model.name if isinstance(model, ModelBase) else model
+        if name in self._registered_models:
+            # Already registered with its parents and nested models during this walk
+            return ref(model)
+        if self._references is not None:
+            self._references.append(name)
         if name not in self.api.models:
             raise ValueError('Model {0} not registered'.format(name))
         specs = self.api.models[name]
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+'''
+Rate limiting and sampling of logged exceptions.
+
+.. versionadded:: 0.13.1
+'''
+from __future__ import unicode_literals
+
+import random
+import threading
+import time
+
+__all__ = ('TokenBucket', 'LogThrottle')
+
+
+clock = getattr(time, 'monotonic', time.time)
+
+
+class TokenBucket(object):
+    '''
+    A token bucket allowing ``rate`` events per second with bursts of up to ``capacity`` events.
+
+    :param float rate: The number of tokens added per second
+    :param float capacity: The maximum number of tokens (defaults to ``rate``, at least 1)
+    '''
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1))
+        self.tokens = self.capacity
+        self.timestamp = clock()
+
+    def consume(self):
+        '''
+        Take a token from the bucket if there is any left.
+
+        :returns bool: ``True`` if a token has been consumed
+        '''
+        now = clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.timestamp) * self.rate)
+        self.timestamp = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class LogThrottle(object):
+    '''
+    Decide which exceptions are logged, per exception type.
+
+    Exceptions are first sampled with a ``sample_rate`` probability
+    and then rate limited by a :class:`TokenBucket` per exception type.
+
+    :param float rate: The maximum number of logged exceptions per second and per type.
+        ``None`` disables rate limiting.
+    :param float burst: The maximum number of exceptions logged at once per type (defaults to ``rate``)
+    :param float sample_rate: The probability, between 0 and 1, for a given exception to be logged
+    '''
+    def __init__(self, rate=None, burst=None, sample_rate=1.0):
+        self.rate = rate
+        self.burst = burst
+        self.sample_rate = sample_rate
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._logged = {}
+        self._suppressed = {}
+        self._pending = {}
+
+    def allow(self, key):
+        '''
+        Check if an exception should be logged
+
+        :param key: the exception identifier, usually its type
+        :returns: a 2-tuple ``(allowed, suppressed)``, ``suppressed`` being the number of
+            exceptions for ``key`` suppressed since the last one allowed
+        '''
+        sampled = self.sample_rate >= 1 or random.random() < self.sample_rate
+        with self._lock:
+            if sampled and self.rate is not None:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = TokenBucket(self.rate, self.burst)
+                sampled = bucket.consume()
+            if not sampled:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                self._pending[key] = self._pending.get(key, 0) + 1
+                return False, 0
+            self._logged[key] = self._logged.get(key, 0) + 1
+            return True, self._pending.pop(key, 0)
+
+    @property
+    def stats(self):
+        '''
+        Logging statistics per key
+
+        :returns dict: the ``logged`` and ``suppressed`` counts for each key
+        '''
+        with self._lock:
+            return dict(
+                (key, {'logged': self._logged.get(key, 0), 'suppressed': self._suppressed.get(key, 0)})
+                for key in set(self._logged) | set(self._suppressed)
+            )
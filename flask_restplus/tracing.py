@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+'''
+Tracing hooks and ``Server-Timing`` header for request phases.
+
+Phases timed with :class:`~flask_restplus.metrics.phase` are reported
+to a :class:`Tracer` as spans.
+
+.. versionadded:: 0.13.1
+'''
+from __future__ import unicode_literals
+
+__all__ = ('Tracer', 'OpenTelemetryTracer', 'server_timing')
+
+
+class Tracer(object):
+    '''
+    The interface request phases are reported to as spans.
+
+    Subclass it to adapt your tracing library.
+    '''
+    def start(self, endpoint, method, phase):
+        '''
+        Called when a phase starts
+
+        :param str endpoint: the request endpoint
+        :param str method: the request HTTP method
+        :param str phase: the phase name
+        :returns: a span object given back to :meth:`end`
+        '''
+        raise NotImplementedError()
+
+    def end(self, span, error=None):
+        '''
+        Called when a phase ends
+
+        :param span: the span object returned by :meth:`start`
+        :param Exception error: the exception raised during the phase if any
+        '''
+        raise NotImplementedError()
+
+
+class OpenTelemetryTracer(Tracer):
+    '''
+    A :class:`Tracer` adapter for OpenTelemetry-like tracers.
+
+    Each phase is a span made current with ``tracer.start_as_current_span()``
+    so spans created by your own code during a phase are nested into it.
+
+    >>> from opentelemetry import trace
+    >>> api = Api(app, tracer=OpenTelemetryTracer(trace.get_tracer(__name__)))
+
+    :param tracer: the tracer providing ``start_as_current_span()``
+    :param str prefix: the spans names prefix
+    '''
+    def __init__(self, tracer, prefix='restplus.'):
+        self.tracer = tracer
+        self.prefix = prefix
+
+    def start(self, endpoint, method, phase):
+        attributes = {
+            'restplus.endpoint': endpoint,
+            'restplus.phase': phase,
+            'http.method': method,
+        }
+        manager = self.tracer.start_as_current_span(self.prefix + phase, attributes=attributes)
+        manager.__enter__()
+        return manager
+
+    def end(self, span, error=None):
+        if error is None:
+            span.__exit__(None, None, None)
+        else:
+            span.__exit__(type(error), error, getattr(error, '__traceback__', None))
+
+
+def server_timing(timings):
+    '''
+    Format phases timings as a ``Server-Timing`` header value
+
+    :param list timings: the ``(phase, seconds)`` pairs
+    :rtype: str
+    '''
+    return ', '.join('{0};dur={1:.3f}'.format(name, seconds * 1000) for name, seconds in timings)
@@ -2,6 +2,7 @@
 from __future__ import unicode_literals
 
 import re
+import threading
 
 try:
     from collections.abc import OrderedDict
@@ -18,7 +19,7 @@ FIRST_CAP_RE = re.compile('(.)([A-Z][a-z]+)')
 ALL_CAP_RE = re.compile('([a-z0-9])([A-Z])')
 
 
-__all__ = ('merge', 'camel_to_dash', 'default_id', 'not_none', 'not_none_sorted', 'unpack')
+__all__ = ('merge', 'camel_to_dash', 'default_id', 'not_none', 'not_none_sorted', 'unpack', 'LRUCache')
 
 
 def merge(first, second):
@@ -119,3 +120,54 @@ def unpack(response, default_code=HTTPStatus.OK):
         return data, code or default_code, headers
     else:
         raise ValueError('Too many response values')
+
+
+class LRUCache(object):
+    '''
+    A minimal thread-safe bounded cache discarding the least recently used items first.
+
+    :param int maxsize: The maximum number of items to keep
+    '''
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        '''
+        Get a cached value
+
+        :param key: the cache key
+        :param default: the value returned on cache miss
+        '''
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                return default
+            self._data[key] = value
+            return value
+
+    def set(self, key, value):
+        '''
+        Store a value, evicting the least recently used one if necessary
+
+        :param key: the cache key
+        :param value: the value to cache
+        '''
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        '''Remove all cached values'''
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
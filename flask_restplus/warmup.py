@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+'''
+Eager construction of the lazily built state, before forking workers.
+
+.. versionadded:: 0.13.1
+'''
+from __future__ import unicode_literals
+
+import gc
+import inspect
+import logging
+import time
+
+from collections import namedtuple
+
+from flask import current_app
+
+from . import schemas
+from .model import ModelBase
+from .resource import Resource
+
+__all__ = ('warmup', 'WarmupStep')
+
+log = logging.getLogger(__name__)
+
+clock = getattr(time, 'perf_counter', time.time)
+
+#: A warmup step report: its ``name``, the number of items ``built`` and the time it took in ``seconds``
+WarmupStep = namedtuple('WarmupStep', 'name built seconds')
+
+
+def warmup(api, app, freeze=False):
+    '''
+    Build an API lazily built state: resources dispatch plans and lazy views,
+    resolved models and their schemas, 404 suggestions index, Swagger specifications,
+    their references resolver, models validators and the OpenAPI schema.
+
+    See :meth:`Api.warmup`.
+
+    :param Api api: the API to warm up
+    :param flask.Flask app: the application the API is registered on
+    :param bool freeze: move all the objects to the permanent generation with :func:`gc.freeze`
+        (Python >= 3.7) so garbage collections in forked workers don't touch the shared memory pages
+    :returns list: the :class:`WarmupStep` reports
+    '''
+    steps = []
+
+    def step(name, func):
+        start = clock()
+        built = func()
+        steps.append(WarmupStep(name, built, clock() - start))
+
+    with app.test_request_context():
+        step('dispatch_plans', lambda: _dispatch_plans(api))
+        if api.lazy_views:
+            step('views', lambda: _views(api))
+        step('models', lambda: _models(api))
+        if current_app.config.get('ERROR_404_HELP', True):
+            step('suggestions', lambda: _suggestions(api))
+        step('specs', lambda: _specs(api))
+        step('refresolver', lambda: int(api.refresolver is not None))
+        step('validators', lambda: _validators(api))
+        step('oas_schema', lambda: len(schemas.OAS_20))
+
+    if freeze and hasattr(gc, 'freeze'):
+        start = clock()
+        gc.collect()
+        gc.freeze()
+        steps.append(WarmupStep('gc_freeze', gc.get_freeze_count(), clock() - start))
+
+    for report in steps:
+        log.debug('Warmup %s: %d built in %.3fs', report.name, report.built, report.seconds)
+    return steps
+
+
+def _dispatch_plans(api):
+    built = 0
+    for ns in api.namespaces:
+        for route in ns.resources:
+            # Plain Flask method views have no dispatch plans
+            if not (inspect.isclass(route.resource) and issubclass(route.resource, Resource)):
+                continue
+            for method in route.resource.methods or ():
+                route.resource.dispatch_plan(method.lower())
+                built += 1
+    return built
+
+
+def _views(api):
+    built = 0
+    for view in api._lazy_views:
+        if not view.built:
+            view.build()
+            built += 1
+    return built
+
+
+def _models(api):
+    built = 0
+    for model in list(api.models.values()):
+        if isinstance(model, ModelBase):
+            # Builds the fields schemas too
+            model.__schema__
+            getattr(model, 'resolved', None)
+            built += 1
+    return built
+
+
+def _validators(api):
+    built = 0
+    for model in list(api.models.values()):
+        if isinstance(model, ModelBase):
+            model.get_validator(api.refresolver if model.requires_resolver else None, api.format_checker)
+            built += 1
+    return built
+
+
+def _suggestions(api):
+    index = api._get_rule_index()
+    index.build()
+    return len(index.rules)
+
+
+def _specs(api):
+    specs = api.__schema__
+    if 'error' in specs:
+        return 0
+    return len(specs.get('paths', {}))
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals, absolute_import
 
+import gzip
 import os
+import shutil
 import sys
 
 from datetime import datetime
@@ -187,6 +189,30 @@ def assets(ctx):
         # Until next release we need to install droid sans separately
         ctx.run('cp node_modules/typeface-droid-sans/index.css flask_restplus/static/droid-sans.css')
         ctx.run('cp -R node_modules/typeface-droid-sans/files flask_restplus/static/')
+        precompress(os.path.join(ROOT, 'flask_restplus', 'static'))
+
+
+#: The text assets extensions worth precompressing
+COMPRESSIBLE = ('.css', '.js', '.map', '.html', '.svg')
+
+
+def precompress(directory):
+    '''Write gzip (and brotli if available) variants of the text assets'''
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+        info('brotli is not installed: only gzip variants are built')
+    for root, dirs, files in os.walk(directory):
+        for filename in files:
+            if not filename.endswith(COMPRESSIBLE):
+                continue
+            path = os.path.join(root, filename)
+            with open(path, 'rb') as src, gzip.GzipFile(path + '.gz', 'wb', 9, mtime=0) as out:
+                shutil.copyfileobj(src, out)
+            if brotli:
+                with open(path, 'rb') as src, open(path + '.br', 'wb') as out:
+                    out.write(brotli.compress(src.read()))
 
 
 @task
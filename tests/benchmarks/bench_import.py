@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+import pytest
+
+#: Modules which should only be imported on first use
+LAZY_MODULES = ('jsonschema', 'pkg_resources', 'pytz', 'aniso8601')
+
+
+def import_time(module='flask_restplus'):
+    '''
+    Import a module in a fresh interpreter with ``-X importtime``
+
+    :returns int: the cumulative import time of the module in microseconds
+    '''
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', 'import {0}'.format(module)],
+        stderr=subprocess.STDOUT,
+    ).decode('utf8')
+    for line in output.splitlines():
+        parts = [p.strip() for p in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise ValueError('No import time for {0}'.format(module))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='-X importtime requires Python 3.7+')
+@pytest.mark.benchmark(group='import')
+class ImportBenchmark(object):
+    '''
+    ``import flask_restplus`` cost in a fresh interpreter.
+
+    The cumulative import time reported by ``-X importtime`` is stored in ``extra_info``.
+    '''
+    def bench_import(self, benchmark):
+        times = []
+
+        def run():
+            times.append(import_time())
+
+        benchmark.pedantic(run, rounds=10)
+        times.sort()
+        benchmark.extra_info['flask_restplus_us'] = times[len(times) // 2]
+        benchmark.extra_info['flask_us'] = import_time('flask')
+
+    def bench_lazy_modules(self, benchmark):
+        code = 'import sys, flask_restplus; print(",".join(m for m in {0!r} if m in sys.modules))'.format(
+            LAZY_MODULES)
+        output = benchmark.pedantic(subprocess.check_output, args=([sys.executable, '-c', code],), rounds=1)
+        assert output.decode('utf8').strip() == ''
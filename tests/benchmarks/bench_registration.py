@@ -0,0 +1,63 @@
+import pytest
+
+from flask import Flask
+
+from flask_restplus import Api, Namespace, Resource
+
+NAMESPACES = 80
+ROUTES = 1500
+
+api_doc = Namespace('doc').doc(params={'id': 'An item identifier'})
+
+
+def build_resources(size=ROUTES, namespaces=NAMESPACES):
+    '''Build a synthetic large API resources: ``(namespace name, resource, url)`` tuples'''
+    resources = []
+    for i in range(size):
+
+        class ItemResource(Resource):
+            @api_doc
+            def get(self, id):
+                '''Get an item given its identifier'''
+                pass
+
+            def put(self, id):
+                '''Update an item given its identifier'''
+                pass
+
+        ItemResource.__name__ = str('Item')
+        resources.append(('ns{0}'.format(i % namespaces), ItemResource, '/items{0}/<int:id>'.format(i)))
+    return resources
+
+
+def register(resources, bulk=False, lazy_views=False):
+    app = Flask(__name__)
+    api = Api(app, lazy_views=lazy_views)
+    by_ns = {}
+    for name, resource, url in resources:
+        by_ns.setdefault(name, []).append((resource, url))
+    for name, routes in by_ns.items():
+        ns = api.namespace(name)
+        if bulk:
+            ns.add_resources(routes)
+        else:
+            for resource, url in routes:
+                ns.add_resource(resource, url)
+    return api
+
+
+@pytest.mark.benchmark(group='registration')
+class RegistrationBenchmark(object):
+    '''
+    Startup cost of registering a synthetic large API
+    (1500 routes with colliding default endpoints across 80 namespaces).
+    '''
+    def bench_add_resource(self, benchmark):
+        benchmark.pedantic(register, setup=lambda: ((build_resources(),), {}), rounds=5)
+
+    def bench_add_resources(self, benchmark):
+        benchmark.pedantic(register, setup=lambda: ((build_resources(),), {'bulk': True}), rounds=5)
+
+    def bench_add_resources_lazy_views(self, benchmark):
+        benchmark.pedantic(register, setup=lambda: ((build_resources(),), {'bulk': True, 'lazy_views': True}),
+                           rounds=5)
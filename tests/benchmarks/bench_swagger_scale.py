@@ -0,0 +1,67 @@
+import pytest
+
+from flask_restplus import fields, Api, Resource
+from flask_restplus.swagger import Swagger
+
+
+def build_api(size):
+    api = Api()
+
+    person = api.model('Person', {
+        'name': fields.String,
+        'age': fields.Integer
+    })
+
+    family = api.model('Family', {
+        'name': fields.String,
+        'father': fields.Nested(person),
+        'mother': fields.Nested(person),
+        'children': fields.List(fields.Nested(person))
+    })
+
+    parser = api.parser()
+    parser.add_argument('q', help='A query')
+
+    for i in range(size):
+        ns = api.namespace('ns{0}'.format(i // 50))
+
+        @ns.response(404, 'Family not found')
+        class FamilyResource(Resource):
+            @ns.expect(parser)
+            @ns.marshal_with(family)
+            def get(self, id):
+                '''
+                Get a family given its identifier
+
+                :raises FamilyNotFound: if the family does not exist
+                '''
+                pass
+
+            @ns.expect(family)
+            @ns.response(201, 'Family updated', family)
+            def put(self, id):
+                '''Update a family given its identifier'''
+                pass
+
+        FamilyResource.__name__ = str('Family{0}'.format(i))
+        ns.add_resource(FamilyResource, '/families{0}/<int:id>'.format(i))
+    return api
+
+
+def swagger_specs(app, api):
+    with app.test_request_context('/'):
+        return Swagger(api).as_dict()
+
+
+@pytest.mark.benchmark(group='swagger-scale')
+class SwaggerScaleBenchmark(object):
+    '''
+    Swagger generation cost for an increasing number of resources.
+
+    Cost per resource should remain roughly constant.
+    '''
+    @pytest.mark.parametrize('size', [10, 100, 1000])
+    def bench_swagger_specs(self, app, benchmark, size):
+        api = build_api(size)
+        api.init_app(app)
+        benchmark(swagger_specs, app, api)
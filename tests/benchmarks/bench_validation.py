@@ -0,0 +1,52 @@
+import pytest
+
+from jsonschema import RefResolver
+
+from flask_restplus import fields, Model
+from flask_restplus.swagger import ref
+
+person = Model('Person', {
+    'name': fields.String(required=True),
+    'age': fields.Integer,
+})
+
+family = Model('Family', {
+    'name': fields.String(required=True),
+    'father': fields.Nested(person),
+    'mother': fields.Nested(person),
+    'children': fields.List(fields.Nested(person)),
+})
+
+#: Equivalent to the specifications resolver of an API registering these models
+resolver = RefResolver.from_schema({
+    'definitions': dict((model.name, model.__schema__) for model in (person, family)),
+})
+
+payload = {
+    'name': 'Doe',
+    'father': {'name': 'John', 'age': 42},
+    'mother': {'name': 'Jane', 'age': 41},
+    'children': [{'name': 'Jim', 'age': 12}, {'name': 'Jill', 'age': 9}],
+}
+
+
+def validate_with_resolver():
+    from jsonschema import Draft4Validator
+    Draft4Validator({'$ref': ref(family)['$ref']}, resolver=resolver).validate(payload)
+
+
+def validate_inlined():
+    family.validate(payload)
+
+
+@pytest.mark.benchmark(group='validation')
+class ValidationBenchmark(object):
+    '''
+    Nested payload validation, resolving references through the specifications
+    versus validating against the cached inlined schema.
+    '''
+    def bench_validate_with_resolver(self, benchmark):
+        benchmark(validate_with_resolver)
+
+    def bench_validate_inlined(self, benchmark):
+        benchmark(validate_inlined)
@@ -154,3 +154,27 @@ class ErrorsTest(object):
 
         res = client.get('/test/', headers=[('Accept', 'text/plain')])
         assert res.status_code == 500
+
+
+class NegotiationTest(object):
+    def test_best_match_is_cached(self, app):
+        from flask_restplus import representations
+
+        representations._negotiations.clear()
+        mediatypes = ['application/json', 'application/xml']
+        with app.test_request_context('/', headers={'Accept': 'application/xml'}):
+            assert representations.best_match(mediatypes) == 'application/xml'
+            key = ('application/xml', tuple(mediatypes), None)
+            assert representations._negotiations.get(key) == 'application/xml'
+            # Ensure the cached value is used
+            representations._negotiations.set(key, 'application/cached')
+            assert representations.best_match(mediatypes) == 'application/cached'
+        representations._negotiations.clear()
+
+    def test_best_match_depends_on_representations_and_default(self, app):
+        from flask_restplus import representations
+
+        with app.test_request_context('/', headers={'Accept': 'text/plain'}):
+            assert representations.best_match(['application/json']) is None
+            assert representations.best_match(['application/json'], 'application/json') == 'application/json'
+            assert representations.best_match(['application/json', 'text/plain']) == 'text/plain'
@@ -2,11 +2,14 @@
 from __future__ import unicode_literals
 
 import copy
+import pytest
 
-from flask import url_for, Blueprint
+from flask import Flask, url_for, Blueprint
 
 import flask_restplus as restplus
 
+from flask_restplus import cors
+
 
 class APITest(object):
     def test_root_endpoint(self, app):
@@ -337,3 +340,127 @@ class APITest(object):
         assert decorator1.called is True
         assert decorator2.called is True
         assert decorator3.called is True
+
+    def test_many_default_endpoints(self, app):
+        api = restplus.Api(app)
+
+        class TestResource(restplus.Resource):
+            pass
+
+        for i in range(5):
+            api.add_resource(TestResource, '/test{0}/'.format(i))
+
+        with app.test_request_context():
+            assert url_for('test_resource') == '/test0/'
+            assert url_for('test_resource_2') == '/test1/'
+            assert url_for('test_resource_5') == '/test4/'
+
+    def test_add_resources(self, app, client):
+        api = restplus.Api(app)
+        ns = api.namespace('ns')
+
+        class Foo(restplus.Resource):
+            def get(self):
+                return 'foo'
+
+        class Bar(restplus.Resource):
+            def get(self, id=None):
+                return 'bar'
+
+        ns.add_resources([
+            (Foo, '/foo'),
+            (Bar, ['/bar', '/bar/<int:id>'], {'endpoint': 'bar'}),
+        ])
+
+        assert [r.resource for r in ns.resources] == [Foo, Bar]
+        with app.test_request_context():
+            assert url_for('ns_foo') == '/ns/foo'
+            assert url_for('bar') == '/ns/bar'
+            assert url_for('bar', id=1) == '/ns/bar/1'
+        assert client.get_json('/ns/bar/1') == 'bar'
+
+    def test_add_resources_lazy(self, app):
+        api = restplus.Api()
+
+        class Foo(restplus.Resource):
+            pass
+
+        api.add_resources([(Foo, '/foo'), (Foo, '/foo2')])
+        api.init_app(app)
+
+        with app.test_request_context():
+            assert url_for('foo') == '/foo'
+            assert url_for('foo_2') == '/foo2'
+
+    def test_add_resources_endpoint_conflict(self, app):
+        api = restplus.Api(app)
+
+        class Foo(restplus.Resource):
+            pass
+
+        class Bar(restplus.Resource):
+            pass
+
+        api.add_resource(Foo, '/foo', endpoint='foo')
+
+        with pytest.raises(ValueError) as excinfo:
+            api.add_resources([(Bar, '/bar', {'endpoint': 'bar'}), (Bar, '/foo2', {'endpoint': 'foo'})])
+
+        assert 'foo (Foo and Bar)' in str(excinfo.value)
+        assert 'bar' not in app.view_functions
+        assert 'bar' not in api.endpoints
+        assert Bar not in [r.resource for r in api.default_namespace.resources]
+
+    def test_lazy_views(self, app, client):
+        api = restplus.Api(app, lazy_views=True)
+
+        class Foo(restplus.Resource):
+            def get(self):
+                return 'foo'
+
+        api.add_resource(Foo, '/foo', endpoint='foo')
+        view = app.view_functions['foo']
+
+        assert view.view_class is Foo
+        assert not view.built
+        assert '_dispatch_plans' not in Foo.__dict__
+
+        assert client.get_json('/foo') == 'foo'
+        assert view.built
+        assert 'get' in Foo.__dict__['_dispatch_plans']
+
+    def test_lazy_views_decorators(self, app, client, mocker):
+        decorator = mocker.Mock(side_effect=lambda f: f)
+        api = restplus.Api(app, lazy_views=True, decorators=[decorator])
+
+        class Foo(restplus.Resource):
+            def get(self):
+                return 'foo'
+
+        calls = decorator.call_count
+        api.add_resource(Foo, '/foo', endpoint='foo')
+        assert decorator.call_count == calls + 1
+        assert not api._lazy_views[-1].built
+
+        client.get('/foo')
+        client.get('/foo')
+        assert decorator.call_count == calls + 1
+        assert api._lazy_views[-1].built
+
+    def test_lazy_views_decorators_applied_on_registration(self):
+        responses = []
+        for lazy_views in (False, True):
+            app = Flask(__name__)
+            api = restplus.Api(app, lazy_views=lazy_views, decorators=[cors.crossdomain(origin='*')])
+
+            @api.route('/foo', endpoint='foo')
+            class Foo(restplus.Resource):
+                def get(self):
+                    return 'foo'
+
+            client = app.test_client()
+            response = client.open('/foo', method='OPTIONS')
+            responses.append((response.status_code, sorted(response.allow),
+                              response.headers.get('Access-Control-Allow-Origin')))
+
+        assert responses[0] == responses[1]
@@ -8,6 +8,8 @@ from werkzeug.routing import BuildError
 
 import flask_restplus as restplus
 
+from flask_restplus import apidoc
+
 
 class APIDocTest(object):
     def test_default_apidoc_on_root(self, app, client):
@@ -148,3 +150,104 @@ class APIDocTest(object):
 
         response = client.get(url_for('root'))
         assert response.status_code == 404
+
+    def test_apidoc_page_cached(self, app, client, mocker):
+        restplus.Api(app, version='1.0')
+        render = mocker.spy(apidoc, '_render')
+
+        first = client.get(url_for('doc'))
+        second = client.get(url_for('doc'))
+
+        assert first.data == second.data
+        assert render.call_count == 1
+
+    def test_apidoc_page_not_cached_in_debug(self, app, client, mocker):
+        app.debug = True
+        restplus.Api(app, version='1.0')
+        render = mocker.spy(apidoc, '_render')
+
+        client.get(url_for('doc'))
+        client.get(url_for('doc'))
+
+        assert render.call_count == 2
+
+
+@pytest.fixture
+def static(tmpdir, monkeypatch):
+    tmpdir.join('swagger-ui.css').write('body { margin: 0; }')
+    tmpdir.join('swagger-ui.css.gz').write_binary(b'gzipped')
+    tmpdir.join('swagger-ui.css.br').write_binary(b'brotli')
+    tmpdir.join('favicon-16x16.png').write_binary(b'png')
+    monkeypatch.setattr(apidoc.apidoc, 'static_folder', str(tmpdir))
+    return tmpdir
+
+
+class APIDocStaticTest(object):
+    def test_swagger_static_hashed_url(self, app, static):
+        restplus.Api(app)
+
+        url = apidoc.swagger_static('swagger-ui.css')
+
+        assert url == '/swaggerui/swagger-ui.css?v={0}'.format(apidoc.static_hash(str(static.join('swagger-ui.css'))))
+
+    def test_swagger_static_missing_file(self, app, static):
+        restplus.Api(app)
+
+        assert apidoc.swagger_static('missing.js') == '/swaggerui/missing.js'
+
+    def test_static_hash_changes_with_content(self, static):
+        path = static.join('swagger-ui.css')
+        first = apidoc.static_hash(str(path))
+        path.write('body { margin: 1px; }')
+        path.setmtime(path.mtime() + 10)
+
+        assert apidoc.static_hash(str(path)) != first
+
+    def test_immutable_cache_with_hash(self, app, client, static):
+        restplus.Api(app)
+
+        response = client.get(apidoc.swagger_static('swagger-ui.css'), headers={'Accept-Encoding': 'identity'})
+
+        assert response.status_code == 200
+        assert response.headers['Cache-Control'] == apidoc.IMMUTABLE
+        assert response.data == b'body { margin: 0; }'
+        assert 'Content-Encoding' not in response.headers
+
+    def test_no_immutable_cache_without_matching_hash(self, app, client, static):
+        restplus.Api(app)
+
+        response = client.get('/swaggerui/swagger-ui.css?v=outdated', headers={'Accept-Encoding': 'identity'})
+
+        assert response.status_code == 200
+        assert 'immutable' not in response.headers.get('Cache-Control', '')
+
+    @pytest.mark.parametrize('accept,encoding,data', [
+        ('gzip, deflate, br', 'br', b'brotli'),
+        ('gzip, deflate', 'gzip', b'gzipped'),
+    ])
+    def test_precompressed(self, app, client, static, accept, encoding, data):
+        restplus.Api(app)
+
+        response = client.get('/swaggerui/swagger-ui.css', headers={'Accept-Encoding': accept})
+
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == encoding
+        assert response.content_type.startswith('text/css')
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert response.data == data
+
+    def test_not_precompressed(self, app, client, static):
+        restplus.Api(app)
+
+        response = client.get('/swaggerui/favicon-16x16.png', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.status_code == 200
+        assert 'Content-Encoding' not in response.headers
+        assert response.content_type == 'image/png'
+
+    def test_missing_static(self, app, client, static):
+        restplus.Api(app)
+
+        response = client.get('/swaggerui/missing.js')
+
+        assert response.status_code == 404
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import io
+import threading
+import time
+
+import pytest
+
+from flask import Response, make_response, send_file
+
+import flask_restplus as restplus
+
+from flask_restplus.coalescing import SingleFlight
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.time() + timeout
+    while not predicate():
+        if time.time() > deadline:
+            raise AssertionError('Timeout')
+        time.sleep(0.001)
+
+
+class SingleFlightTest(object):
+    def test_single_call(self):
+        group = SingleFlight()
+        assert group.do('key', lambda: 42) == (42, False)
+        assert group.stats == {'executed': 1, 'coalesced': 0, 'in_flight': 0}
+
+    def test_concurrent_calls_are_coalesced(self):
+        group = SingleFlight()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def compute():
+            calls.append(1)
+            release.wait()
+            return 'result'
+
+        def run():
+            results.append(group.do('key', compute))
+
+        threads = [threading.Thread(target=run) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: group.stats['coalesced'] == 2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert sorted(results) == [('result', False), ('result', True), ('result', True)]
+        assert group.stats == {'executed': 1, 'coalesced': 2, 'in_flight': 0}
+
+    def test_distinct_keys_are_not_coalesced(self):
+        group = SingleFlight()
+        assert group.do('a', lambda: 'a') == ('a', False)
+        assert group.do('b', lambda: 'b') == ('b', False)
+        assert group.stats['executed'] == 2
+
+    def test_errors_are_shared(self):
+        group = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def compute():
+            release.wait()
+            raise ValueError('boom')
+
+        def run():
+            try:
+                group.do('key', compute)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: group.stats['coalesced'] == 1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(errors) == 2
+        assert errors[0] is errors[1]
+        assert group.stats['in_flight'] == 0
+
+
+class CoalescingTest(object):
+    def test_identical_requests_are_coalesced(self, app):
+        api = restplus.Api(app)
+        release = threading.Event()
+        calls = []
+
+        @api.route('/test/')
+        class TestResource(restplus.Resource):
+            coalesce = True
+
+            def get(self):
+                calls.append(1)
+                release.wait()
+                return {'value': len(calls)}
+
+        responses = []
+
+        def run():
+            with app.test_client() as client:
+                responses.append(client.get('/test/'))
+
+        threads = [threading.Thread(target=run) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: api.coalescing.stats['coalesced'] == 1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert [r.status_code for r in responses] == [200, 200]
+        assert responses[0].data == responses[1].data
+        assert responses[0] is not responses[1]
+
+    @pytest.mark.parametrize('headers', [{'X-Fields': 'value'}, {'Accept': 'application/xml'}])
+    def test_key_discriminants(self, app, client, headers):
+        api = restplus.Api(app)
+
+        @api.representation('application/xml')
+        def xml(data, code, headers):
+            return app.response_class(str(data), code, headers)
+
+        @api.route('/test/<int:id>')
+        class TestResource(restplus.Resource):
+            coalesce = True
+
+            def get(self, id):
+                return {'value': id}
+
+        keys = []
+        original = api.coalescing.do
+
+        def spy(key, *args, **kwargs):
+            keys.append(key)
+            return original(key, *args, **kwargs)
+
+        api.coalescing.do = spy
+        client.get('/test/1')
+        client.get('/test/1?q=1')
+        client.get('/test/2')
+        client.get('/test/1', headers=headers)
+
+        assert len(set(keys)) == 4
+
+    def test_custom_key(self, app, client):
+        api = restplus.Api(app)
+        keys = []
+
+        @api.route('/test/')
+        class TestResource(restplus.Resource):
+            coalesce = staticmethod(lambda: 'user')
+
+            def get(self):
+                return {}
+
+        original = api.coalescing.do
+
+        def spy(key, *args, **kwargs):
+            keys.append(key)
+            return original(key, *args, **kwargs)
+
+        api.coalescing.do = spy
+        client.get('/test/')
+
+        assert keys[0][-1] == 'user'
+
+    @pytest.mark.parametrize('kind', ['streamed', 'passthrough', 'cookie'])
+    def test_unshareable_responses_are_not_coalesced(self, app, kind):
+        api = restplus.Api(app)
+        release = threading.Event()
+        calls = []
+
+        @api.route('/test/')
+        class TestResource(restplus.Resource):
+            coalesce = True
+
+            def get(self):
+                calls.append(1)
+                release.wait()
+                if kind == 'streamed':
+                    return Response(iter([b'chunk', b'chunk']))
+                elif kind == 'passthrough':
+                    return send_file(io.BytesIO(b'content'), mimetype='text/plain')
+                response = make_response('content')
+                response.set_cookie('session', str(len(calls)))
+                return response
+
+        responses = []
+
+        def run():
+            with app.test_client() as client:
+                response = client.get('/test/')
+                responses.append((response.get_data(), response.headers.get('Set-Cookie')))
+
+        threads = [threading.Thread(target=run) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: api.coalescing.stats['coalesced'] == 1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 2
+        expected = b'chunkchunk' if kind == 'streamed' else b'content'
+        assert [data for data, _ in responses] == [expected, expected]
+        if kind == 'cookie':
+            assert sorted(cookie.split(';')[0] for _, cookie in responses) == ['session=1', 'session=2']
+
+    def test_unsafe_methods_are_not_coalesced(self, app, client):
+        api = restplus.Api(app)
+
+        @api.route('/test/')
+        class TestResource(restplus.Resource):
+            coalesce = True
+
+            def post(self):
+                return {}
+
+        client.post('/test/')
+
+        assert api.coalescing.stats['executed'] == 0
+
+    def test_disabled_by_default(self, app, client):
+        api = restplus.Api(app)
+
+        @api.route('/test/')
+        class TestResource(restplus.Resource):
+            def get(self):
+                return {}
+
+        client.get('/test/')
+
+        assert api.coalescing.stats['executed'] == 0
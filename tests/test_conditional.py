@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from datetime import datetime
+
+import flask_restplus as restplus
+
+
+class ConditionalTest(object):
+    def test_etag_from_body(self, app, client):
+        api = restplus.Api(app)
+
+        @api.route('/test/')
+        class TestResource(restplus.Resource):
+            etag = True
+
+            def get(self):
+                return {'key': 'value'}
+
+        response = client.get('/test/')
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+        assert etag
+
+        response = client.get('/test/', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+
+        response = client.get('/test/', headers={'If-None-Match': '"other"'})
+        assert response.status_code == 200
+
+    def test_etag_from_version_skips_handler(self, app, client):
+        api = restplus.Api(app)
+        calls = []
+
+        @api.route('/test/<int:id>')
+        class TestResource(restplus.Resource):
+            etag = staticmethod(lambda id: 'v{0}'.format(id))
+
+            def get(self, id):
+                calls.append(id)
+                return {'id': id}
+
+        response = client.get('/test/1')
+        assert response.status_code == 200
+        assert response.headers['ETag'] == '"v1"'
+        assert calls == [1]
+
+        response = client.get('/test/1', headers={'If-None-Match': '"v1"'})
+        assert response.status_code == 304
+        assert response.headers['ETag'] == '"v1"'
+        assert calls == [1]
+
+        response = client.get('/test/2', headers={'If-None-Match': '"v1"'})
+        assert response.status_code == 200
+        assert calls == [1, 2]
+
+    def test_etag_from_integer_version(self, app, client):
+        api = restplus.Api(app)
+
+        @api.route('/test/')
+        class TestResource(restplus.Resource):
+            etag = staticmethod(lambda: 42)
+
+            def get(self):
+                return {}
+
+        response = client.get('/test/')
+        assert response.status_code == 200
+        assert response.headers['ETag'] == '"42"'
+
+        response = client.get('/test/', headers={'If-None-Match': '"42"'})
+        assert response.status_code == 304
+        assert response.headers['ETag'] == '"42"'
+
+    def test_last_modified(self, app, client):
+        api = restplus.Api(app)
+        modified = datetime(2019, 1, 1, 12, 0, 0)
+
+        @api.route('/test/')
+        class TestResource(restplus.Resource):
+            last_modified = staticmethod(lambda: modified)
+
+            def get(self):
+                return {}
+
+        response = client.get('/test/')
+        assert response.status_code == 200
+        assert response.headers['Last-Modified'] == 'Tue, 01 Jan 2019 12:00:00 GMT'
+        assert 'ETag' not in response.headers
+
+        response = client.get('/test/', headers={'If-Modified-Since': 'Tue, 01 Jan 2019 12:00:00 GMT'})
+        assert response.status_code == 304
+
+        response = client.get('/test/', headers={'If-Modified-Since': 'Mon, 31 Dec 2018 12:00:00 GMT'})
+        assert response.status_code == 200
+
+    def test_etag_from_namespace(self, app, client):
+        api = restplus.Api(app)
+        ns = api.namespace('ns', etag=True)
+
+        @ns.route('/test/')
+        class TestResource(restplus.Resource):
+            def get(self):
+                return {}
+
+        @ns.route('/disabled/')
+        class DisabledResource(restplus.Resource):
+            etag = False
+
+            def get(self):
+                return {}
+
+        assert 'ETag' in client.get('/ns/test/').headers
+        assert 'ETag' not in client.get('/ns/disabled/').headers
+
+    def test_disabled_by_default(self, app, client):
+        api = restplus.Api(app)
+
+        @api.route('/test/')
+        class TestResource(restplus.Resource):
+            def get(self):
+                return {}
+
+        assert 'ETag' not in client.get('/test/').headers
+
+    def test_errors_and_unsafe_methods_are_not_tagged(self, app, client):
+        api = restplus.Api(app)
+
+        @api.route('/test/')
+        class TestResource(restplus.Resource):
+            etag = True
+
+            def get(self):
+                return {}, 201
+
+            def post(self):
+                return {}
+
+        assert 'ETag' not in client.get('/test/').headers
+        assert 'ETag' not in client.post('/test/').headers
+
+    def test_documented_headers(self, app, client):
+        api = restplus.Api(app)
+
+        @api.route('/test/')
+        class TestResource(restplus.Resource):
+            etag = True
+            last_modified = staticmethod(lambda: None)
+
+            @api.response(404, 'Not found')
+            def get(self):
+                return {}
+
+            def post(self):
+                return {}
+
+        data = client.get_specs()
+        responses = data['paths']['/test/']['get']['responses']
+        assert 'ETag' in responses['200']['headers']
+        assert 'Last-Modified' in responses['200']['headers']
+        assert 'headers' not in responses['404']
+        assert 'headers' not in data['paths']['/test/']['post']['responses']['200']
+        assert '__apidoc__' not in TestResource.__dict__
+
+    def test_documented_headers_by_namespace(self, app, client):
+        api = restplus.Api(app)
+        tagged = api.namespace('tagged', etag=True)
+        untagged = api.namespace('untagged')
+
+        class TestResource(restplus.Resource):
+            def get(self):
+                return {}
+
+        tagged.add_resource(TestResource, '/test/')
+        untagged.add_resource(TestResource, '/test/')
+
+        data = client.get_specs()
+        assert 'ETag' in data['paths']['/tagged/test/']['get']['responses']['200']['headers']
+        assert 'headers' not in data['paths']['/untagged/test/']['get']['responses']['200']
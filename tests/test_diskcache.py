@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import json
+
+from flask import Flask
+
+import flask_restplus as restplus
+
+from flask_restplus.diskcache import fingerprint, cached_specs
+
+
+def create_api(app, doc='Get people', extra_field=False, tags=None, etag=None):
+    api = restplus.Api(app, title='Test', tags=tags)
+    ns = api.namespace('people', etag=etag)
+    fields = {'name': restplus.fields.String(description='The name')}
+    if extra_field:
+        fields['age'] = restplus.fields.Integer
+    model = ns.model('Person', fields)
+
+    @ns.route('/')
+    class People(restplus.Resource):
+        @ns.marshal_with(model)
+        def get(self):
+            return {}
+
+    People.get.__doc__ = doc
+    return api
+
+
+def fingerprint_of(**kwargs):
+    app = Flask(__name__)
+    app.config.update(kwargs.pop('config', {}))
+    api = create_api(app, **kwargs)
+    with app.test_request_context():
+        return fingerprint(api)
+
+
+class FingerprintTest(object):
+    def test_stable(self):
+        assert fingerprint_of() == fingerprint_of()
+
+    def test_docstring_changes(self):
+        assert fingerprint_of(doc='Get people') != fingerprint_of(doc='List people')
+
+    def test_model_changes(self):
+        assert fingerprint_of() != fingerprint_of(extra_field=True)
+
+    def test_parser_changes(self):
+        app = Flask(__name__)
+        api = restplus.Api(app)
+        parser = api.parser()
+        parser.add_argument('q', help='A query')
+
+        @api.route('/search/')
+        class Search(restplus.Resource):
+            @api.expect(parser)
+            def get(self):
+                return {}
+
+        with app.test_request_context():
+            before = fingerprint(api)
+            parser.add_argument('limit', type=int, default=10)
+            assert fingerprint(api) != before
+
+    def test_settings_changes(self):
+        assert fingerprint_of() != fingerprint_of(config={'SERVER_NAME': 'api.example.com'})
+
+    def test_tags_changes(self):
+        assert fingerprint_of(tags=['a']) != fingerprint_of(tags=['b'])
+
+    def test_conditional_changes(self):
+        assert fingerprint_of() != fingerprint_of(etag=True)
+
+    def test_namespace_changes(self):
+        app = Flask(__name__)
+        api = create_api(app)
+        with app.test_request_context():
+            before = fingerprint(api)
+            api.namespace('other')
+            assert fingerprint(api) != before
+
+
+class CachedSpecsTest(object):
+    def test_build_and_store(self, app, tmpdir, mocker):
+        api = create_api(app)
+        build = mocker.Mock(return_value={'swagger': '2.0', 'paths': {}})
+
+        with app.test_request_context():
+            specs = cached_specs(api, str(tmpdir), build)
+            key = fingerprint(api)
+
+        assert specs == {'swagger': '2.0', 'paths': {}}
+        assert build.call_count == 1
+        assert json.loads(tmpdir.join('api', key + '.json').read()) == specs
+
+    def test_load(self, app, tmpdir, mocker):
+        api = create_api(app)
+        build = mocker.Mock(return_value={'swagger': '2.0', 'paths': {}})
+
+        with app.test_request_context():
+            cached_specs(api, str(tmpdir), build)
+
+        other_app = Flask(__name__)
+        other = create_api(other_app)
+        with other_app.test_request_context():
+            specs = cached_specs(other, str(tmpdir), build)
+
+        assert specs == {'swagger': '2.0', 'paths': {}}
+        assert build.call_count == 1
+
+    def test_replace_outdated(self, tmpdir, mocker):
+        build = mocker.Mock(return_value={'swagger': '2.0', 'paths': {}})
+        for doc in 'Get people', 'List people':
+            app = Flask(__name__)
+            api = create_api(app, doc=doc)
+            with app.test_request_context():
+                cached_specs(api, str(tmpdir), build)
+                key = fingerprint(api)
+
+        assert build.call_count == 2
+        assert tmpdir.join('api').listdir() == [tmpdir.join('api', key + '.json')]
+
+    def test_unreadable(self, app, tmpdir, mocker):
+        api = create_api(app)
+        build = mocker.Mock(return_value={'swagger': '2.0'})
+        with app.test_request_context():
+            tmpdir.mkdir('api').join(fingerprint(api) + '.json').write('{not json')
+
+            assert cached_specs(api, str(tmpdir), build) == {'swagger': '2.0'}
+
+        assert build.call_count == 1
+
+
+class ApiDiskCacheTest(object):
+    def test_specs_invalidated(self, tmpdir):
+        for tags, etag in ((['a'], None), (['b'], None), (['b'], True)):
+            app = Flask(__name__)
+            app.config['RESTPLUS_CACHE_DIR'] = str(tmpdir)
+            api = create_api(app, tags=tags, etag=etag)
+            with app.test_request_context():
+                specs = api.__schema__
+
+            assert [t['name'] for t in specs['tags']][0] == tags[0]
+            headers = specs['paths']['/people/']['get']['responses']['200'].get('headers', {})
+            assert ('ETag' in headers) is bool(etag)
+
+    def test_specs_loaded_from_disk(self, tmpdir, mocker):
+        first = Flask(__name__)
+        first.config['RESTPLUS_CACHE_DIR'] = str(tmpdir)
+        api = create_api(first)
+        with first.test_request_context():
+            expected = json.loads(json.dumps(api.__schema__))
+
+        second = Flask(__name__)
+        second.config['RESTPLUS_CACHE_DIR'] = str(tmpdir)
+        api = create_api(second)
+        as_dict = mocker.spy(restplus.Swagger, 'as_dict')
+        with second.test_request_context():
+            assert api.__schema__ == expected
+
+        assert not as_dict.called
@@ -11,6 +11,7 @@ from flask.signals import got_request_exception
 
 from werkzeug.exceptions import HTTPException, BadRequest, NotFound, Aborter
 from werkzeug.http import quote_etag, unquote_etag
+from werkzeug.routing import MapAdapter
 
 import flask_restplus as restplus
 
@@ -662,3 +663,211 @@ class ErrorsTest(object):
             'message': 'error',
             'test': 'value',
         }
+
+    def test_most_specific_errorhandler(self, app, client):
+        api = restplus.Api(app)
+
+        class CustomException(RuntimeError):
+            pass
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            def get(self):
+                raise CustomException('error')
+
+        @api.errorhandler(RuntimeError)
+        def handle_runtime_error(error):
+            return {'message': 'runtime'}, 400
+
+        @api.errorhandler(CustomException)
+        def handle_custom_exception(error):
+            return {'message': 'custom'}, 400
+
+        response = client.get('/test/')
+        assert json.loads(response.data.decode('utf8')) == {'message': 'custom'}
+
+    def test_errorhandler_lookup_is_cached(self, app):
+        api = restplus.Api(app)
+
+        class CustomException(RuntimeError):
+            pass
+
+        @api.errorhandler(RuntimeError)
+        def handle_runtime_error(error):
+            return {'message': 'runtime'}, 400
+
+        handler = api._error_handler_for(CustomException())
+        assert handler is handle_runtime_error
+        assert api._error_handlers_by_type[CustomException] is handle_runtime_error
+        assert api._error_handler_for(CustomException()) is handle_runtime_error
+        assert api._error_handler_for(ValueError()) is None
+        assert api._error_handlers_by_type[ValueError] is None
+
+    def test_direct_error_handlers_changes_invalidate_lookup(self, app):
+        api = restplus.Api(app)
+        ns = api.namespace('ns')
+
+        def handle_error(error):
+            return {'message': 'handled'}, 400
+
+        assert api._error_handler_for(ValueError()) is None
+
+        api.error_handlers[ValueError] = handle_error
+        assert api._error_handler_for(ValueError()) is handle_error
+
+        del api.error_handlers[ValueError]
+        assert api._error_handler_for(ValueError()) is None
+
+        ns.error_handlers[KeyError] = handle_error
+        assert api._error_handler_for(KeyError()) is handle_error
+
+        ns.error_handlers = {}
+        assert api._error_handler_for(KeyError()) is None
+
+    def test_errorhandler_registration_invalidates_lookup(self, app):
+        api = restplus.Api(app)
+        ns = api.namespace('ns')
+
+        assert api._error_handler_for(ValueError()) is None
+
+        @api.errorhandler(ValueError)
+        def handle_value_error(error):
+            return {'message': 'value'}, 400
+
+        assert api._error_handler_for(ValueError()) is handle_value_error
+
+        @ns.errorhandler(KeyError)
+        def handle_key_error(error):
+            return {'message': 'key'}, 400
+
+        assert api._error_handler_for(KeyError()) is handle_key_error
+
+        other = restplus.Namespace('other')
+
+        @other.errorhandler(IndexError)
+        def handle_index_error(error):
+            return {'message': 'index'}, 400
+
+        assert api._error_handler_for(IndexError()) is None
+        api.add_namespace(other)
+        assert api._error_handler_for(IndexError()) is handle_index_error
+
+    def test_http_exception_headers_do_not_render_response(self, app, mocker):
+        api = restplus.Api(app)
+        get_body = mocker.patch.object(HTTPException, 'get_body', return_value='')
+
+        response = api.handle_error(NotFound())
+
+        assert response.status_code == 404
+        assert response.content_type == 'application/json'
+        assert not get_body.called
+
+    def test_http_exception_with_custom_response_headers(self, app):
+        api = restplus.Api(app)
+        custom = app.response_class('', headers={'X-Custom': 'value'})
+
+        response = api.handle_error(BadRequest(response=custom))
+
+        assert response.status_code == 400
+        assert response.headers['X-Custom'] == 'value'
+
+    def test_error_router_reuses_routing_result(self, app, client, mocker):
+        api = restplus.Api(app)
+
+        @api.route('/ids/<int:id>', endpoint='hello')
+        class HelloWorld(restplus.Resource):
+            def get(self, id):
+                return {}
+
+        match = mocker.patch.object(MapAdapter, 'match', autospec=True, side_effect=MapAdapter.match)
+
+        response = client.post('/ids/3')
+        assert response.status_code == 405
+        assert response.content_type == api.default_mediatype
+        # Flask matching and a single lookup for the allowed method
+        assert match.call_count == 2
+
+        match.reset_mock()
+        response = client.post('/ids/3')
+        assert response.status_code == 405
+        assert response.content_type == api.default_mediatype
+        assert match.call_count == 1
+
+        match.reset_mock()
+        assert client.get('/unknown').status_code == 404
+        assert match.call_count == 1
+
+    def test_owns_endpoint_follows_registration(self, app):
+        api = restplus.Api(app)
+
+        assert not api.owns_endpoint('hello')
+
+        api.add_resource(restplus.Resource, '/hello', endpoint='hello')
+
+        assert api.owns_endpoint('hello')
+
+    def test_owns_endpoint_with_blueprint(self, app):
+        blueprint = Blueprint('api', __name__, url_prefix='/api')
+        api = restplus.Api(blueprint)
+        api.add_resource(restplus.Resource, '/hello', endpoint='hello')
+
+        assert not api.owns_endpoint('hello')
+
+        app.register_blueprint(blueprint)
+
+        assert api.owns_endpoint('api.hello')
+        assert not api.owns_endpoint('other.hello')
+
+    def test_exception_logging_rate_limit(self, app, client, caplog):
+        app.config['ERROR_LOG_RATE'] = 0.001
+        app.config['ERROR_LOG_BURST'] = 1
+        api = restplus.Api(app)
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            def get(self):
+                raise RuntimeError('error')
+
+        with caplog.at_level(logging.WARNING):
+            for _ in range(3):
+                assert client.get('/test/').status_code == 500
+
+        assert len(caplog.records) == 1
+        assert caplog.records[0].exc_info[0] is RuntimeError
+        assert api._log_throttle.stats[RuntimeError] == {'logged': 1, 'suppressed': 2}
+
+        # Refill the bucket
+        api._log_throttle._buckets[RuntimeError].tokens = 1
+
+        caplog.clear()
+        with caplog.at_level(logging.WARNING):
+            client.get('/test/')
+
+        assert len(caplog.records) == 2
+        assert '2 similar RuntimeError exception(s)' in caplog.records[0].getMessage()
+        assert caplog.records[1].exc_info[0] is RuntimeError
+
+    def test_exception_logging_sampling(self, app, client, caplog, mocker):
+        app.config['ERROR_LOG_SAMPLE_RATE'] = 0
+        api = restplus.Api(app)
+        signals = []
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            def get(self):
+                raise RuntimeError('error')
+
+        def record(sender, exception):
+            signals.append(exception)
+
+        with got_request_exception.connected_to(record, app), caplog.at_level(logging.ERROR):
+            assert client.get('/test/').status_code == 500
+
+        assert caplog.records == []
+        assert len(signals) == 1
+
+    def test_exception_logging_not_throttled_by_default(self, app):
+        api = restplus.Api(app)
+
+        with app.test_request_context('/'):
+            assert api._get_log_throttle() is None
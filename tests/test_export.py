@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import gzip
+import json
+import os
+
+import pytest
+
+import flask_restplus as restplus
+
+from flask_restplus.export import export, export_directory
+from flask_restplus.schemas import SchemaValidationError
+
+
+@pytest.fixture
+def documented(app, api):
+    @api.route('/test/', endpoint='test')
+    class TestResource(restplus.Resource):
+        def get(self):
+            return {}
+    return api
+
+
+def read(path):
+    if path.endswith('.gz'):
+        with gzip.open(path) as f:
+            return json.loads(f.read().decode('utf8'))
+    with open(path) as f:
+        return json.load(f)
+
+
+class ExportTest(object):
+    def test_export(self, app, documented, tmpdir):
+        with app.app_context():
+            paths = export(documented, str(tmpdir))
+
+        target = str(tmpdir.join('api'))
+        assert paths == [
+            os.path.join(target, 'swagger.json'),
+            os.path.join(target, 'swagger.json.gz'),
+            os.path.join(target, 'postman.json'),
+            os.path.join(target, 'postman.json.gz'),
+        ]
+        with app.test_request_context():
+            assert read(paths[0]) == json.loads(json.dumps(documented.__schema__))
+        assert read(paths[1]) == read(paths[0])
+        assert read(paths[2])['requests'][0]['url'] == 'http://localhost/test/'
+        assert read(paths[3]) == read(paths[2])
+
+    def test_export_without_postman_nor_gzip(self, app, documented, tmpdir):
+        with app.app_context():
+            paths = export(documented, str(tmpdir), postman=False, compress=False)
+
+        assert paths == [str(tmpdir.join('api', 'swagger.json'))]
+
+    def test_export_directory_without_blueprint(self, app):
+        api = restplus.Api(app)
+        assert export_directory(api, 'specs') == os.path.join('specs', 'api')
+
+    def test_export_invalid_specs(self, app, documented, tmpdir, mocker):
+        mocker.patch.object(restplus.Api, '__schema__', {'swagger': '2.0'})
+
+        with app.app_context():
+            with pytest.raises(SchemaValidationError):
+                export(documented, str(tmpdir))
+            assert export(documented, str(tmpdir), postman=False, validate=False)
+
+
+class ExportCommandTest(object):
+    def test_command(self, app, documented, tmpdir):
+        result = app.test_cli_runner().invoke(args=['restplus', 'export', '-o', str(tmpdir)])
+
+        assert result.exit_code == 0
+        assert str(tmpdir.join('api', 'swagger.json.gz')) in result.output.splitlines()
+        assert tmpdir.join('api', 'postman.json').check()
+
+    def test_command_failure(self, app, documented, tmpdir, mocker):
+        mocker.patch.object(restplus.Api, '__schema__', {'swagger': '2.0'})
+
+        result = app.test_cli_runner().invoke(args=['restplus', 'export', '-o', str(tmpdir)])
+
+        assert result.exit_code != 0
+        assert 'Error' in result.output
+
+    def test_command_without_api(self, app):
+        from flask_restplus.cli import restplus as command
+        app.cli.add_command(command)
+
+        result = app.test_cli_runner().invoke(args=['restplus', 'export'])
+
+        assert result.exit_code != 0
+        assert 'No API registered' in result.output
+
+
+class PrebuiltSpecsTest(object):
+    def test_serve_prebuilt(self, app, documented, client, tmpdir):
+        with app.app_context():
+            export(documented, str(tmpdir), postman=False)
+        with open(str(tmpdir.join('api', 'swagger.json')), 'w') as f:
+            json.dump({'swagger': '2.0', 'prebuilt': True}, f)
+        app.config['RESTPLUS_SPECS_DIR'] = str(tmpdir)
+
+        response = client.get('/swagger.json', headers={'Accept-Encoding': 'identity'})
+
+        assert response.status_code == 200
+        assert response.content_type == 'application/json'
+        assert 'Content-Encoding' not in response.headers
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert json.loads(response.data.decode('utf8')) == {'swagger': '2.0', 'prebuilt': True}
+
+    def test_serve_prebuilt_gzipped(self, app, documented, client, tmpdir):
+        with app.app_context():
+            export(documented, str(tmpdir), postman=False)
+        app.config['RESTPLUS_SPECS_DIR'] = str(tmpdir)
+
+        response = client.get('/swagger.json', headers={'Accept-Encoding': 'gzip, deflate'})
+
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == 'gzip'
+        with open(str(tmpdir.join('api', 'swagger.json.gz')), 'rb') as f:
+            assert response.data == f.read()
+
+    def test_fallback_without_export(self, app, documented, client, tmpdir):
+        app.config['RESTPLUS_SPECS_DIR'] = str(tmpdir)
+
+        data = client.get_specs()
+
+        assert '/test/' in data['paths']
+
+    def test_query_bypasses_prebuilt(self, app, documented, client, tmpdir):
+        with app.app_context():
+            export(documented, str(tmpdir), postman=False)
+        with open(str(tmpdir.join('api', 'swagger.json')), 'w') as f:
+            json.dump({'swagger': '2.0', 'prebuilt': True}, f)
+        app.config['RESTPLUS_SPECS_DIR'] = str(tmpdir)
+
+        data = client.get_specs(query_string={'minimal': 'true'})
+
+        assert 'prebuilt' not in data
+        assert '/test/' in data['paths']
@@ -922,6 +922,11 @@ class IsoIntervalTest(object):
     def test_valid_value(self, value, expected):
         assert inputs.iso8601interval(value) == expected
 
+    def test_day_boundaries_are_utc(self):
+        for boundary in (inputs.START_OF_DAY, inputs.END_OF_DAY):
+            assert boundary.tzinfo is not None
+            assert boundary.utcoffset().total_seconds() == 0
+
     def test_error_message(self):
         with pytest.raises(ValueError) as cm:
             inputs.iso8601interval('2013-01-01/blah')
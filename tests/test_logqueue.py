@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import gc
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+import weakref
+
+import pytest
+
+from six.moves import queue
+
+import flask_restplus as restplus
+
+from flask_restplus.logqueue import QueueHandler, QueueListener, LogQueue, DROP_NEW, DROP_OLDEST, BLOCK
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super(RecordingHandler, self).__init__(level)
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.records.append(record)
+        self.threads.add(threading.current_thread())
+
+
+def record(msg, *args, **kwargs):
+    return logging.LogRecord('test', kwargs.get('level', logging.INFO), __file__, 1, msg, args, kwargs.get('exc_info'))
+
+
+class QueueHandlerTest(object):
+    def test_prepare(self):
+        handler = QueueHandler(queue.Queue())
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            prepared = handler.prepare(record('hello %s', 'world', exc_info=sys.exc_info()))
+
+        assert prepared.msg.startswith('hello world')
+        assert 'ValueError: boom' in prepared.msg
+        assert prepared.args is None
+        assert prepared.exc_info is None
+
+    def test_drop_new(self):
+        handler = QueueHandler(queue.Queue(1), DROP_NEW)
+        handler.handle(record('first'))
+        handler.handle(record('second'))
+
+        assert handler.queue.get_nowait().msg == 'first'
+        assert handler.dropped == 1
+
+    def test_drop_oldest(self):
+        handler = QueueHandler(queue.Queue(1), DROP_OLDEST)
+        handler.handle(record('first'))
+        handler.handle(record('second'))
+
+        assert handler.queue.get_nowait().msg == 'second'
+        assert handler.dropped == 1
+
+    def test_block(self):
+        handler = QueueHandler(queue.Queue(1), BLOCK)
+        handler.handle(record('first'))
+        thread = threading.Thread(target=handler.handle, args=(record('second'),))
+        thread.start()
+
+        assert handler.queue.get(timeout=5).msg == 'first'
+        thread.join(5)
+        assert handler.queue.get_nowait().msg == 'second'
+        assert handler.dropped == 0
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            QueueHandler(queue.Queue(), 'unknown')
+
+
+class QueueListenerTest(object):
+    def test_dispatch_in_background(self):
+        info = RecordingHandler()
+        error = RecordingHandler(logging.ERROR)
+        records = queue.Queue()
+        listener = QueueListener(records, info, error)
+        listener.start()
+        records.put(record('info'))
+        records.put(record('error', level=logging.ERROR))
+        listener.stop()
+
+        assert not listener.running
+        assert [r.msg for r in info.records] == ['info', 'error']
+        assert [r.msg for r in error.records] == ['error']
+        assert threading.current_thread() not in info.threads
+
+
+class LogQueueTest(object):
+    def test_namespace_loggers_use_queue(self, app, client):
+        app.config['RESTPLUS_LOG_QUEUE'] = True
+        app.config['RESTPLUS_LOG_QUEUE_SIZE'] = 10
+        app.config['RESTPLUS_LOG_QUEUE_POLICY'] = DROP_OLDEST
+        handler = RecordingHandler()
+        app.logger.addHandler(handler)
+        app.logger.setLevel(logging.INFO)
+
+        api = restplus.Api(app)
+        ns = api.namespace('ns', path='/ns')
+
+        @ns.route('/')
+        class Ns(restplus.Resource):
+            def get(self):
+                ns.logger.info('hello from ns')
+                return {}
+
+        log_queue = app.extensions['restplus']['log_queue']
+        assert isinstance(log_queue, LogQueue)
+        assert log_queue.queue.maxsize == 10
+        assert log_queue.handler.policy == DROP_OLDEST
+        assert log_queue.handler in ns.logger.handlers
+        assert handler not in ns.logger.handlers
+
+        client.get('/ns/')
+        log_queue.stop()
+        app.logger.removeHandler(handler)
+        ns.logger.removeHandler(log_queue.handler)
+
+        assert [r.msg for r in handler.records] == ['hello from ns']
+        assert log_queue.dropped == 0
+
+    def test_disabled_by_default(self, app):
+        restplus.Api(app)
+        assert 'log_queue' not in app.extensions['restplus']
+
+    def test_started_on_first_record(self):
+        handler = RecordingHandler()
+        log_queue = LogQueue([handler])
+
+        assert not log_queue.listener.running
+
+        log_queue.handler.handle(record('first'))
+        assert log_queue.listener.running
+
+        log_queue.stop()
+        assert [r.msg for r in handler.records] == ['first']
+
+    @pytest.mark.skipif(not hasattr(os, 'register_at_fork'), reason='Requires fork hooks')
+    def test_pid_not_checked_on_emit(self, mocker):
+        log_queue = LogQueue([RecordingHandler()])
+        log_queue.handler.handle(record('first'))
+        second = record('second')
+        getpid = mocker.patch('os.getpid')
+
+        log_queue.handler.handle(second)
+
+        assert not getpid.called
+        log_queue.stop()
+
+    @pytest.mark.skipif(not hasattr(weakref, 'finalize'), reason='Requires weakref.finalize')
+    def test_listener_stopped_when_unused(self):
+        log_queue = LogQueue([RecordingHandler()])
+        log_queue.handler.handle(record('first'))
+        listener = log_queue.listener
+        thread = listener._thread
+
+        del log_queue
+        gc.collect()
+
+        assert not listener.running
+        assert not thread.is_alive()
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason='Requires os.fork')
+    def test_listener_restarted_after_fork(self, tmpdir):
+        output = tmpdir.join('log.txt')
+        file_handler = logging.FileHandler(str(output))
+        log_queue = LogQueue([file_handler], size=1, policy=BLOCK)
+        log_queue.handler.handle(record('parent'))
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover (child)
+            code = 1
+            try:
+                for i in range(3):
+                    # Blocks forever on the full queue if nobody drains it
+                    log_queue.handler.handle(record('child {0}'.format(i)))
+                log_queue.stop()
+                file_handler.close()
+                code = 0
+            finally:
+                os._exit(code)
+
+        deadline = time.time() + 10
+        while True:
+            finished, status = os.waitpid(pid, os.WNOHANG)
+            if finished:
+                break
+            if time.time() > deadline:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                pytest.fail('The forked process is stuck on the log queue')
+            time.sleep(0.01)
+        log_queue.stop()
+        file_handler.close()
+
+        assert os.WEXITSTATUS(status) == 0
+        assert output.read().splitlines() == ['parent', 'child 0', 'child 1', 'child 2']
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from flask import Blueprint
+
+import flask_restplus as restplus
+
+from flask_restplus import fields, reqparse
+from flask_restplus.metrics import Histogram, Metrics, MetricsSink, phase, recorder
+
+
+class RecordingSink(MetricsSink):
+    def __init__(self):
+        self.durations = []
+        self.sizes = []
+
+    def observe_duration(self, endpoint, phase, seconds):
+        assert seconds >= 0
+        self.durations.append((endpoint, phase))
+
+    def observe_size(self, endpoint, size):
+        self.sizes.append((endpoint, size))
+
+
+class HistogramTest(object):
+    def test_observe(self):
+        histogram = Histogram((1, 5, 10))
+        for value in (0.5, 1, 3, 7, 20):
+            histogram.observe(value)
+
+        assert histogram.count == 5
+        assert histogram.sum == 31.5
+        assert histogram.cumulative() == [(1, 2), (5, 3), (10, 4), (float('inf'), 5)]
+
+
+class MetricsTest(object):
+    def test_render(self):
+        metrics = Metrics()
+        metrics.observe_duration('ns.res"1', 'handler', 0.002)
+        metrics.observe_size('ns.res"1', 150)
+
+        output = metrics.render()
+
+        assert '# TYPE restplus_phase_seconds histogram' in output
+        assert 'restplus_phase_seconds_bucket{endpoint="ns.res\\"1",phase="handler",le="0.001"} 0' in output
+        assert 'restplus_phase_seconds_bucket{endpoint="ns.res\\"1",phase="handler",le="0.0025"} 1' in output
+        assert 'restplus_phase_seconds_bucket{endpoint="ns.res\\"1",phase="handler",le="+Inf"} 1' in output
+        assert 'restplus_phase_seconds_count{endpoint="ns.res\\"1",phase="handler"} 1' in output
+        assert '# TYPE restplus_response_size_bytes histogram' in output
+        assert 'restplus_response_size_bytes_bucket{endpoint="ns.res\\"1",le="1000"} 1' in output
+        assert 'restplus_response_size_bytes_sum{endpoint="ns.res\\"1"} 150' in output
+
+    def test_empty(self):
+        assert Metrics().render() == '\n'
+
+
+class PhaseTest(object):
+    def test_noop_outside_request(self):
+        with phase('parse') as timer:
+            assert timer.recorder is None
+
+    def test_noop_without_metrics(self, app):
+        with app.test_request_context('/'):
+            assert recorder() is None
+            with phase('parse') as timer:
+                assert timer.recorder is None
+
+
+class ApiMetricsTest(object):
+    def test_disabled_by_default(self, app, client):
+        api = restplus.Api(app)
+
+        @api.route('/test/')
+        class TestResource(restplus.Resource):
+            def get(self):
+                assert recorder() is None
+                return {}
+
+        client.get('/test/')
+        assert api.metrics is None
+
+    def test_phases(self, app, client):
+        sink = RecordingSink()
+        api = restplus.Api(app, metrics=sink)
+        model = api.model('Model', {'name': fields.String(required=True)})
+        parser = reqparse.RequestParser()
+        parser.add_argument('q')
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            @api.expect(model, validate=True)
+            @api.marshal_with(model)
+            def post(self):
+                parser.parse_args()
+                return {'name': 'value'}
+
+        response = client.post_json('/test/?q=1', {'name': 'value'})
+
+        assert response == {'name': 'value'}
+        assert sorted(sink.durations) == [
+            ('test', 'handler'),
+            ('test', 'marshal'),
+            ('test', 'parse'),
+            ('test', 'serialize'),
+            ('test', 'validate'),
+        ]
+        assert len(sink.sizes) == 1
+        assert sink.sizes[0][0] == 'test'
+        assert sink.sizes[0][1] > 0
+
+    def test_error_phase(self, app, client):
+        sink = RecordingSink()
+        api = restplus.Api(app, metrics=sink)
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            def get(self):
+                api.abort(400)
+
+        client.get('/test/')
+
+        assert ('test', 'error') in sink.durations
+        assert ('test', 'handler') in sink.durations
+        assert len(sink.sizes) == 1
+
+    def test_metrics_endpoint(self, app, client):
+        api = restplus.Api(app, metrics=True, metrics_url='/metrics')
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            def get(self):
+                return {}
+
+        client.get('/test/')
+        response = client.get('/metrics')
+
+        assert response.status_code == 200
+        assert response.content_type == 'text/plain; version=0.0.4; charset=utf-8'
+        output = response.data.decode('utf8')
+        assert 'restplus_phase_seconds_count{endpoint="test",phase="handler"} 1' in output
+        assert 'restplus_response_size_bytes_count{endpoint="test"} 1' in output
+
+    def test_metrics_endpoint_with_blueprint(self, app, client):
+        blueprint = Blueprint('api', __name__, url_prefix='/api')
+        api = restplus.Api(blueprint, metrics=True, metrics_url='/metrics')
+        app.register_blueprint(blueprint)
+
+        assert isinstance(api.metrics, Metrics)
+        assert client.get('/api/metrics').status_code == 200
+
+    def test_no_metrics_endpoint_by_default(self, app, client):
+        restplus.Api(app, metrics=True)
+        assert client.get('/metrics').status_code == 404
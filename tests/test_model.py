@@ -599,6 +599,175 @@ class ModelTest(object):
             'type': 'object'
         }
 
+    def test_resolved_shares_fields(self):
+        parent = Model('Person', {
+            'name': fields.String,
+            'age': fields.Integer,
+        })
+        child = parent.inherit('Child', {
+            'extra': fields.String,
+        })
+
+        resolved = child.resolved
+
+        assert resolved['name'] is parent['name']
+        assert resolved['age'] is parent['age']
+        assert resolved['extra'] is child['extra']
+
+    def test_resolved_copies_discriminator(self):
+        parent = Model('Person', {
+            'name': fields.String,
+            'model': fields.String(discriminator=True),
+        })
+        child = parent.inherit('Child', {
+            'extra': fields.String,
+        })
+
+        assert child.resolved['model'] is not parent['model']
+        assert child.resolved['model'].default == 'Child'
+        assert child.resolved['name'] is parent['name']
+        assert parent['model'].default is None
+        assert parent.resolved['model'].default == 'Person'
+
+    def test_clone_copies_fields(self):
+        parent = Model('Parent', {
+            'name': fields.String(),
+            'nested': fields.Nested(Model('Nested', {})),
+        })
+
+        child = parent.clone('Child', {
+            'extra': fields.String,
+        })
+        child['name'].required = True
+        child['name'].description = 'Child only'
+
+        assert child['name'] is not parent['name']
+        assert child['nested'].model is parent['nested'].model
+        assert not parent['name'].required
+        assert 'description' not in parent.__schema__['properties']['name']
+        assert child.__schema__['properties']['name']['description'] == 'Child only'
+        assert child.__schema__['required'] == ['name']
+
+    def test_schema_cached(self):
+        model = Model('Person', {
+            'name': fields.String,
+        })
+
+        assert model.__schema__ is model.__schema__
+
+    def test_schema_cache_invalidated_on_change(self):
+        model = Model('Person', {
+            'name': fields.String,
+        })
+        schema = model.__schema__
+
+        model['age'] = fields.Integer
+
+        assert model.__schema__ is not schema
+        assert 'age' in model.__schema__['properties']
+
+        del model['age']
+        assert 'age' not in model.__schema__['properties']
+
+    def test_validator_cached(self):
+        model = Model('Person', {
+            'name': fields.String,
+        })
+
+        assert model.get_validator() is model.get_validator()
+
+    def test_validator_inlines_references(self, mocker):
+        address = Model('Address', {
+            'road': fields.String(required=True),
+        })
+        person = Model('Person', {
+            'name': fields.String,
+            'address': fields.Nested(address),
+        })
+        resolver = mocker.Mock()
+
+        validator = person.get_validator(resolver)
+
+        assert validator.schema['properties']['address'] == address.__schema__
+        assert 'definitions' not in validator.schema
+        assert validator.resolver is not resolver
+        # Shared with other resolvers (ie. other APIs)
+        assert person.get_validator(mocker.Mock()) is validator
+        assert not validator.is_valid({'address': {}})
+        assert validator.is_valid({'address': {'road': 'here'}})
+
+    def test_validator_inlines_parents(self):
+        parent = Model('Person', {
+            'name': fields.String(required=True),
+        })
+        child = parent.inherit('Child', {
+            'extra': fields.String,
+        })
+
+        validator = child.get_validator()
+
+        assert validator.schema['allOf'][0] == parent.__schema__
+        assert not validator.is_valid({'extra': 'value'})
+
+    def test_validator_recursive_models(self):
+        node = Model('Node', {
+            'name': fields.String(required=True),
+        })
+        node['children'] = fields.List(fields.Nested(node))
+        tree = Model('Tree', {
+            'root': fields.Nested(node, required=True),
+        })
+
+        validator = tree.get_validator()
+
+        root = validator.schema['properties']['root']
+        assert root['properties']['children']['items'] == {'$ref': '#/definitions/Node'}
+        assert set(validator.schema['definitions']) == set(['Node'])
+        assert validator.is_valid({'root': {'name': 'a', 'children': [{'name': 'b', 'children': []}]}})
+        assert not validator.is_valid({'root': {'name': 'a', 'children': [{'children': []}]}})
+
+    def test_validator_self_referencing_model(self):
+        person = Model('Person', {
+            'name': fields.String(required=True),
+        })
+        person['friends'] = fields.List(fields.Nested(person))
+
+        validator = person.get_validator()
+
+        assert set(validator.schema['definitions']) == set(['Person'])
+        assert not person.requires_resolver
+        assert not validator.is_valid({'name': 'a', 'friends': [{}]})
+
+    def test_validator_invalidated_on_nested_change(self):
+        address = Model('Address', {
+            'road': fields.String,
+        })
+        person = Model('Person', {
+            'address': fields.Nested(address),
+        })
+        validator = person.get_validator()
+
+        address['number'] = fields.Integer(required=True)
+
+        assert person.get_validator() is not validator
+        assert not person.get_validator().is_valid({'address': {'road': 'here'}})
+
+    def test_validator_unknown_references(self, mocker):
+        from jsonschema import RefResolver
+
+        model = SchemaModel('Person', {
+            'properties': {'address': {'$ref': '#/definitions/Address'}},
+        })
+        resolver = RefResolver.from_schema({
+            'definitions': {'Address': {'type': 'object', 'required': ['road']}},
+        })
+
+        validator = model.get_validator(resolver)
+
+        assert model.requires_resolver
+        assert validator.resolver is resolver
+        assert not validator.is_valid({'address': {}})
+
     def test_validate(self):
         from jsonschema import FormatChecker
         from werkzeug.exceptions import BadRequest
@@ -203,6 +203,35 @@ class PayloadTest(object):
             'age': '15',
         }, 'name', 'age')
 
+    def test_validation_without_specifications(self, app, client, mocker):
+        '''It should not build the specifications to validate nested models'''
+        api = restplus.Api(app, validate=True)
+
+        address = api.model('Address', {
+            'road': restplus.fields.String(required=True),
+        })
+        person = api.model('Person', {
+            'name': restplus.fields.String(required=True),
+            'address': restplus.fields.Nested(address),
+        })
+
+        @api.route('/validation/')
+        class Nested(restplus.Resource):
+            @api.expect(person)
+            def post(self):
+                return {}
+
+        as_dict = mocker.spy(restplus.Swagger, 'as_dict')
+
+        client.post_json('/validation/', {'name': 'John Doe', 'address': {'road': 'here'}})
+        self.assert_errors(client, '/validation/', {
+            'name': 'John Doe',
+            'address': {},
+        }, 'address.road')
+
+        assert not as_dict.called
+        assert api._refresolver is None
+
     def test_validation_on_list(self, app, client):
         '''It should perform validation on lists'''
         api = restplus.Api(app, validate=True)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import json
+import os
+import pstats
+import shutil
+
+import pytest
+
+import flask_restplus as restplus
+
+from flask_restplus import profiling
+from flask_restplus.profiling import Profiler, categorize, RESTPLUS, USER, LIBRARY
+
+
+def busy():
+    return sum(i * i for i in range(1000))
+
+
+class CategorizeTest(object):
+    def test_restplus(self):
+        assert categorize(profiling.__file__) == RESTPLUS
+
+    def test_user(self):
+        assert categorize(__file__) == USER
+
+    @pytest.mark.parametrize('filename', ['~', '<string>', json.__file__, pytest.__file__])
+    def test_library(self, filename):
+        assert categorize(filename) == LIBRARY
+
+
+class ProfilerTest(object):
+    def test_profile_with_token(self, app, client, tmpdir):
+        profiler = Profiler(str(tmpdir), token='secret')
+        api = restplus.Api(app, profiler=profiler)
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            def get(self):
+                return {'value': busy()}
+
+        response = client.get('/test/', headers={'X-Profile': 'secret'})
+
+        assert response.status_code == 200
+        profile_id = response.headers['X-Profile-Id']
+        assert '-test-' in profile_id
+        summary = response.headers['X-Profile-Summary']
+        assert summary.startswith('restplus;dur=')
+        assert 'user;dur=' in summary
+        assert 'library;dur=' in summary
+
+        stats = pstats.Stats(os.path.join(str(tmpdir), profile_id + '.prof'))
+        assert any(name == 'busy' for _, _, name in stats.stats)
+
+        with open(os.path.join(str(tmpdir), profile_id + '.json')) as f:
+            report = json.load(f)
+        assert report['id'] == profile_id
+        assert report['totals'][USER] > 0
+        assert any(category == USER for category, _, _, _, _ in report['top'])
+
+    @pytest.mark.parametrize('headers', [{}, {'X-Profile': 'wrong'}])
+    def test_not_profiled(self, app, client, tmpdir, headers):
+        api = restplus.Api(app, profiler=Profiler(str(tmpdir), token='secret'))
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            def get(self):
+                return {}
+
+        response = client.get('/test/', headers=headers)
+
+        assert 'X-Profile-Id' not in response.headers
+        assert tmpdir.listdir() == []
+
+    def test_header_disabled_without_token(self, app):
+        profiler = Profiler()
+        with app.test_request_context('/', headers={'X-Profile': ''}):
+            assert not profiler.should_profile()
+
+    def test_sampling(self, app, mocker):
+        profiler = Profiler(sample_rate=0.1)
+        mocker.patch('random.random', side_effect=[0.05, 0.5])
+        with app.test_request_context('/'):
+            assert profiler.should_profile()
+            assert not profiler.should_profile()
+
+    def test_concurrent_requests_not_profiled(self, app, client, tmpdir):
+        api = restplus.Api(app, profiler=Profiler(str(tmpdir), sample_rate=1))
+        nested = []
+
+        @api.route('/outer/', endpoint='outer')
+        class Outer(restplus.Resource):
+            def get(self):
+                with app.test_client() as other:
+                    nested.append(other.get('/inner/'))
+                return {}
+
+        @api.route('/inner/', endpoint='inner')
+        class Inner(restplus.Resource):
+            def get(self):
+                return {}
+
+        response = client.get('/outer/')
+
+        assert 'X-Profile-Id' in response.headers
+        assert nested[0].status_code == 200
+        assert 'X-Profile-Id' not in nested[0].headers
+        assert len(tmpdir.listdir(lambda p: p.ext == '.prof')) == 1
+
+    def test_default_directory_is_private(self, app, client):
+        profiler = Profiler(sample_rate=1)
+        api = restplus.Api(app, profiler=profiler)
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            def get(self):
+                return {}
+
+        assert profiler.directory is None
+        response = client.get('/test/')
+
+        try:
+            assert os.path.basename(profiler.directory).startswith('flask-restplus-profiles-')
+            assert os.stat(profiler.directory).st_mode & 0o777 == 0o700
+            assert os.path.isfile(os.path.join(profiler.directory, response.headers['X-Profile-Id'] + '.prof'))
+        finally:
+            shutil.rmtree(profiler.directory)
+
+    def test_stats_stored_on_error(self, app, client, tmpdir):
+        api = restplus.Api(app, profiler=Profiler(str(tmpdir), sample_rate=1))
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            def get(self):
+                api.abort(400)
+
+        response = client.get('/test/')
+
+        assert response.status_code == 400
+        assert len(tmpdir.listdir(lambda p: p.ext == '.prof')) == 1
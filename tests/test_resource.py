@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from functools import wraps
+
+import flask_restplus as restplus
+
+from flask_restplus import fields
+
+
+class DispatchPlanTest(object):
+    def test_plan_is_cached_per_class_and_method(self):
+        class Foo(restplus.Resource):
+            def get(self):
+                pass
+
+        class Bar(Foo):
+            pass
+
+        plan = Foo.dispatch_plan('get')
+        assert Foo.dispatch_plan('get') is plan
+        assert Bar.dispatch_plan('get') is not plan
+
+    def test_method_decorators_are_applied_per_instance(self, app, client):
+        api = restplus.Api(app)
+        decorations = []
+        calls = []
+
+        def decorator(func):
+            decorations.append(func)
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                calls.append(1)
+                return func(*args, **kwargs)
+            return wrapper
+
+        @api.route('/test/')
+        class Foo(restplus.Resource):
+            method_decorators = [decorator]
+
+            def get(self):
+                return {'type': type(self).__name__}
+
+        @api.route('/shared/')
+        class Shared(Foo):
+            shared_instance = True
+
+        assert client.get_json('/test/') == {'type': 'Foo'}
+        assert client.get_json('/test/') == {'type': 'Foo'}
+        assert len(decorations) == 2
+        assert len(calls) == 2
+
+        del decorations[:]
+        assert client.get_json('/shared/') == {'type': 'Shared'}
+        assert client.get_json('/shared/') == {'type': 'Shared'}
+        assert len(decorations) == 1
+        assert len(calls) == 4
+
+    def test_method_decorators_wrap_bound_methods(self, app, client):
+        api = restplus.Api(app)
+
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return {'bound': type(func.__self__).__name__, 'args': len(args)}
+            return wrapper
+
+        @api.route('/test/')
+        class Foo(restplus.Resource):
+            method_decorators = [decorator]
+
+            def get(self):
+                return {}
+
+        assert client.get_json('/test/') == {'bound': 'Foo', 'args': 0}
+
+    def test_instance_method_decorators(self, app, client):
+        api = restplus.Api(app)
+
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return {'decorated': True}
+            return wrapper
+
+        class Foo(restplus.Resource):
+            def __init__(self, api=None, *args, **kwargs):
+                super(Foo, self).__init__(api)
+                self.method_decorators = kwargs.get('decorators', [])
+
+            def get(self):
+                return {'decorated': False}
+
+        api.add_resource(Foo, '/test/', resource_class_kwargs={'decorators': [decorator]})
+
+        assert client.get_json('/test/') == {'decorated': True}
+
+    def test_head_fallback_to_get(self, app, client):
+        api = restplus.Api(app)
+
+        @api.route('/test/')
+        class Foo(restplus.Resource):
+            def get(self):
+                return {}
+
+        assert client.head('/test/').status_code == 200
+        assert Foo.dispatch_plan('get') is not None
+
+    def test_plan_expected_payloads(self, app):
+        api = restplus.Api(app)
+        model = api.model('Model', {'name': fields.String(required=True)})
+
+        class Foo(restplus.Resource):
+            @api.expect(model, validate=True)
+            def post(self):
+                pass
+
+            @api.expect([model])
+            def put(self):
+                pass
+
+        plan = Foo.dispatch_plan('post')
+        assert plan.validate is True
+        assert [(m.name, c) for m, c in plan.expects] == [('Model', False)]
+
+        plan = Foo.dispatch_plan('put')
+        assert plan.validate is None
+        assert [(m.name, c) for m, c in plan.expects] == [('Model', True)]
+
+    def test_planned_validation(self, app, client):
+        api = restplus.Api(app, validate=True)
+        model = api.model('Model', {'name': fields.String(required=True)})
+
+        @api.route('/test/')
+        class Foo(restplus.Resource):
+            @api.expect(model)
+            def post(self):
+                return {}
+
+        client.post_json('/test/', {}, status=400)
+        client.post_json('/test/', {'name': 'test'})
+
+    def test_custom_validate_payload(self, app, client):
+        api = restplus.Api(app, validate=True)
+        model = api.model('Model', {'name': fields.String(required=True)})
+        validated = []
+
+        @api.route('/test/')
+        class Foo(restplus.Resource):
+            def validate_payload(self, func):
+                validated.append(func.__apidoc__)
+
+            @api.expect(model)
+            def post(self):
+                return {}
+
+        client.post_json('/test/', {})
+        assert len(validated) == 1
+
+
+class SharedInstanceTest(object):
+    def test_instance_per_request_by_default(self, app, client):
+        api = restplus.Api(app)
+        instances = []
+
+        @api.route('/test/')
+        class Foo(restplus.Resource):
+            def __init__(self, *args, **kwargs):
+                super(Foo, self).__init__(*args, **kwargs)
+                instances.append(self)
+
+            def get(self):
+                return {}
+
+        client.get('/test/')
+        client.get('/test/')
+        assert len(instances) == 2
+
+    def test_shared_instance_attribute(self, app, client):
+        api = restplus.Api(app)
+        instances = []
+
+        @api.route('/test/', resource_class_kwargs={'value': 'shared'})
+        class Foo(restplus.Resource):
+            shared_instance = True
+
+            def __init__(self, api, value):
+                super(Foo, self).__init__(api)
+                self.value = value
+                instances.append(self)
+
+            def get(self):
+                return {'value': self.value}
+
+        assert instances == []
+        assert client.get_json('/test/') == {'value': 'shared'}
+        assert client.get_json('/test/') == {'value': 'shared'}
+        assert len(instances) == 1
+        assert app.view_functions['foo'].view_class is Foo
+
+    def test_shared_instance_parameter(self, app, client):
+        api = restplus.Api(app)
+        instances = []
+
+        class Foo(restplus.Resource):
+            def __init__(self, *args, **kwargs):
+                super(Foo, self).__init__(*args, **kwargs)
+                instances.append(self)
+
+            def get(self):
+                return {}
+
+        api.add_resource(Foo, '/test/', shared_instance=True)
+        client.get('/test/')
+        client.get('/test/')
+        assert len(instances) == 1
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import difflib
+
+from werkzeug.exceptions import NotFound
+from werkzeug.routing import Map, Rule
+
+import flask_restplus as restplus
+
+from flask_restplus.suggestions import RuleIndex
+
+
+def rules_map(*paths):
+    return Map([Rule(path, endpoint=path) for path in paths])
+
+
+class RuleIndexTest(object):
+    def test_suggest(self):
+        index = RuleIndex(rules_map('/foo', '/fee', '/fii', '/bar/<int:id>'))
+        assert index.suggest('/fOo') == ['/foo']
+        assert index.suggest('/bar/') == ['/bar/<int:id>']
+        assert index.suggest('/unknown') == []
+
+    def test_same_results_as_full_scan(self):
+        paths = ['/api/{0}/items/<id>'.format(name) for name in ('users', 'groups', 'roles', 'rights')]
+        index = RuleIndex(rules_map(*paths))
+        for path in ('/api/user/items/', '/api/grops/items', '/api/rolez', '/items/'):
+            stripped = dict((p.replace('<id>', ''), p) for p in paths)
+            expected = [stripped[m] for m in difflib.get_close_matches(path, stripped.keys())]
+            assert index.suggest(path) == expected
+
+    def test_candidates_budget(self):
+        paths = ['/resource{0}/'.format(i) for i in range(200)] + ['/other/']
+        index = RuleIndex(rules_map(*paths), candidates=10)
+        assert index.suggest('/other') == ['/other/']
+        matches = index.suggest('/resource42/')
+        assert matches[:2] == ['/resource42/', '/resource142/']
+        assert len(matches) == 3
+
+    def test_common_trigrams_are_not_indexed(self):
+        paths = ['/resource{0}/'.format(i) for i in range(200)] + ['/other/']
+        index = RuleIndex(rules_map(*paths), candidates=10, max_postings=50)
+        index.build()
+        assert 'res' not in index.index
+        assert index.index['oth'] == ('/other/',)
+        assert index.suggest('/other') == ['/other/']
+        assert index.suggest('/resource42/')[0] == '/resource42/'
+
+    def test_scoring_budget(self, mocker):
+        paths = ['/resource{0}/'.format(i) for i in range(200)] + ['/other/']
+        index = RuleIndex(rules_map(*paths), candidates=10, budget=20)
+        index.build()
+        close_matches = mocker.patch('difflib.get_close_matches', return_value=[])
+        index.suggest('/resource42/')
+        candidates = close_matches.call_args[0][1]
+        assert len(candidates) == 10
+        assert '/resource42/' in candidates
+
+    def test_too_long_paths_are_skipped(self, mocker):
+        index = RuleIndex(rules_map('/foo'))
+        index.build()
+        close_matches = mocker.patch('difflib.get_close_matches')
+        assert index.suggest('/foo' * 10) == []
+        assert not close_matches.called
+
+    def test_suggestions_are_cached(self, mocker):
+        index = RuleIndex(rules_map('/foo'))
+        index.build()
+        close_matches = mocker.patch('difflib.get_close_matches', return_value=['/foo'])
+        assert index.suggest('/fOo') == ['/foo']
+        assert index.suggest('/fOo') == ['/foo']
+        assert close_matches.call_count == 1
+
+    def test_rebuilt_on_new_rules(self):
+        url_map = rules_map('/foo')
+        index = RuleIndex(url_map)
+        assert index.suggest('/bars') == []
+        url_map.add(Rule('/bar', endpoint='bar'))
+        assert index.stale
+        assert index.suggest('/bars') == ['/bar']
+
+
+class HelpOn404Test(object):
+    def test_rules_pattern_still_exposed(self):
+        from flask_restplus.api import RE_RULES
+        assert RE_RULES.sub('', '/foo/<int:id>') == '/foo/'
+
+    def test_index_follows_routes(self, app):
+        api = restplus.Api(app)
+
+        with app.test_request_context('/fOo'):
+            assert 'did you mean' not in api.handle_error(NotFound()).data.decode()
+
+        api.add_resource(restplus.Resource, '/foo', endpoint='foo')
+
+        with app.test_request_context('/fOo'):
+            assert 'did you mean /foo ?' in api.handle_error(NotFound()).data.decode()
+
+    def test_candidates_from_config(self, app):
+        app.config['ERROR_404_HELP_CANDIDATES'] = 5
+        app.config['ERROR_404_HELP_CACHE_SIZE'] = 10
+        api = restplus.Api(app)
+
+        with app.test_request_context('/'):
+            index = api._get_rule_index()
+
+        assert index.candidates == 5
+        assert index.cache.maxsize == 10
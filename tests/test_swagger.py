@@ -3325,6 +3325,237 @@ class SwaggerTest(object):
         assert parameter['description'] == 'Overriden description'
 
 
+class SwaggerFragmentsTest(object):
+    def test_models_schemas_shared_between_apis(self, app):
+        ns = restplus.Namespace('people')
+        model = ns.model('Person', {'name': restplus.fields.String})
+
+        @ns.route('/')
+        class People(restplus.Resource):
+            @ns.expect(model)
+            def post(self):
+                pass
+
+        apis = []
+        for version in 'v1', 'v2':
+            blueprint = Blueprint(version, __name__, url_prefix='/' + version)
+            api = restplus.Api(blueprint)
+            api.add_namespace(ns)
+            app.register_blueprint(blueprint)
+            apis.append(api)
+
+        with app.test_request_context():
+            v1, v2 = (api.__schema__['definitions']['Person'] for api in apis)
+
+        assert v1 is v2
+
+    def test_namespace_added_after_first_render(self, app, api, client):
+        ns = api.namespace('first')
+
+        @ns.route('/')
+        class First(restplus.Resource):
+            def get(self):
+                pass
+
+        data = client.get_specs('')
+        assert list(data['paths'].keys()) == ['/first/']
+
+        other = restplus.Namespace('second')
+        model = other.model('Other', {'name': restplus.fields.String})
+
+        @other.route('/')
+        class Second(restplus.Resource):
+            @other.marshal_with(model)
+            def get(self):
+                pass
+
+        api.add_namespace(other)
+
+        data = client.get_specs('')
+        assert sorted(data['paths'].keys()) == ['/first/', '/second/']
+        assert 'Other' in data['definitions']
+        assert 'second' in [tag['name'] for tag in data['tags']]
+
+    def test_schema_is_stable_until_changed(self, app, api):
+        ns = api.namespace('ns')
+
+        @ns.route('/')
+        class Resource(restplus.Resource):
+            def get(self):
+                pass
+
+        with app.test_request_context():
+            schema = api.__schema__
+            assert api.__schema__ is schema
+
+            @ns.route('/other')
+            class Other(restplus.Resource):
+                def get(self):
+                    pass
+
+            assert api.__schema__ is not schema
+            assert '/ns/other' in api.__schema__['paths']
+
+    def test_unchanged_namespace_fragment_is_reused(self, app, api, mocker):
+        first = api.namespace('first')
+        second = api.namespace('second')
+
+        @first.route('/')
+        class First(restplus.Resource):
+            def get(self):
+                pass
+
+        @second.route('/')
+        class Second(restplus.Resource):
+            def get(self):
+                pass
+
+        with app.test_request_context():
+            api.__schema__
+            serialize = mocker.spy(restplus.swagger.Swagger, 'serialize_resource')
+
+            @second.route('/other')
+            class Other(restplus.Resource):
+                def get(self):
+                    pass
+
+            paths = api.__schema__['paths']
+
+        assert sorted(paths.keys()) == ['/first/', '/second/', '/second/other']
+        serialized = [call[0][2] for call in serialize.call_args_list]
+        assert set(serialized) == set([Second, Other])
+
+    def test_late_documentation_is_rendered(self, app, api):
+        ns = api.namespace('ns')
+
+        @ns.route('/')
+        class Test(restplus.Resource):
+            def get(self):
+                pass
+
+        with app.test_request_context():
+            assert 'description' not in api.__schema__['paths']['/ns/']['get']
+
+            api.doc(description='late')(Test)
+            assert api.__schema__['paths']['/ns/']['get']['description'] == 'late'
+
+            api.doc(id='late_get')(Test.get)
+            assert api.__schema__['paths']['/ns/']['get']['operationId'] == 'late_get'
+
+    def test_late_base_class_documentation_is_rendered(self, app, api):
+        ns = api.namespace('ns')
+
+        class Base(restplus.Resource):
+            def get(self):
+                pass
+
+        @ns.route('/')
+        class Test(Base):
+            pass
+
+        with app.test_request_context():
+            assert 'description' not in api.__schema__['paths']['/ns/']['get']
+
+            api.doc(description='late')(Base)
+            assert api.__schema__['paths']['/ns/']['get']['description'] == 'late'
+
+    def test_schema_error_is_cached(self, app, api, mocker):
+        as_dict = mocker.patch.object(restplus.Swagger, 'as_dict', side_effect=ValueError('broken'))
+        log = mocker.patch('flask_restplus.api.log')
+
+        with app.test_request_context():
+            assert api.__schema__ == {'error': 'Unable to render schema'}
+            assert api.__schema__ == {'error': 'Unable to render schema'}
+
+        assert as_dict.call_count == 1
+        assert log.exception.call_count == 1
+
+    def test_model_redefined_in_another_namespace(self, app, api):
+        first = api.namespace('first')
+        second = api.namespace('second')
+        model = first.model('Person', {'name': restplus.fields.String})
+
+        @first.route('/')
+        class First(restplus.Resource):
+            @first.marshal_with(model)
+            def get(self):
+                pass
+
+        with app.test_request_context():
+            assert 'age' not in api.__schema__['definitions']['Person']['properties']
+            second.model('Person', {'name': restplus.fields.String, 'age': restplus.fields.Integer})
+            assert 'age' in api.__schema__['definitions']['Person']['properties']
+
+
+class PartialSpecsTest(object):
+    def setup_api(self, api):
+        people = api.namespace('people', 'People')
+        pets = api.namespace('pets', 'Pets')
+        person = people.model('Person', {'name': restplus.fields.String(description='The name')})
+        pet = pets.model('Pet', {'name': restplus.fields.String(description='The name')})
+
+        @people.route('/')
+        class People(restplus.Resource):
+            @people.marshal_with(person, description='The people')
+            def get(self):
+                '''List people'''
+                pass
+
+        @pets.route('/')
+        class Pets(restplus.Resource):
+            @pets.marshal_with(pet)
+            def get(self):
+                pass
+
+    def test_specs_by_tag(self, api, client):
+        self.setup_api(api)
+
+        data = client.get_specs('', query_string={'tag': 'people'})
+        assert list(data['paths'].keys()) == ['/people/']
+        assert list(data['definitions'].keys()) == ['Person']
+        assert [tag['name'] for tag in data['tags']] == ['people']
+
+    def test_specs_by_multiple_tags(self, api, client):
+        self.setup_api(api)
+
+        data = client.get_specs('', query_string='tag=people&tag=pets')
+        assert sorted(data['paths'].keys()) == ['/people/', '/pets/']
+        assert sorted(data['definitions'].keys()) == ['Person', 'Pet']
+
+    def test_minimal_specs(self, api, client):
+        self.setup_api(api)
+
+        data = client.get_specs('', query_string={'minimal': 'true', 'tag': 'people'})
+        operation = data['paths']['/people/']['get']
+        assert 'description' not in operation
+        assert operation['responses']['200']['description'] == ''
+        assert data['definitions']['Person'] == {
+            'type': 'object',
+            'properties': {'name': {'type': 'string'}},
+        }
+
+    def test_invalid_minimal(self, api, client):
+        client.get_specs('', status=400, query_string={'minimal': 'maybe'})
+
+    def test_partial_specs_cached(self, app, api):
+        self.setup_api(api)
+
+        with app.test_request_context():
+            partial = api.get_schema(['people'], minimal=True)
+            assert api.get_schema(['people'], minimal=True) is partial
+            assert api.get_schema(['pets'], minimal=True) is not partial
+            assert api.get_schema() is api.__schema__
+
+            other = api.namespace('other')
+
+            @other.route('/')
+            class Other(restplus.Resource):
+                def get(self):
+                    pass
+
+            assert api.get_schema(['people'], minimal=True) is not partial
+
+
 class SwaggerDeprecatedTest(object):
     def test_doc_parser_parameters(self, api):
         parser = api.parser()
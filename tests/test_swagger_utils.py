@@ -1,7 +1,13 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-from flask_restplus.swagger import extract_path, extract_path_params, parse_docstring
+import inspect
+
+from flask_restplus import fields, Model
+from flask_restplus.swagger import (
+    extract_path, extract_path_params, parse_docstring, merge_doc, select_tags, minify
+)
+from flask_restplus.utils import merge
 
 
 class ExtractPathTest(object):
@@ -112,6 +118,23 @@ class ExtractPathParamsTestCase(object):
     #         }])
 
 
+class ExtractPathParamsCacheTest(object):
+    def test_extract_returns_copies(self):
+        path = '/test/<int:parameter>'
+        params = extract_path_params(path)
+        params['parameter']['type'] = 'mutated'
+        params['other'] = {}
+
+        assert extract_path_params(path) == {
+            'parameter': {
+                'name': 'parameter',
+                'type': 'integer',
+                'in': 'path',
+                'required': True
+            }
+        }
+
+
 class ParseDocstringTest(object):
     def test_empty(self):
         def without_doc():
@@ -192,3 +215,159 @@ class ParseDocstringTest(object):
         assert parsed['raises'] == {
             'SomeException': 'in case of something'
         }
+
+    def test_cached(self, mocker):
+        def func():
+            '''Some summary'''
+            pass
+
+        getdoc = mocker.patch('flask_restplus.swagger.getdoc', wraps=inspect.getdoc)
+
+        first = parse_docstring(func)
+        first['params'].append('mutated')
+        first['raises']['Mutated'] = 'mutated'
+        second = parse_docstring(func)
+
+        assert getdoc.call_count == 1
+        assert second['summary'] == 'Some summary'
+        assert second['params'] == []
+        assert second['raises'] == {}
+
+    def test_cache_follows_docstring_changes(self):
+        def func():
+            '''Some summary'''
+            pass
+
+        assert parse_docstring(func)['summary'] == 'Some summary'
+        func.__doc__ = 'Another summary'
+        assert parse_docstring(func)['summary'] == 'Another summary'
+
+
+class MergeDocTest(object):
+    def test_same_as_merge(self):
+        model = Model('Test', {'name': fields.String})
+        first = {'get': {'params': {'q': {'in': 'query'}}, 'responses': {200: ('OK', model)}}}
+        second = {'get': {'params': {'q': {'type': 'int'}, 'p': {}}}, 'expect': [model]}
+
+        assert merge_doc(first, second) == merge(first, second)
+
+    def test_copy_containers_and_share_models(self):
+        model = Model('Test', {'name': fields.String})
+        first = {'get': {'responses': {200: ('OK', model, {'headers': {}})}}}
+        second = {'expect': [model]}
+
+        merged = merge_doc(first, second)
+
+        response = merged['get']['responses'][200]
+        assert merged['get'] is not first['get']
+        assert response[2] is not first['get']['responses'][200][2]
+        assert response[1] is model
+        assert merged['expect'] is not second['expect']
+        assert merged['expect'][0] is model
+
+
+class SelectTagsTest(object):
+    specs = {
+        'swagger': '2.0',
+        'paths': {
+            '/people/': {
+                'get': {'tags': ['people'], 'responses': {'200': {'schema': {'$ref': '#/definitions/Person'}}}},
+            },
+            '/people/<id>': {
+                'parameters': [{'name': 'id', 'in': 'path'}],
+                'get': {'tags': ['people'], 'responses': {'404': {'$ref': '#/responses/NotFound'}}},
+                'delete': {'tags': ['admin']},
+            },
+            '/pets/': {
+                'get': {'tags': ['pets'], 'responses': {'200': {'schema': {'$ref': '#/definitions/Pet'}}}},
+            },
+        },
+        'tags': [{'name': 'people'}, {'name': 'pets'}, {'name': 'admin'}],
+        'definitions': {
+            'Person': {'properties': {'address': {'$ref': '#/definitions/Address%20Book'}}},
+            'Address Book': {'properties': {'city': {'type': 'string'}}},
+            'Pet': {'properties': {'name': {'type': 'string'}}},
+            'Error': {'properties': {'message': {'type': 'string'}}},
+        },
+        'responses': {
+            'NotFound': {'description': 'Not found', 'schema': {'$ref': '#/definitions/Error'}},
+        },
+    }
+
+    def test_select_tag(self):
+        specs = select_tags(self.specs, ['people'])
+        assert specs['swagger'] == '2.0'
+        assert list(specs['paths'].keys()) == ['/people/', '/people/<id>']
+        assert sorted(specs['paths']['/people/<id>'].keys()) == ['get', 'parameters']
+        assert specs['tags'] == [{'name': 'people'}]
+        assert sorted(specs['definitions'].keys()) == ['Address Book', 'Error', 'Person']
+        assert list(specs['responses'].keys()) == ['NotFound']
+
+    def test_select_multiple_tags(self):
+        specs = select_tags(self.specs, ['pets', 'admin'])
+        assert sorted(specs['paths'].keys()) == ['/people/<id>', '/pets/']
+        assert sorted(specs['paths']['/people/<id>'].keys()) == ['delete', 'parameters']
+        assert list(specs['definitions'].keys()) == ['Pet']
+        assert 'responses' not in specs
+
+    def test_select_unknown_tag(self):
+        specs = select_tags(self.specs, ['unknown'])
+        assert specs['paths'] == {}
+        assert specs['tags'] == []
+        assert 'definitions' not in specs
+
+    def test_full_specs_untouched(self):
+        select_tags(self.specs, ['pets'])
+        assert len(self.specs['paths']) == 3
+        assert len(self.specs['definitions']) == 4
+
+
+class MinifyTest(object):
+    def test_strip_descriptions_and_examples(self):
+        specs = {
+            'info': {'title': 'API', 'description': 'An API'},
+            'tags': [{'name': 'ns', 'description': 'A namespace'}],
+            'paths': {
+                '/': {
+                    'get': {
+                        'summary': 'Get',
+                        'description': 'Get something',
+                        'parameters': [{'name': 'q', 'in': 'query', 'description': 'Query'}],
+                        'responses': {
+                            '200': {'description': 'Success', 'examples': {'application/json': {}}},
+                            '404': {'$ref': '#/responses/NotFound'},
+                        },
+                    },
+                },
+            },
+            'definitions': {
+                'Item': {
+                    'description': 'An item',
+                    'properties': {
+                        'description': {'type': 'string', 'description': 'The item description'},
+                        'kind': {'type': 'string', 'example': 'book', 'enum': ['book', 'pen']},
+                        'meta': {'type': 'object', 'default': {'description': 'none'}},
+                    },
+                },
+            },
+        }
+        minimal = minify(specs)
+
+        assert minimal['info'] == {'title': 'API'}
+        assert minimal['tags'] == [{'name': 'ns'}]
+        operation = minimal['paths']['/']['get']
+        assert operation['summary'] == 'Get'
+        assert 'description' not in operation
+        assert operation['parameters'] == [{'name': 'q', 'in': 'query'}]
+        assert operation['responses'] == {
+            '200': {'description': ''},
+            '404': {'$ref': '#/responses/NotFound'},
+        }
+        assert minimal['definitions']['Item'] == {
+            'properties': {
+                'description': {'type': 'string'},
+                'kind': {'type': 'string', 'enum': ['book', 'pen']},
+                'meta': {'type': 'object', 'default': {'description': 'none'}},
+            },
+        }
+        assert specs['info']['description'] == 'An API'
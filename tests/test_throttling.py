@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from flask_restplus import throttling
+from flask_restplus.throttling import TokenBucket, LogThrottle
+
+
+class TokenBucketTest(object):
+    def test_burst_then_rate(self, mocker):
+        now = mocker.patch.object(throttling, 'clock', return_value=100.0)
+        bucket = TokenBucket(2, capacity=3)
+
+        assert [bucket.consume() for _ in range(4)] == [True, True, True, False]
+
+        now.return_value = 100.5
+        assert [bucket.consume() for _ in range(2)] == [True, False]
+
+        now.return_value = 200
+        assert [bucket.consume() for _ in range(4)] == [True, True, True, False]
+
+    def test_default_capacity(self):
+        assert TokenBucket(5).capacity == 5
+        assert TokenBucket(0.1).capacity == 1
+
+
+class LogThrottleTest(object):
+    def test_no_limit(self):
+        throttle = LogThrottle()
+        assert [throttle.allow(ValueError) for _ in range(3)] == [(True, 0)] * 3
+
+    def test_rate_limit_per_key(self, mocker):
+        now = mocker.patch.object(throttling, 'clock', return_value=100.0)
+        throttle = LogThrottle(rate=1)
+
+        assert throttle.allow(ValueError) == (True, 0)
+        assert throttle.allow(ValueError) == (False, 0)
+        assert throttle.allow(ValueError) == (False, 0)
+        assert throttle.allow(KeyError) == (True, 0)
+
+        now.return_value = 101.0
+        assert throttle.allow(ValueError) == (True, 2)
+        assert throttle.stats == {
+            ValueError: {'logged': 2, 'suppressed': 2},
+            KeyError: {'logged': 1, 'suppressed': 0},
+        }
+
+    def test_sampling(self, mocker):
+        mocker.patch('random.random', side_effect=[0.05, 0.5, 0.9, 0.01])
+        throttle = LogThrottle(sample_rate=0.1)
+
+        assert [throttle.allow(ValueError) for _ in range(4)] == [(True, 0), (False, 0), (False, 0), (True, 2)]
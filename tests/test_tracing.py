@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import re
+
+import flask_restplus as restplus
+
+from flask_restplus import fields
+from flask_restplus.tracing import Tracer, OpenTelemetryTracer, server_timing
+
+
+class RecordingTracer(Tracer):
+    def __init__(self):
+        self.events = []
+
+    def start(self, endpoint, method, phase):
+        self.events.append(('start', endpoint, method, phase))
+        return phase
+
+    def end(self, span, error=None):
+        self.events.append(('end', span, type(error).__name__ if error else None))
+
+
+class FakeSpanManager(object):
+    def __init__(self, tracer, name, attributes):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self):
+        self.tracer.stack.append(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.tracer.ended.append((self.tracer.stack.pop(), exc_type))
+
+
+class FakeOpenTelemetryTracer(object):
+    def __init__(self):
+        self.stack = []
+        self.started = []
+        self.ended = []
+
+    def start_as_current_span(self, name, attributes=None):
+        self.started.append((name, attributes, list(self.stack)))
+        return FakeSpanManager(self, name, attributes)
+
+
+class ServerTimingTest(object):
+    def test_format(self):
+        assert server_timing([('parse', 0.0012), ('handler', 0.5)]) == 'parse;dur=1.200, handler;dur=500.000'
+
+    def test_header(self, app, client):
+        api = restplus.Api(app, server_timing=True)
+        model = api.model('Model', {'name': fields.String})
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            @api.marshal_with(model)
+            def get(self):
+                return {'name': 'value'}
+
+        response = client.get('/test/')
+
+        phases = re.findall(r'(\w+);dur=\d+\.\d{3}', response.headers['Server-Timing'])
+        assert phases == ['marshal', 'handler', 'serialize']
+
+    def test_header_on_error(self, app, client):
+        api = restplus.Api(app, server_timing=True)
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            def get(self):
+                api.abort(400)
+
+        response = client.get('/test/')
+
+        assert response.status_code == 400
+        phases = re.findall(r'(\w+);dur=', response.headers['Server-Timing'])
+        assert phases == ['handler', 'serialize', 'error']
+
+    def test_disabled_by_default(self, app, client):
+        api = restplus.Api(app)
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            def get(self):
+                return {}
+
+        assert 'Server-Timing' not in client.get('/test/').headers
+        assert not api.instrumented
+
+
+class TracerTest(object):
+    def test_spans(self, app, client):
+        tracer = RecordingTracer()
+        api = restplus.Api(app, tracer=tracer)
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            def get(self):
+                return {}
+
+        client.get('/test/')
+
+        assert tracer.events == [
+            ('start', 'test', 'GET', 'handler'),
+            ('end', 'handler', None),
+            ('start', 'test', 'GET', 'serialize'),
+            ('end', 'serialize', None),
+        ]
+        assert 'Server-Timing' not in client.get('/test/').headers
+
+    def test_spans_with_error(self, app, client):
+        tracer = RecordingTracer()
+        api = restplus.Api(app, tracer=tracer)
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            def get(self):
+                raise ValueError()
+
+        client.get('/test/')
+
+        assert tracer.events[:2] == [
+            ('start', 'test', 'GET', 'handler'),
+            ('end', 'handler', 'ValueError'),
+        ]
+        assert ('start', 'test', 'GET', 'error') in tracer.events
+
+
+class OpenTelemetryTracerTest(object):
+    def test_nested_spans(self, app, client):
+        otel = FakeOpenTelemetryTracer()
+        api = restplus.Api(app, tracer=OpenTelemetryTracer(otel))
+        model = api.model('Model', {'name': fields.String})
+
+        @api.route('/test/', endpoint='test')
+        class TestResource(restplus.Resource):
+            @api.marshal_with(model)
+            def post(self):
+                return {'name': 'value'}
+
+        client.post('/test/')
+
+        assert otel.started[0] == ('restplus.handler', {
+            'restplus.endpoint': 'test',
+            'restplus.phase': 'handler',
+            'http.method': 'POST',
+        }, [])
+        assert otel.started[1][0] == 'restplus.marshal'
+        assert otel.started[1][2] == ['restplus.handler']
+        assert otel.ended == [
+            ('restplus.marshal', None),
+            ('restplus.handler', None),
+            ('restplus.serialize', None),
+        ]
+
+    def test_errors_are_forwarded(self):
+        otel = FakeOpenTelemetryTracer()
+        tracer = OpenTelemetryTracer(otel, prefix='')
+
+        span = tracer.start('endpoint', 'GET', 'handler')
+        tracer.end(span, ValueError())
+
+        assert otel.ended == [('handler', ValueError)]
@@ -121,3 +121,34 @@ class UnpackTest(object):
     def test_too_many_values(self):
         with pytest.raises(ValueError):
             utils.unpack((None, None, None, None))
+
+
+class LRUCacheTest(object):
+    def test_get_set(self):
+        cache = utils.LRUCache()
+        cache.set('key', 'value')
+        assert cache.get('key') == 'value'
+        assert 'key' in cache
+        assert len(cache) == 1
+
+    def test_miss_default(self):
+        cache = utils.LRUCache()
+        assert cache.get('missing') is None
+        assert cache.get('missing', 'default') == 'default'
+
+    def test_evict_least_recently_used(self):
+        cache = utils.LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        assert len(cache) == 2
+
+    def test_clear(self):
+        cache = utils.LRUCache()
+        cache.set('a', 1)
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import gc
+
+import pytest
+
+from flask import Blueprint
+from flask.views import MethodView
+
+import flask_restplus as restplus
+
+from flask_restplus import schemas
+
+
+def setup_api(api):
+    model = api.model('Person', {'name': restplus.fields.String})
+
+    @api.route('/people/', endpoint='people')
+    class People(restplus.Resource):
+        @api.marshal_with(model)
+        def get(self):
+            return {}
+
+        def post(self):
+            return {}
+
+    return model, People
+
+
+class WarmupTest(object):
+    def test_warmup(self, app):
+        api = restplus.Api(app)
+        model, resource = setup_api(api)
+
+        steps = api.warmup()
+
+        assert [s.name for s in steps] == [
+            'dispatch_plans', 'models', 'suggestions', 'specs', 'refresolver', 'validators', 'oas_schema'
+        ]
+        built = dict((s.name, s.built) for s in steps)
+        assert built['dispatch_plans'] == 2
+        assert built['models'] == 1
+        assert built['specs'] == 1
+        assert built['validators'] == 1
+        assert all(s.seconds >= 0 for s in steps)
+
+        assert sorted(resource.__dict__['_dispatch_plans'].keys()) == ['get', 'post']
+        assert 'resolved' in model.__dict__
+        assert api._schema is not None
+        assert api._refresolver is not None
+        assert '_validators' in model.__dict__
+        assert schemas.OAS_20._schema is not None
+
+    def test_warmup_with_method_view(self, app):
+        api = restplus.Api(app)
+        setup_api(api)
+
+        class Items(MethodView):
+            def get(self):
+                return {}
+
+        api.add_resource(Items, '/items/')
+
+        steps = api.warmup()
+
+        assert dict((s.name, s.built) for s in steps)['dispatch_plans'] == 2
+        assert '/items/' in api._schema['paths']
+
+    def test_warmup_specs_reused(self, app, client):
+        api = restplus.Api(app)
+        setup_api(api)
+        api.warmup()
+        schema = api._schema
+
+        client.get_specs()
+
+        assert api._schema is schema
+
+    def test_warmup_lazy_views(self, app):
+        api = restplus.Api(app, lazy_views=True)
+        setup_api(api)
+
+        steps = api.warmup()
+
+        assert [s.name for s in steps][:2] == ['dispatch_plans', 'views']
+        assert dict((s.name, s.built) for s in steps)['views'] == 2  # specs and people
+        assert app.view_functions['people'].built
+
+    def test_warmup_without_suggestions(self, app):
+        app.config['ERROR_404_HELP'] = False
+        api = restplus.Api(app)
+
+        steps = api.warmup()
+
+        assert 'suggestions' not in [s.name for s in steps]
+
+    def test_warmup_with_blueprint(self, app):
+        blueprint = Blueprint('api', __name__, url_prefix='/api')
+        api = restplus.Api(blueprint)
+        setup_api(api)
+        app.register_blueprint(blueprint)
+
+        steps = api.warmup()
+
+        assert dict((s.name, s.built) for s in steps)['specs'] == 1
+        assert '/people/' in api._schema['paths']
+
+    def test_warmup_unregistered(self):
+        api = restplus.Api()
+
+        with pytest.raises(ValueError):
+            api.warmup()
+
+    @pytest.mark.skipif(not hasattr(gc, 'freeze'), reason='gc.freeze requires Python 3.7+')
+    def test_warmup_freeze(self, app, mocker):
+        freeze = mocker.patch('gc.freeze')
+        api = restplus.Api(app)
+
+        steps = api.warmup(freeze=True)
+
+        assert freeze.called
+        assert steps[-1].name == 'gc_freeze'